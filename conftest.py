@@ -8,9 +8,7 @@ import os
 import os.path
 import pathlib
 import re
-import shlex
 import shutil
-import traceback
 from typing import Any
 
 import pytest
@@ -20,9 +18,9 @@ from _pytest.nodes import Collector, Node
 from _pytest.reports import CollectReport, TestReport
 from _pytest.runner import CallInfo
 from kubernetes.dynamic.exceptions import ConflictError
+from ocp_resources.exceptions import ResourceTeardownError
 from ocp_resources.network_config_openshift_io import Network
 from packaging.version import Version
-from pyhelper_utils.shell import run_command
 from pytest import Item
 from pytest_testconfig import config as py_config
 
@@ -31,30 +29,49 @@ import utilities.cluster
 # TODO: Remove this import when utilities modules are refactored...
 import utilities.infra  # noqa
 from libs.storage.config import StorageClassConfig
+from utilities.api_accounting import (
+    API_CALL_RECORDER,
+    end_fixture_api_calls_teardown,
+    fixture_api_calls_scope,
+    write_api_calls_report,
+)
 from utilities.bitwarden import get_cnv_tests_secret_by_name
+from utilities.cluster_lock import (
+    CLUSTER_LOCK_EXCLUSIVE,
+    CLUSTER_LOCK_MODES,
+    CLUSTER_LOCK_RESOURCES,
+    CLUSTER_LOCK_SHARED,
+    parse_mutated_resources,
+)
 from utilities.constants.architecture import AMD_64
 from utilities.constants.namespaces import NamespacesNames
 from utilities.constants.pytest import (
     QUARANTINED,
     SETUP_ERROR,
 )
-from utilities.constants.timeouts import TIMEOUT_5MIN
+from utilities.constants.timeouts import TIMEOUT_1MIN, TIMEOUT_5MIN
 from utilities.data_collector import (
-    collect_default_cnv_must_gather_with_vm_gather,
     get_data_collector_dir,
     get_scope_identifier,
     set_data_collector_directory,
     set_data_collector_values,
 )
-from utilities.database import Database
+from utilities.database import get_database
+from utilities.durations_history import DEFAULT_CLUSTER_PROFILE, register_durations_history_plugin
+from utilities.dv_source_cache import DV_SOURCE_CACHE
+from utilities.events_recorder import EVENTS_RECORDER
 from utilities.exceptions import MissingEnvironmentVariableError, StorageSanityError
+from utilities.failure_snapshot import FAILURE_SNAPSHOT
+from utilities.fixture_profiler import FIXTURE_PROFILER
 from utilities.junit_ai_utils import enrich_junit_xml, setup_ai_analysis
 from utilities.logger import setup_logging
+from utilities.must_gather_collector import MUST_GATHER_COLLECTOR
+from utilities.parallel import ParallelWorkerPlugin, get_worker_id, get_worker_path
 from utilities.pytest_utils import (
     _inject_failure_junit,
+    acquire_cluster_lock,
     assert_incremental_classes_fully_collected,
     config_default_storage_class,
-    deploy_run_in_progress_config_map,
     deploy_run_in_progress_namespace,
     filter_hpp_tests,
     filter_multiarch_tests,
@@ -66,14 +83,14 @@ from utilities.pytest_utils import (
     mark_nmstate_dependent_tests,
     remove_tests_from_list,
     reorder_early_fixtures,
-    run_in_progress_config_map,
     separator,
     skip_if_pytest_flags_exists,
-    stop_if_run_in_progress,
     update_cpu_arch_related_config,
     update_latest_os_config,
     validate_collected_tests_arch_params,
 )
+from utilities.reaper import wait_for_teardown_reaper
+from utilities.ssh_pool import close_all_ssh_sessions
 
 pytest_plugins = [
     "tests.fixtures.cluster.auth",
@@ -103,6 +120,7 @@ pytest_plugins = [
     "tests.fixtures.storage.storage_classes",
     "tests.fixtures.images.golden_images",
     "tests.fixtures.storage.data_volumes",
+    "tests.fixtures.virt.vm_pool",
 ]
 
 LOGGER = logging.getLogger(__name__)
@@ -147,7 +165,6 @@ MUST_GATHER_IGNORE_EXCEPTION_LIST = [
     StorageSanityError,
     ConflictError,
 ]
-INSPECT_BASE_COMMAND = "oc adm inspect"
 
 
 def pytest_addoption(parser):
@@ -165,6 +182,8 @@ def pytest_addoption(parser):
     ci_group = parser.getgroup(name="CI")
     component_sanity_group = parser.getgroup(name="ComponentSanity")
     ai_insights_group = parser.getgroup(name="ai-job-insight")
+    profiling_group = parser.getgroup(name="Profiling")
+    durations_group = parser.getgroup(name="Durations")
 
     # Upgrade addoption
     install_upgrade_group.addoption(
@@ -266,6 +285,15 @@ def pytest_addoption(parser):
         "--default-storage-class",
         help="Overwrite default storage class in storage_class_matrix",
     )
+    storage_group.addoption(
+        "--dv-source-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Import each artifactory image requested by create_dv once per storage class, volume mode, access mode and "
+            "size, and clone it for the other DataVolumes. Not for the CDI import tests"
+        ),
+    )
     storage_group.addoption(
         "--conformance-storage-class",
         help="""
@@ -319,6 +347,23 @@ def pytest_addoption(parser):
         "--data-collector-output-dir",
         help="Must-gather/alert output dir if `--data-collector` is set and will overwrite `CNV_TESTS_CONTAINER` env.",
     )
+    data_collector_group.addoption(
+        "--must-gather-on-failure",
+        help=(
+            "If a CNV must-gather should be collected on failure, in addition to the failure snapshot of the test "
+            "resources. Requires `--data-collector`"
+        ),
+        action="store_true",
+    )
+    data_collector_group.addoption(
+        "--must-gather-coalesce-window",
+        type=int,
+        default=TIMEOUT_1MIN,
+        help=(
+            "Seconds to wait after a failure before collecting its must-gather in the background. "
+            "Failures within the window are collected together in one must-gather"
+        ),
+    )
     data_collector_group.addoption(
         "--pytest-log-file",
         help="Path to pytest log file",
@@ -360,6 +405,31 @@ def pytest_addoption(parser):
         help="Skip artifactory environment variable checks. To be used for tests that does not need articatory access",
     )
 
+    session_group.addoption(
+        "--cluster-lock-mode",
+        choices=CLUSTER_LOCK_MODES,
+        default=CLUSTER_LOCK_EXCLUSIVE,
+        help=(
+            "Cluster lock taken by the session. An exclusive session runs alone on the cluster; "
+            "shared sessions run together when they do not mutate the same --cluster-lock-mutates resources"
+        ),
+    )
+    session_group.addoption(
+        "--cluster-lock-mutates",
+        help=(
+            "Comma-separated cluster-scoped resources mutated by a shared session: "
+            f"{', '.join(CLUSTER_LOCK_RESOURCES)}. Not set for read-only sessions"
+        ),
+    )
+    session_group.addoption(
+        "--fedora-vm-pool-size",
+        type=int,
+        default=0,
+        help=(
+            "Number of Fedora VMs booted in the background and leased to the tests using the pooled_fedora_vm fixture. "
+            "With 0, every lease boots a new VM"
+        ),
+    )
     session_group.addoption(
         "--remote_cluster_host",
         help="Host address of the remote cluster for cross-cluster tests",
@@ -418,6 +488,46 @@ def pytest_addoption(parser):
         help="Enrich JUnit XML with AI-powered analysis from jenkins-job-insight. `JJI_SERVER_URL` env var is required",
     )
 
+    # Profiling
+    profiling_group.addoption(
+        "--api-calls-report",
+        help=(
+            "Count the Kubernetes API calls of each test, by verb, resource and fixture, with their latency. "
+            "The JSON report is written to this path and the per-test totals are added to the JUnit XML properties"
+        ),
+    )
+    profiling_group.addoption(
+        "--fixtures-profile-dir",
+        help=(
+            "Record the setup and teardown time of every fixture. "
+            "A report sorted by total time and a folded-stack file for flamegraph tools are written to this directory"
+        ),
+    )
+
+    # Durations
+    durations_group.addoption(
+        "--durations-history-db",
+        help="SQLite database, kept across runs, to record the tests durations in and read expected durations from",
+    )
+    durations_group.addoption(
+        "--durations-cluster-profile",
+        default=DEFAULT_CLUSTER_PROFILE,
+        help="Cluster profile the durations are recorded for; expected durations prefer runs on the same profile",
+    )
+    durations_group.addoption(
+        "--durations-order",
+        action="store_true",
+        default=False,
+        help="Run the test modules from the longest to the shortest expected duration",
+    )
+    durations_group.addoption(
+        "--durations-shard",
+        help=(
+            "Run only shard <index>/<count> of the tests, with test modules split by expected duration. "
+            "All shards must use the same --durations-history-db"
+        ),
+    )
+
 
 def pytest_cmdline_main(config):
     # TODO: Reduce cognitive complexity
@@ -446,11 +556,25 @@ def pytest_cmdline_main(config):
                 f" Provided images: {eus_ocp_images}"
             )
 
+    # --numprocesses is added by pytest-xdist
+    if getattr(config.option, "numprocesses", None) and config.option.dist != "loadfile":
+        raise ValueError("Parallel runs (-n) require `--dist loadfile`, so each test module runs on a single worker")
+
+    if config.getoption("cluster_lock_mutates"):
+        if config.getoption("cluster_lock_mode") != CLUSTER_LOCK_SHARED:
+            raise ValueError("`--cluster-lock-mutates` requires `--cluster-lock-mode shared`")
+        parse_mutated_resources(mutated_resources=config.getoption("cluster_lock_mutates"))
+
     if config.getoption("data_collector_output_dir") and not config.getoption("data_collector"):
         raise ValueError(
             "Data will not be collected because `--data-collector-output-dir` is set without `--data-collector`"
         )
 
+    if config.getoption("must_gather_on_failure") and not config.getoption("data_collector"):
+        raise ValueError(
+            "Must-gather will not be collected because `--must-gather-on-failure` is set without `--data-collector`"
+        )
+
     # Default value is set as this value is used to set test name in
     # tests.upgrade_params.UPGRADE_TEST_DEPENDENCY_NODE_ID which is needed for pytest dependency marker
     py_config["upgraded_product"] = upgrade_option or config.getoption("--upgrade_custom") or "cnv"
@@ -609,6 +733,11 @@ def pytest_configure(config):
 
         py_config["default_storage_class"] = conformance_storage_class
 
+    register_durations_history_plugin(config=config)
+
+    if get_worker_id():
+        config.pluginmanager.register(plugin=ParallelWorkerPlugin(), name="parallel_worker")
+
 
 def pytest_collection_modifyitems(session, config, items):
     """
@@ -718,6 +847,10 @@ def pytest_runtest_makereport(item, call):
             parent._previousfailed = {}
         parent._previousfailed[param_key] = item
 
+    if call.when == "teardown" and API_CALL_RECORDER.enabled:
+        api_calls, api_calls_seconds = API_CALL_RECORDER.test_summary(test_name=item.nodeid)
+        item.user_properties.extend([("api_calls", api_calls), ("api_calls_seconds", api_calls_seconds)])
+
     outcome = yield
     report = outcome.get_result()
 
@@ -748,20 +881,32 @@ def pytest_runtest_makereport(item, call):
                     setattr(report, SETUP_ERROR, message)
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_fixture_setup(fixturedef, request):
     LOGGER.info(f"Executing {fixturedef.scope} fixture: {fixturedef.argname}")
+    with (
+        fixture_api_calls_scope(fixturedef=fixturedef),
+        FIXTURE_PROFILER.profile_setup(fixturedef=fixturedef),
+    ):
+        yield
+
+
+def pytest_fixture_post_finalizer(fixturedef, request):
+    FIXTURE_PROFILER.end_teardown(fixturedef=fixturedef)
+    end_fixture_api_calls_teardown()
 
 
 def pytest_runtest_setup(item):
     """
     Use incremental
     """
+    API_CALL_RECORDER.current_test = FIXTURE_PROFILER.current_test = EVENTS_RECORDER.current_test = item.nodeid
     # set the data collector directory irrespective of --data-collector. This is to enable collecting pexcpect logs
     set_data_collector_directory(item=item, directory_path=get_data_collector_dir())
     if item.config.getoption("--data-collector"):
         # before the setup work starts, insert current epoch time into the database
         try:
-            db = Database(base_dir=item.config.getoption("--data-collector-output-dir"))
+            db = get_database(base_dir=item.config.getoption("--data-collector-output-dir"))
             scope_marker = item.get_closest_marker(name="data_collector_scope")
             scope_value = scope_marker.kwargs.get("scope") if scope_marker else None
 
@@ -782,10 +927,16 @@ def pytest_runtest_call(item):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
 
 
-def pytest_runtest_teardown(item):
+def pytest_runtest_teardown(item, nextitem):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='TEARDOWN')}")
     # reset data collector after each tests
     py_config["data_collector"]["collector_directory"] = py_config["data_collector"]["data_collector_base_directory"]
+    # start times are written in batches, at the end of each test class/module
+    if item.config.getoption("--data-collector") and (nextitem is None or nextitem.parent is not item.parent):
+        try:
+            get_database(base_dir=item.config.getoption("--data-collector-output-dir")).flush()
+        except Exception as db_exception:
+            LOGGER.error(f"[DATA_COLLECTOR] Database error: {db_exception}. Must-gather collection may not be accurate")
 
 
 def pytest_generate_tests(metafunc):
@@ -816,13 +967,22 @@ def pytest_generate_tests(metafunc):
 
 
 def pytest_sessionstart(session):
+    API_CALL_RECORDER.enabled = bool(session.config.getoption("api_calls_report"))
+    FIXTURE_PROFILER.enabled = bool(session.config.getoption("fixtures_profile_dir"))
+    FAILURE_SNAPSHOT.enabled = bool(session.config.getoption("data_collector"))
+    DV_SOURCE_CACHE.enabled = session.config.getoption("dv_source_cache")
+    MUST_GATHER_COLLECTOR.coalesce_window = session.config.getoption("must_gather_coalesce_window")
     data_collector_dict = set_data_collector_values(base_dir=session.config.getoption("data_collector_output_dir"))
-    shutil.rmtree(
-        data_collector_dict["data_collector_base_directory"],
-        ignore_errors=True,
-    )
+    if session.config.getoption("data_collector"):
+        EVENTS_RECORDER.output_dir = os.path.join(data_collector_dict["data_collector_base_directory"], "events")
+    # In parallel runs, the controller session starts before the workers
+    if not get_worker_id():
+        shutil.rmtree(
+            data_collector_dict["data_collector_base_directory"],
+            ignore_errors=True,
+        )
 
-    tests_log_file = session.config.getoption("pytest_log_file")
+    tests_log_file = get_worker_path(path=session.config.getoption("pytest_log_file"))
     if os.path.exists(tests_log_file):
         pathlib.Path(tests_log_file).unlink()
 
@@ -875,9 +1035,10 @@ def pytest_sessionstart(session):
             py_config["os_login_param"] = get_cnv_tests_secret_by_name(secret_name="os_login", session=session)
 
         # must be at the end to make sure we create it only after all pytest_sessionstart checks pass.
-        stop_if_run_in_progress(client=admin_client)
-        deploy_run_in_progress_namespace(client=admin_client)
-        deploy_run_in_progress_config_map(client=admin_client, session=session)
+        # In parallel runs, the controller holds the run in progress for its workers.
+        if not get_worker_id():
+            deploy_run_in_progress_namespace(client=admin_client)
+            session.config.option.cluster_lock = acquire_cluster_lock(client=admin_client, session=session)
 
     # Set up AI analysis if --analyze-with-ai is passed.
     # Source: https://github.com/myk-org/jenkins-job-insight/blob/main/examples/pytest-junitxml/conftest_junit_ai.py
@@ -896,18 +1057,31 @@ def pytest_collection_finish(session):
 def pytest_sessionfinish(session, exitstatus):
     try:
         shutil.rmtree(path=session.config.option.basetemp, ignore_errors=True)
-        if not skip_if_pytest_flags_exists(pytest_config=session.config):
-            admin_client = utilities.cluster.cache_admin_client()
-            run_in_progress_config_map(client=admin_client).clean_up()
-            deploy_run_in_progress_namespace(client=admin_client).clean_up()
+        close_all_ssh_sessions()
+        teardown_error = None
+        try:
+            wait_for_teardown_reaper()
+        except ResourceTeardownError as error:
+            # Raised after the rest of the session cleanup
+            LOGGER.error(f"Resources not deleted by the teardown reaper: {error}")
+            teardown_error = error
+        MUST_GATHER_COLLECTOR.wait()
+        EVENTS_RECORDER.stop_all()
+        DV_SOURCE_CACHE.clean_up()
+        if api_calls_report := session.config.getoption("api_calls_report"):
+            write_api_calls_report(report_path=get_worker_path(path=api_calls_report))
+        if fixtures_profile_dir := session.config.getoption("fixtures_profile_dir"):
+            FIXTURE_PROFILER.write_report(report_dir=get_worker_path(path=fixtures_profile_dir))
 
         reporter = session.config.pluginmanager.get_plugin("terminalreporter")
         reporter.summary_stats()
         if session.config.getoption("--data-collector"):
-            db = Database(base_dir=session.config.getoption("--data-collector-output-dir"))
-            file_path = db.database_file_path
-            LOGGER.info(f"Removing database file path {file_path}")
-            os.remove(file_path)
+            db = get_database(base_dir=session.config.getoption("--data-collector-output-dir"))
+            db.close()
+            if not get_worker_id():
+                file_path = db.database_file_path
+                LOGGER.info(f"Removing database file path {file_path}")
+                os.remove(file_path)
         # clean up the empty folders
         collector_directory = py_config["data_collector"]["data_collector_base_directory"]
         if os.path.exists(collector_directory):
@@ -928,12 +1102,23 @@ def pytest_sessionfinish(session, exitstatus):
                     enrich_junit_xml(session)
                 except Exception:
                     LOGGER.exception("Failed to enrich JUnit XML, original preserved")
+
+        if teardown_error:
+            raise teardown_error
     finally:
         try:
             _inject_failure_junit(session=session)
         except Exception:
             LOGGER.exception("Failed to inject failure into JUnit XML")
 
+        # Released even if the session cleanup failed, so other sessions do not wait for the Lease to go stale.
+        # Not set when the session exits before taking the lock, the namespace is kept for concurrent sessions
+        if cluster_lock := getattr(session.config.option, "cluster_lock", None):
+            try:
+                cluster_lock.release()
+            except Exception:
+                LOGGER.exception("Failed to release the cluster lock")
+
         session.config.option.log_listener.stop()
 
 
@@ -984,39 +1169,27 @@ def pytest_exception_interact(node: Item | Collector, call: CallInfo[Any], repor
     BASIC_LOGGER.error(report.longreprtext)
     if node.config.getoption("--data-collector") and not is_skip_must_gather(node=node):
         test_name = f"{node.fspath}::{node.name}"
-        LOGGER.info(f"[DATA_COLLECTOR] Must-gather collection is enabled for {test_name}.")
+        LOGGER.info(f"[DATA_COLLECTOR] Data collection is enabled for {test_name}.")
         if call.excinfo and any([
             isinstance(call.excinfo.value, exception_type) for exception_type in MUST_GATHER_IGNORE_EXCEPTION_LIST
         ]):
-            LOGGER.warning(
-                f"[DATA_COLLECTOR] Must-gather collection would be skipped for exception: {call.excinfo.type}"
-            )
+            LOGGER.warning(f"[DATA_COLLECTOR] Data collection would be skipped for exception: {call.excinfo.type}")
         else:
-            db = Database(base_dir=node.config.getoption("--data-collector-output-dir"))
-            test_start_time = db.get_start_time_for_collection(node=node)
+            collection_dir = os.path.join(get_data_collector_dir(), "pytest_exception_interact")
+            FAILURE_SNAPSHOT.collect(target_dir=os.path.join(collection_dir, "failure_snapshot"))
 
-            try:
-                collection_dir = os.path.join(get_data_collector_dir(), "pytest_exception_interact")
-                collect_default_cnv_must_gather_with_vm_gather(
+            if node.config.getoption("--must-gather-on-failure"):
+                db = get_database(base_dir=node.config.getoption("--data-collector-output-dir"))
+                test_start_time = db.get_start_time_for_collection(node=node)
+
+                inspect_str = get_inspect_command_namespace_string(test_name=test_name, node=node)
+                MUST_GATHER_COLLECTOR.request(
+                    admin_client=utilities.cluster.cache_admin_client(),
+                    test_name=test_name,
                     since_time=calculate_must_gather_timer(test_start_time=test_start_time),
                     target_dir=collection_dir,
-                    admin_client=utilities.cluster.cache_admin_client(),
+                    inspect_resources=inspect_str.split(),
                 )
-                if inspect_str := get_inspect_command_namespace_string(test_name=test_name, node=node):
-                    target_dir = os.path.join(collection_dir, "inspect_collection")
-                    inspect_command = (
-                        f"{INSPECT_BASE_COMMAND} {inspect_str} "
-                        f"--since={calculate_must_gather_timer(test_start_time=test_start_time)}s "
-                        f"--dest-dir={target_dir}"
-                    )
-                    LOGGER.info(f"running inspect command on {inspect_command}")
-                    run_command(
-                        command=shlex.split(inspect_command),
-                        check=False,
-                        verify_stderr=False,
-                    )
-            except Exception as current_exception:
-                LOGGER.warning(f"Failed to collect logs: {test_name}: {current_exception} {traceback.format_exc()}")
 
 
 @pytest.hookimpl(optionalhook=True)
@@ -29,13 +29,14 @@ from libs.vm.spec import (
 from tests.network.libs import cloudinit
 from utilities import infra
 from utilities.constants.virt import CLOUD_INIT_DISK_NAME
+from utilities.informer import CachedVirtualMachineInstance, InformerCachedInstanceMixin
 from utilities.virt import get_oc_image_info, vm_console_run_commands
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
 
 
-class BaseVirtualMachine(VirtualMachine):
+class BaseVirtualMachine(InformerCachedInstanceMixin, VirtualMachine):
     """
     Virtual Machine object.
     """
@@ -82,6 +83,12 @@ class BaseVirtualMachine(VirtualMachine):
     ) -> dict[str, list[str]]:
         return vm_console_run_commands(vm=self, commands=commands, timeout=timeout)
 
+    @property
+    def vmi(self) -> CachedVirtualMachineInstance:
+        return CachedVirtualMachineInstance(  # type: ignore[no-untyped-call]
+            client=self.client, name=self.name, namespace=self.namespace
+        )
+
     def wait_for_agent_connected(self) -> None:
         self.vmi.wait_for_condition(
             condition=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED,
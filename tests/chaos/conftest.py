@@ -51,7 +51,7 @@ LOGGER = logging.getLogger(__name__)
 
 @pytest.fixture(scope="module")
 def chaos_namespace(admin_client):
-    yield from create_ns(admin_client=admin_client, name=NamespacesNames.CHAOS)
+    yield from create_ns(admin_client=admin_client, name=NamespacesNames.CHAOS, worker_suffix=False)
 
 
 @pytest.fixture()
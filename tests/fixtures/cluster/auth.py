@@ -14,6 +14,7 @@ from ocp_resources.secret import Secret
 from pytest_testconfig import config as py_config
 from timeout_sampler import TimeoutSampler
 
+from utilities.api_accounting import instrument_client
 from utilities.cluster import cache_admin_client, get_oc_whoami_username
 from utilities.constants.cluster import KUBECONFIG
 from utilities.constants.components import CLUSTER
@@ -22,6 +23,7 @@ from utilities.constants.pytest import UNPRIVILEGED_PASSWORD, UNPRIVILEGED_USER
 from utilities.constants.timeouts import TIMEOUT_4MIN
 from utilities.data_utils import base64_encode_str
 from utilities.infra import get_deployment_by_name, login_with_user_password
+from utilities.parallel import SessionResourceLeader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -109,19 +111,27 @@ def unprivileged_secret(admin_client, skip_unprivileged_client):
         yield
 
     else:
-        password = UNPRIVILEGED_PASSWORD.encode()
-        enc_password = bcrypt.hashpw(password, bcrypt.gensalt(5, prefix=b"2a")).decode()
-        crypto_credentials = f"{UNPRIVILEGED_USER}:{enc_password}"
-        with Secret(
-            name=HTTP_SECRET_NAME,
-            namespace=NamespacesNames.OPENSHIFT_CONFIG,
-            htpasswd=base64_encode_str(text=crypto_credentials),
-            client=admin_client,
-        ) as secret:
-            yield secret
-
-        #  Wait for oauth-openshift deployment to update after removing htpass-secret
-        _wait_for_oauth_openshift_deployment(admin_client=admin_client)
+        with SessionResourceLeader(name=HTTP_SECRET_NAME) as leader:
+            if not leader.is_leader:
+                leader.wait_ready()
+                yield Secret(name=HTTP_SECRET_NAME, namespace=NamespacesNames.OPENSHIFT_CONFIG, client=admin_client)
+
+            else:
+                password = UNPRIVILEGED_PASSWORD.encode()
+                enc_password = bcrypt.hashpw(password, bcrypt.gensalt(5, prefix=b"2a")).decode()
+                crypto_credentials = f"{UNPRIVILEGED_USER}:{enc_password}"
+                with Secret(
+                    name=HTTP_SECRET_NAME,
+                    namespace=NamespacesNames.OPENSHIFT_CONFIG,
+                    htpasswd=base64_encode_str(text=crypto_credentials),
+                    client=admin_client,
+                ) as secret:
+                    leader.ready()
+                    yield secret
+                    leader.wait_for_followers()
+
+                #  Wait for oauth-openshift deployment to update after removing htpass-secret
+                _wait_for_oauth_openshift_deployment(admin_client=admin_client)
 
 
 @pytest.fixture(scope="session")
@@ -129,21 +139,29 @@ def identity_provider_with_htpasswd(skip_unprivileged_client, admin_client, iden
     if skip_unprivileged_client:
         yield
     else:
-        identity_provider_config_editor = ResourceEditor(
-            patches={
-                identity_provider_config: {
-                    "metadata": {"name": identity_provider_config.name},
-                    "spec": {
-                        "identityProviders": [HTPASSWD_PROVIDER_DICT],
-                        "tokenConfig": ACCESS_TOKEN,
-                    },
-                }
-            }
-        )
-        identity_provider_config_editor.update(backup_resources=True)
-        _wait_for_oauth_openshift_deployment(admin_client=admin_client)
-        yield
-        identity_provider_config_editor.restore()
+        with SessionResourceLeader(name=HTPASSWD_PROVIDER_DICT["name"]) as leader:
+            if not leader.is_leader:
+                leader.wait_ready()
+                yield
+
+            else:
+                identity_provider_config_editor = ResourceEditor(
+                    patches={
+                        identity_provider_config: {
+                            "metadata": {"name": identity_provider_config.name},
+                            "spec": {
+                                "identityProviders": [HTPASSWD_PROVIDER_DICT],
+                                "tokenConfig": ACCESS_TOKEN,
+                            },
+                        }
+                    }
+                )
+                identity_provider_config_editor.update(backup_resources=True)
+                _wait_for_oauth_openshift_deployment(admin_client=admin_client)
+                leader.ready()
+                yield
+                leader.wait_for_followers()
+                identity_provider_config_editor.restore()
 
 
 @pytest.fixture(scope="session")
@@ -175,7 +193,7 @@ def unprivileged_client(
                 api_address=admin_client.configuration.host,
                 user=current_user.strip(),
             )
-            yield get_client(config_file=exported_kubeconfig, context=unprivileged_context)
+            yield instrument_client(client=get_client(config_file=exported_kubeconfig, context=unprivileged_context))
 
         else:
             yield admin_client
@@ -10,6 +10,7 @@ from ocp_resources.namespace import Namespace
 from utilities.constants.cluster import POD_SECURITY_NAMESPACE_LABELS
 from utilities.constants.namespaces import NamespacesNames
 from utilities.infra import create_ns, generate_namespace_name
+from utilities.parallel import SessionResourceLeader
 from utilities.pytest_utils import exit_pytest_execution
 
 LOGGER = logging.getLogger(__name__)
@@ -40,23 +41,32 @@ def cnv_tests_utilities_namespace(admin_client, installing_cnv):
         yield
     else:
         name = NamespacesNames.CNV_TESTS_UTILITIES
-        if Namespace(client=admin_client, name=name).exists:
-            exit_pytest_execution(
-                log_message=f"{name} namespace already exists."
-                f"\nAfter verifying no one else is performing tests against the cluster, run:"
-                f"\n'oc delete namespace {name}'",
-                return_code=100,
-                message=f"{name} namespace already exists.",
-                filename="cnv_tests_utilities_ns_failure.txt",
-                admin_client=admin_client,
-            )
+        with SessionResourceLeader(name=name) as leader:
+            if not leader.is_leader:
+                leader.wait_ready()
+                yield Namespace(client=admin_client, name=name)
 
-        else:
-            yield from create_ns(
-                admin_client=admin_client,
-                labels=POD_SECURITY_NAMESPACE_LABELS,
-                name=name,
-            )
+            elif Namespace(client=admin_client, name=name).exists:
+                exit_pytest_execution(
+                    log_message=f"{name} namespace already exists."
+                    f"\nAfter verifying no one else is performing tests against the cluster, run:"
+                    f"\n'oc delete namespace {name}'",
+                    return_code=100,
+                    message=f"{name} namespace already exists.",
+                    filename="cnv_tests_utilities_ns_failure.txt",
+                    admin_client=admin_client,
+                )
+
+            else:
+                for utilities_namespace in create_ns(
+                    admin_client=admin_client,
+                    labels=POD_SECURITY_NAMESPACE_LABELS,
+                    name=name,
+                    worker_suffix=False,
+                ):
+                    leader.ready()
+                    yield utilities_namespace
+                    leader.wait_for_followers()
 
 
 @pytest.fixture(scope="session")
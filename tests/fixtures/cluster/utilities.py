@@ -17,6 +17,7 @@ from utilities.infra import (
     get_daemonset_yaml_file_with_image_hash,
     get_utility_pods_from_nodes,
 )
+from utilities.parallel import SessionResourceLeader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,17 +38,28 @@ def cnv_tests_utilities_service_account(admin_client, cnv_tests_utilities_namesp
     if installing_cnv:
         yield
     else:
-        with ServiceAccount(
-            client=admin_client,
-            name=CNV_TEST_SERVICE_ACCOUNT,
-            namespace=cnv_tests_utilities_namespace.name,
-        ) as service_account:
-            add_scc_to_service_account(
-                namespace=cnv_tests_utilities_namespace.name,
-                scc_name="privileged",
-                sa_name=service_account.name,
-            )
-            yield service_account
+        with SessionResourceLeader(name=CNV_TEST_SERVICE_ACCOUNT) as leader:
+            if leader.is_leader:
+                with ServiceAccount(
+                    client=admin_client,
+                    name=CNV_TEST_SERVICE_ACCOUNT,
+                    namespace=cnv_tests_utilities_namespace.name,
+                ) as service_account:
+                    add_scc_to_service_account(
+                        namespace=cnv_tests_utilities_namespace.name,
+                        scc_name="privileged",
+                        sa_name=service_account.name,
+                    )
+                    leader.ready()
+                    yield service_account
+                    leader.wait_for_followers()
+            else:
+                leader.wait_ready()
+                yield ServiceAccount(
+                    client=admin_client,
+                    name=CNV_TEST_SERVICE_ACCOUNT,
+                    namespace=cnv_tests_utilities_namespace.name,
+                )
 
 
 @pytest.fixture(scope="session")
@@ -67,13 +79,20 @@ def utility_daemonset(
     if installing_cnv:
         yield
     else:
-        modified_ds_yaml_file = get_daemonset_yaml_file_with_image_hash(
-            generated_pulled_secret=generated_pulled_secret,
-            service_account=cnv_tests_utilities_service_account,
-        )
-        with DaemonSet(client=admin_client, yaml_file=modified_ds_yaml_file) as ds:
-            ds.wait_until_deployed()
-            yield ds
+        with SessionResourceLeader(name=f"{UTILITY}-daemonset") as leader:
+            if leader.is_leader:
+                modified_ds_yaml_file = get_daemonset_yaml_file_with_image_hash(
+                    generated_pulled_secret=generated_pulled_secret,
+                    service_account=cnv_tests_utilities_service_account,
+                )
+                with DaemonSet(client=admin_client, yaml_file=modified_ds_yaml_file) as ds:
+                    ds.wait_until_deployed()
+                    leader.ready()
+                    yield ds
+                    leader.wait_for_followers()
+            else:
+                leader.wait_ready()
+                yield DaemonSet(client=admin_client, name=UTILITY, namespace=cnv_tests_utilities_namespace.name)
 
 
 @pytest.fixture(scope="session")
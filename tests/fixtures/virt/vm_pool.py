@@ -0,0 +1,45 @@
+"""Pre-booted VM pool fixtures."""
+
+import pytest
+
+from utilities.infra import create_ns
+from utilities.virt import VirtualMachineForTests, fedora_vm_body
+from utilities.vm_pool import VMPool
+
+
+@pytest.fixture(scope="session")
+def fedora_vm_pool(request, admin_client, unprivileged_client):
+    """
+    Pool of running Fedora VMs; its size is set by --fedora-vm-pool-size.
+    """
+    for pool_namespace in create_ns(
+        admin_client=admin_client, unprivileged_client=unprivileged_client, name="fedora-vm-pool"
+    ):
+        vm_pool = VMPool(
+            name="fedora",
+            size=request.session.config.getoption("--fedora-vm-pool-size"),
+            vm_factory=lambda vm_name: VirtualMachineForTests(
+                name=vm_name,
+                namespace=pool_namespace.name,
+                client=unprivileged_client,
+                body=fedora_vm_body(name=vm_name),
+            ),
+        )
+        vm_pool.start()
+        yield vm_pool
+        vm_pool.close()
+
+
+@pytest.fixture()
+def pooled_fedora_vm(request, fedora_vm_pool):
+    """
+    Running Fedora VM with SSH, leased from the session pool and returned after the test.
+
+    A test which changes the VM in a way a restart does not undo must call `fedora_vm_pool.mark_dirty(vm=vm)`.
+    """
+    tests_failed = request.session.testsfailed
+    with fedora_vm_pool.lease() as vm:
+        yield vm
+        # A failure of the test is not raised in the fixture
+        if request.session.testsfailed > tests_failed:
+            fedora_vm_pool.mark_dirty(vm=vm)
@@ -36,8 +36,9 @@ from utilities.network import (
     network_nad,
     wait_for_node_marked_by_bridge,
 )
+from utilities.reaper import get_teardown_reaper
 from utilities.storage import add_dv_to_vm
-from utilities.virt import VirtualMachineForTests, fedora_vm_body, running_vm
+from utilities.virt import VirtualMachineForTests, fedora_vm_body, running_vm, running_vms
 
 LOGGER = logging.getLogger(__name__)
 LONG_VM_NAME = "v" * 63
@@ -436,11 +437,9 @@ def must_gather_vms_from_alternate_namespace(
         namespace_name=must_gather_alternate_namespace.name,
         vm_count=5,
     )
-    for vm in vms_list:
-        running_vm(vm=vm)
+    running_vms(vms=vms_list)
     yield vms_list
-    for vm in vms_list:
-        vm.clean_up()
+    get_teardown_reaper().reap(resources=vms_list, wait=True)
 
 
 @pytest.fixture(scope="class")
@@ -84,6 +84,7 @@ def created_cnv_namespace(admin_client):
         admin_client=admin_client,
         name=cnv_namespace_name,
         teardown=False,
+        worker_suffix=False,
         labels={
             "pod-security.kubernetes.io/enforce": "privileged",
             "security.openshift.io/scc.podSecurityLabelSync": "false",
@@ -14,6 +14,7 @@ from ocp_resources.pod import Pod
 from timeout_sampler import TimeoutExpiredError
 
 from libs.net.cluster import ipv4_supported_cluster, ipv6_supported_cluster
+from utilities.console import console_sessions
 from utilities.constants.components import CLUSTER, CLUSTER_NETWORK_ADDONS_OPERATOR, VIRT_HANDLER
 from utilities.constants.namespaces import NamespacesNames
 from utilities.infra import (
@@ -137,6 +138,15 @@ def mtv_namespace_scope_session(admin_client: DynamicClient) -> Namespace:
     return Namespace(name=NamespacesNames.OPENSHIFT_MTV, client=admin_client)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def vm_console_sessions():
+    """
+    Keep VM consoles logged in between `vm.console()` calls of the module tests (iperf, ping).
+    """
+    with console_sessions() as registry:
+        yield registry
+
+
 @pytest.fixture(scope="session", autouse=True)
 def network_sanity(
     admin_client,
@@ -4,14 +4,13 @@ import os
 import re
 import shlex
 import time
-from collections import Counter
 
 import pytest
 import yaml
-from kubernetes.dynamic.exceptions import ForbiddenError
 from ocp_resources.data_source import DataSource
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.template import Template
+from ocp_resources.virtual_machine import VirtualMachine
 from ocp_resources.virtual_machine_instance_migration import (
     VirtualMachineInstanceMigration,
 )
@@ -26,6 +25,7 @@ from tests.os_params import (
     WINDOWS_LATEST,
     WINDOWS_LATEST_LABELS,
 )
+from tests.scale.utils import write_scale_report
 from utilities.artifactory import (
     cleanup_artifactory_secret_and_config_map,
     get_artifactory_config_map,
@@ -42,13 +42,17 @@ from utilities.constants.timeouts import (
     TIMEOUT_1MIN,
     TIMEOUT_30MIN,
 )
+from utilities.data_collector import get_data_collector_base_directory
+from utilities.informer import informer_cache
 from utilities.infra import (
     create_ns,
 )
 from utilities.must_gather import run_must_gather
+from utilities.reaper import get_teardown_reaper
 from utilities.storage import construct_datavolume_source_dict, generate_data_source_dict, get_test_artifact_server_url
 from utilities.virt import (
     VirtualMachineForTestsFromTemplate,
+    get_vmis_status_snapshot,
     verify_vm_migrated,
     wait_for_migration_finished,
 )
@@ -66,6 +70,19 @@ SCALE_STORAGE_TYPES = {
 pytestmark = [pytest.mark.scale, pytest.mark.windows]
 
 
+def get_scale_vmis_status_snapshot(vms):
+    """
+    List the scale VMIs once instead of reading each VMI
+
+    Args:
+        vms (list): scale VMs, all in the scale namespace
+
+    Returns:
+        VMIsStatusSnapshot: the scale namespace VMIs phases and nodes
+    """
+    return get_vmis_status_snapshot(client=vms[0].client, namespace=vms[0].namespace)
+
+
 def log_nodes_load_data(vms=None):
     """
     Log the distribution of VM's on the nodes, and the cluster memory/cpu statistics
@@ -73,7 +90,9 @@ def log_nodes_load_data(vms=None):
     Args:
         vms (list): List of vms to log statistics on
     """
-    nodes_load_distribute = Counter([vm.vmi.node.name for vm in vms or []])
+    nodes_load_distribute = (
+        get_scale_vmis_status_snapshot(vms=vms).node_distribution(vm_names=[vm.name for vm in vms]) if vms else None
+    )
     LOGGER.info(f"Nodes vm load distribution: {nodes_load_distribute or 'no scale VMs running'}")
     cmd_succeeded, nodes_load_statistics, _ = run_command(
         command=shlex.split("oc adm top nodes --use-protocol-buffers")
@@ -92,21 +111,17 @@ def all_vms_running(vms):
     Returns:
         bool: True if all vms in running state, False otherwise
     """
-    num_of_running_vms = len([vm for vm in vms if vm.vmi.status == vm.Status.RUNNING])
-    LOGGER.info(f"Number of running vms: {num_of_running_vms}")
-    return num_of_running_vms == len(vms)
+    vm_names = [vm.name for vm in vms]
+    snapshot = get_scale_vmis_status_snapshot(vms=vms)
+    LOGGER.info(f"Number of running vms: {len(snapshot.running(vm_names=vm_names))}")
+    not_running_vms = snapshot.not_running(vm_names=vm_names)
+    if not_running_vms:
+        LOGGER.warning(f"Not running vms (VMI phase): {not_running_vms}")
+    return not not_running_vms
 
 
 def delete_resources(resources):
-    deleted_resources = []
-    for _resource in resources:
-        try:
-            _resource.delete()
-            deleted_resources.append(_resource)
-        except ForbiddenError:
-            pass
-    for _resource in deleted_resources:
-        _resource.wait_deleted()
+    get_teardown_reaper().reap(resources=resources, wait=True)
 
 
 def save_must_gather_logs(must_gather_image_url):
@@ -200,6 +215,21 @@ def scale_namespace(admin_client, unprivileged_client, scale_test_param, keep_re
     )
 
 
+@pytest.fixture(scope="class")
+def scale_namespace_informer_cache(admin_client, scale_namespace):
+    with informer_cache(client=admin_client, namespace=scale_namespace.name):
+        yield
+
+
+@pytest.fixture(scope="class")
+def scale_report_dir(pytestconfig):
+    """
+    Directory of the scale benchmark report: next to the junit XML when --junitxml is set.
+    """
+    xml_path = pytestconfig.option.xmlpath
+    return os.path.dirname(os.path.abspath(xml_path)) if xml_path else get_data_collector_base_directory()
+
+
 @pytest.fixture(scope="class")
 def dvs_os_info():
     return {
@@ -401,7 +431,8 @@ class TestScale:
         depends=["test_create_vms"],
     )
     @pytest.mark.polarion("CNV-8448")
-    def test_start_vms(self, scale_test_param, scale_vms, all_vms_objects, must_gather_image_url):
+    @pytest.mark.usefixtures("scale_namespace_informer_cache")
+    def test_start_vms(self, scale_test_param, scale_vms, all_vms_objects, must_gather_image_url, scale_report_dir):
         for batch in scale_vms:
             for vm in batch:
                 if vm.instance.spec.runStrategy == vm.RunStrategy.ALWAYS:
@@ -419,10 +450,12 @@ class TestScale:
                         vms_list=all_vms_objects,
                         must_gather_image_url=must_gather_image_url,
                     )
+        write_scale_report(vms=all_vms_objects, report_dir=scale_report_dir)
 
     # TODO check the os internally to see if it didn't reboot
     @pytest.mark.dependency(name="test_scale_vms_running_stability", depends=["test_start_vms"])
     @pytest.mark.polarion("CNV-8449")
+    @pytest.mark.usefixtures("scale_namespace_informer_cache")
     def test_scale_vms_running_stability(
         self,
         scale_test_param,
@@ -471,11 +504,17 @@ class TestScale:
     def test_delete_resources(
         self,
         skip_if_keep_resources,
+        admin_client,
         golden_images_scale_dvs,
         data_sources,
         scale_namespace,
         scale_vms,
-        all_vms_objects,
     ):
         # TODO record time for the deletion of VMs and the cloned DVs
-        delete_resources(resources=list(data_sources.values()) + golden_images_scale_dvs + all_vms_objects)
+        reaper = get_teardown_reaper()
+        # The scale namespace holds only the scale VMs; their cloned DVs are garbage collected with them
+        vms_deletion = reaper.reap_collection(
+            client=admin_client, resource_class=VirtualMachine, namespace=scale_namespace.name
+        )
+        reaper.reap(resources=list(data_sources.values()) + golden_images_scale_dvs, wait=True)
+        reaper.wait(futures=[vms_deletion])
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import math
+import os
+import re
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.constants.timeouts import TIMEOUT_10MIN
+from utilities.virt import vmi_agent_connected
+from utilities.watcher import wait_for_resource_condition
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic.resource import ResourceInstance
+
+    from utilities.virt import VirtualMachineForTests
+
+LOGGER = logging.getLogger(__name__)
+
+SCALE_REPORT_FILE_NAME = "scale_benchmark_report.json"
+REPORT_PERCENTILES = (50, 95, 99)
+# Scale VM names are vm-<os>-<storage type>-b<batch number>-<index>, see the scale_vms fixture
+SCALE_VM_GROUP_REGEX = re.compile(r"^vm-(?P<group>.+)-b\d+-\d+$")
+
+DV_IMPORT_PHASE = "dv_import_done"
+VMI_SCHEDULED_PHASE = "vmi_scheduled"
+LAUNCHER_RUNNING_PHASE = "virt_launcher_running"
+VMI_RUNNING_PHASE = "vmi_running"
+AGENT_CONNECTED_PHASE = "guest_agent_connected"
+
+
+def _parse_timestamp(timestamp: str | None) -> datetime.datetime | None:
+    return datetime.datetime.fromisoformat(timestamp) if timestamp else None
+
+
+def _seconds_between(start: datetime.datetime | None, end: datetime.datetime | None) -> float | None:
+    return round((end - start).total_seconds(), 1) if start and end else None
+
+
+def _condition_transition_time(instance: ResourceInstance, condition_type: str) -> datetime.datetime | None:
+    for condition in instance.get("status", {}).get("conditions") or []:
+        if condition.get("type") == condition_type and condition.get("status") == "True":
+            return _parse_timestamp(timestamp=condition.get("lastTransitionTime"))
+    return None
+
+
+def _dv_import_seconds(vm: VirtualMachineForTests) -> float | None:
+    """
+    Return the time from creation to Ready of the slowest DataVolume of the VM.
+    """
+    try:
+        dv_templates = vm.instance.spec.get("dataVolumeTemplates") or []
+    except NotFoundError:
+        return None
+
+    dv_seconds = []
+    for dv_template in dv_templates:
+        try:
+            dv_instance = DataVolume(
+                name=dv_template.metadata.name, namespace=vm.namespace, client=vm.client
+            ).instance.to_dict()
+        except NotFoundError:
+            # Garbage collected after the import succeeded
+            continue
+        dv_seconds.append(
+            _seconds_between(
+                start=_parse_timestamp(timestamp=dv_instance["metadata"].get("creationTimestamp")),
+                end=_condition_transition_time(instance=dv_instance, condition_type=DataVolume.Condition.Type.READY),
+            )
+        )
+    dv_seconds = [seconds for seconds in dv_seconds if seconds is not None]
+    return max(dv_seconds) if dv_seconds else None
+
+
+def _launcher_running_time(vmi: VirtualMachineInstance) -> datetime.datetime | None:
+    try:
+        pod_instance = vmi.virt_launcher_pod.instance.to_dict()
+    except NotFoundError, ResourceNotFoundError:
+        return None
+
+    for container_status in pod_instance.get("status", {}).get("containerStatuses") or []:
+        if container_status.get("name") == "compute":
+            return _parse_timestamp(timestamp=container_status.get("state", {}).get("running", {}).get("startedAt"))
+    return None
+
+
+def get_vm_phase_latencies(vm: VirtualMachineForTests, agent_timeout: int = TIMEOUT_10MIN) -> dict[str, float | None]:
+    """
+    Return the latency of each boot phase of a started VM, from the cluster timestamps.
+
+    The VMI phases are measured from the VMI creation (the start request), the DataVolume import from the DataVolume
+    creation. Cluster timestamps have a 1 second resolution.
+
+    Args:
+        vm (VirtualMachineForTests): started VM.
+        agent_timeout (int): how much time to wait for the guest agent to connect.
+
+    Returns:
+        dict: phase name to latency in seconds, None if the phase was not reached.
+    """
+    phase_latencies: dict[str, float | None] = {
+        DV_IMPORT_PHASE: _dv_import_seconds(vm=vm),
+        VMI_SCHEDULED_PHASE: None,
+        LAUNCHER_RUNNING_PHASE: None,
+        VMI_RUNNING_PHASE: None,
+        AGENT_CONNECTED_PHASE: None,
+    }
+    vmi = vm.vmi
+    if not vmi.exists:
+        LOGGER.warning(f"VM {vm.name} has no VMI, its boot phases were not reached")
+        return phase_latencies
+
+    if agent_timeout:
+        try:
+            wait_for_resource_condition(resource=vmi, condition=vmi_agent_connected, timeout=agent_timeout)
+        except TimeoutExpiredError:
+            LOGGER.warning(f"VM {vm.name} guest agent did not connect within {agent_timeout} seconds")
+
+    try:
+        vmi_instance = vmi.instance.to_dict()
+    except NotFoundError:
+        LOGGER.warning(f"VM {vm.name} VMI was deleted, its boot phases are not reported")
+        return phase_latencies
+    vmi_created = _parse_timestamp(timestamp=vmi_instance["metadata"].get("creationTimestamp"))
+    phase_times = {
+        transition.get("phase"): _parse_timestamp(timestamp=transition.get("phaseTransitionTimestamp"))
+        for transition in vmi_instance.get("status", {}).get("phaseTransitionTimestamps") or []
+    }
+
+    phase_latencies.update({
+        VMI_SCHEDULED_PHASE: _seconds_between(
+            start=vmi_created, end=phase_times.get(VirtualMachineInstance.Status.SCHEDULED)
+        ),
+        LAUNCHER_RUNNING_PHASE: _seconds_between(start=vmi_created, end=_launcher_running_time(vmi=vmi)),
+        VMI_RUNNING_PHASE: _seconds_between(
+            start=vmi_created, end=phase_times.get(VirtualMachineInstance.Status.RUNNING)
+        ),
+        AGENT_CONNECTED_PHASE: _seconds_between(
+            start=vmi_created,
+            end=_condition_transition_time(
+                instance=vmi_instance, condition_type=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+            ),
+        ),
+    })
+    return phase_latencies
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """
+    Nearest-rank percentile of `values`.
+    """
+    sorted_values = sorted(values)
+    return sorted_values[max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)]
+
+
+def summarize_phase_latencies(vms_phase_latencies: dict[str, dict[str, float | None]]) -> dict[str, Any]:
+    """
+    Summarize the VMs phase latencies per OS/storage type group.
+
+    Args:
+        vms_phase_latencies (dict): VM name to the phase latencies returned by `get_vm_phase_latencies`.
+
+    Returns:
+        dict: group name to the number of VMs and, per phase, the p50/p95/p99/max latency in seconds and the number of
+            VMs that reached the phase.
+    """
+    groups_phase_values: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    groups_vms_count: dict[str, int] = defaultdict(int)
+    for vm_name, phase_latencies in vms_phase_latencies.items():
+        group_match = SCALE_VM_GROUP_REGEX.match(vm_name)
+        group = group_match.group("group") if group_match else vm_name
+        groups_vms_count[group] += 1
+        for phase, latency in phase_latencies.items():
+            if latency is not None:
+                groups_phase_values[group][phase].append(latency)
+
+    summary: dict[str, Any] = {}
+    for group, vms_count in groups_vms_count.items():
+        summary[group] = {"vms": vms_count, "phases": {}}
+        for phase, values in groups_phase_values[group].items():
+            summary[group]["phases"][phase] = {
+                **{f"p{percent}": percentile(values=values, percent=percent) for percent in REPORT_PERCENTILES},
+                "max": max(values),
+                "count": len(values),
+            }
+    return summary
+
+
+def write_scale_report(
+    vms: list[VirtualMachineForTests], report_dir: str, agent_timeout: int = TIMEOUT_10MIN
+) -> dict[str, Any]:
+    """
+    Collect the boot phase latencies of the VMs and write the benchmark report as JSON.
+
+    Args:
+        vms (list): started VMs.
+        report_dir (str): directory to write the report to.
+        agent_timeout (int): how much time to wait for the guest agents of all the VMs to connect; the agents
+            connect concurrently, so the VMs share one deadline.
+
+    Returns:
+        dict: the report.
+    """
+    agent_deadline = time.monotonic() + agent_timeout
+    vms_phase_latencies = {
+        vm.name: get_vm_phase_latencies(vm=vm, agent_timeout=max(math.ceil(agent_deadline - time.monotonic()), 0))
+        for vm in vms
+    }
+    report = {
+        "generated_at": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+        "summary": summarize_phase_latencies(vms_phase_latencies=vms_phase_latencies),
+        "vms": vms_phase_latencies,
+    }
+
+    os.makedirs(report_dir, exist_ok=True)
+    report_path = os.path.join(report_dir, SCALE_REPORT_FILE_NAME)
+    with open(report_path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+    LOGGER.info(f"Scale benchmark summary: {json.dumps(report['summary'], indent=2)}")
+    LOGGER.info(f"Scale benchmark report written to {report_path}")
+    return report
@@ -3,10 +3,9 @@ Upload tests
 """
 
 import logging
-import multiprocessing
 import time
+from contextlib import ExitStack
 from random import shuffle
-from time import sleep
 
 import pytest
 from ocp_resources.datavolume import DataVolume
@@ -22,6 +21,7 @@ from tests.os_params import RHEL_LATEST
 from utilities.constants import Images
 from utilities.constants.components import CDI_UPLOADPROXY
 from utilities.constants.timeouts import TIMEOUT_1MIN, TIMEOUT_3MIN, TIMEOUT_5MIN
+from utilities.image_upload import UploadReport, UploadTarget, stream_upload, upload_images
 from utilities.storage import create_vm_from_dv, get_downloaded_artifact
 
 LOGGER = logging.getLogger(__name__)
@@ -252,36 +252,28 @@ def test_successful_upload_token_expiry(unprivileged_client, namespace, data_vol
         wait_for_upload_response_code(token=token, data="test", response_code=HTTP_UNAUTHORIZED)
 
 
-def _upload_image(dv_name, namespace, storage_class, local_name, client):
+def _retry_failed_uploads(upload_report: UploadReport) -> None:
     """
-    Upload image function for the use of other tests
+    Upload the images of the failed uploads again until they succeed, e.g. after a transient upload proxy error.
     """
-    with utilities.storage.create_dv(
-        client=client,
-        source="upload",
-        dv_name=dv_name,
-        namespace=namespace.name,
-        size="3Gi",
-        storage_class=storage_class,
-    ) as dv:
-        LOGGER.info("Wait for DV to be UploadReady")
-        dv.wait_for_status(status=DataVolume.Status.UPLOAD_READY, timeout=TIMEOUT_5MIN)
-        with UploadTokenRequest(
-            client=client,
-            name=dv_name,
-            namespace=namespace.name,
-            pvc_name=dv.pvc.name,
-        ) as utr:
-            token = utr.create().status.token
-            sleep(5)
-            LOGGER.info("Ensure upload was successful")
-            wait_for_upload_response_code(token=token, data=local_name, response_code=HTTP_OK)
+    for failed_upload in upload_report.failed_uploads:
+        LOGGER.warning(
+            f"Upload of {failed_upload.target.image_path} failed: {failed_upload.status_code or failed_upload.error}; "
+            "retrying"
+        )
+        for upload_result in TimeoutSampler(
+            wait_timeout=TIMEOUT_1MIN,
+            sleep=5,
+            func=stream_upload,
+            target=failed_upload.target,
+        ):
+            if upload_result.succeeded:
+                break
 
 
 @pytest.mark.sno
 @pytest.mark.s390x
 @pytest.mark.polarion("CNV-2015")
-@pytest.mark.usefixtures("multiprocessing_start_method_fork")
 @pytest.mark.parametrize(
     "upload_file_path",
     [
@@ -301,21 +293,38 @@ def test_successful_concurrent_uploads(
     namespace,
     storage_class_matrix__module__,
 ):
-    dvs_processes = []
     storage_class = [*storage_class_matrix__module__][0]
     available_pv = PersistentVolume(name=namespace, client=admin_client).max_available_pvs
-    for dv in range(available_pv):
-        dv_process = multiprocessing.Process(
-            target=_upload_image,
-            args=(f"dv-{dv}", namespace, storage_class, upload_file_path, unprivileged_client),
-        )
-        dv_process.start()
-        dvs_processes.append(dv_process)
-
-    for dvs in dvs_processes:
-        dvs.join()
-        if dvs.exitcode != 0:
-            raise pytest.fail("Creating DV exited with non-zero return code")
+    with ExitStack() as stack:
+        dvs = [
+            stack.enter_context(
+                utilities.storage.create_dv(
+                    client=unprivileged_client,
+                    source="upload",
+                    dv_name=f"dv-{dv_index}",
+                    namespace=namespace.name,
+                    size="3Gi",
+                    storage_class=storage_class,
+                )
+            )
+            for dv_index in range(available_pv)
+        ]
+        LOGGER.info("Wait for DVs to be UploadReady")
+        for dv in dvs:
+            dv.wait_for_status(status=DataVolume.Status.UPLOAD_READY, timeout=TIMEOUT_5MIN)
+        uploadproxy_url = storage_utils.get_uploadproxy_url(client=unprivileged_client)
+        upload_targets = []
+        for dv in dvs:
+            utr = stack.enter_context(
+                UploadTokenRequest(
+                    client=unprivileged_client, name=dv.name, namespace=namespace.name, pvc_name=dv.pvc.name
+                )
+            )
+            upload_targets.append(
+                UploadTarget(url=uploadproxy_url, token=utr.create().status.token, image_path=upload_file_path)
+            )
+        # All the images are uploaded at the same time
+        _retry_failed_uploads(upload_report=upload_images(targets=upload_targets, max_workers=len(upload_targets)))
 
 
 @pytest.mark.sno
@@ -30,6 +30,7 @@ from utilities.constants.cluster import LS_COMMAND
 from utilities.constants.components import CDI_UPLOADPROXY
 from utilities.constants.timeouts import TIMEOUT_2MIN, TIMEOUT_5MIN, TIMEOUT_5SEC, TIMEOUT_20SEC, TIMEOUT_30MIN
 from utilities.exceptions import DataVolumeConditionMessageNotFoundError
+from utilities.image_upload import UploadTarget, stream_upload
 from utilities.infra import (
     get_pod_by_name_prefix,
 )
@@ -123,23 +124,28 @@ def create_windows_vm_validate_guest_agent_info(
         validate_os_info_vmi_vs_windows_os(vm=vm_dv)
 
 
-def upload_image(token, data, asynchronous=False, client=None):
-    headers = {"Authorization": f"Bearer {token}"}
+def get_uploadproxy_url(asynchronous=False, client=None):
     uploadproxy = Route(name=CDI_UPLOADPROXY, namespace=py_config["hco_namespace"], client=client)
     uploadproxy_url = f"https://{uploadproxy.host}/v1alpha1/upload"
-    if asynchronous:
-        uploadproxy_url = f"{uploadproxy_url}-async"
+    return f"{uploadproxy_url}-async" if asynchronous else uploadproxy_url
+
+
+def upload_image(token, data, asynchronous=False, client=None):
+    uploadproxy_url = get_uploadproxy_url(asynchronous=asynchronous, client=client)
     LOGGER.info(msg=f"Upload {data} to {uploadproxy_url}")
     try:
-        with open(data, "rb") as fd:
-            fd_data = fd.read()
+        result = stream_upload(target=UploadTarget(url=uploadproxy_url, token=token, image_path=data))
     except OSError as error:
         LOGGER.error(
             f"Failed to read upload image (type={type(data).__name__}); treating input as raw data. error={error}"
         )
-        fd_data = data
+    else:
+        if result.error:
+            raise result.error
+        return result.status_code
 
-    return requests.post(url=uploadproxy_url, data=fd_data, headers=headers, verify=False).status_code
+    headers = {"Authorization": f"Bearer {token}"}
+    return requests.post(url=uploadproxy_url, data=data, headers=headers, verify=False).status_code
 
 
 class HttpService(Service):
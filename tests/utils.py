@@ -5,7 +5,9 @@ import re
 import shlex
 import tarfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from copy import deepcopy
 from io import BytesIO
 
 import bitmath
@@ -16,7 +18,7 @@ from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.kubevirt import KubeVirt
 from ocp_resources.node import Node
-from ocp_resources.resource import ResourceEditor
+from ocp_resources.resource import Resource, ResourceEditor
 from ocp_resources.storage_profile import StorageProfile
 from ocp_resources.virtual_machine import VirtualMachine
 from ocp_resources.virtual_machine_cluster_instancetype import VirtualMachineClusterInstancetype
@@ -54,13 +56,14 @@ from utilities.constants.timeouts import (
     TIMEOUT_15SEC,
     TIMEOUT_30MIN,
 )
-from utilities.constants.virt import DISK_SERIAL, NODE_HUGE_PAGES_1GI_KEY
+from utilities.constants.virt import DISK_SERIAL, NODE_HUGE_PAGES_1GI_KEY, VM_CREATE_BURST, VM_CREATE_QPS
 from utilities.data_collector import get_data_collector_dir, write_to_file
 from utilities.exceptions import ResourceValueError
 from utilities.hco import ResourceEditorValidateHCOReconcile
 from utilities.infra import (
     ExecCommandOnPod,
 )
+from utilities.rate_limiter import TokenBucket
 from utilities.storage import construct_datavolume_source_dict
 from utilities.virt import (
     VirtualMachineForTests,
@@ -89,10 +92,16 @@ def create_vms(
     ssh=True,
     node_selector_labels=None,
     cpu_model=None,
+    qps=VM_CREATE_QPS,
+    burst=VM_CREATE_BURST,
 ):
     """
     Create n number of fedora vms.
 
+    The fedora VM body is rendered once and copied per VM, and the VMs are created concurrently, limited to `qps`
+    creations per second after an initial `burst`.
+    The created VMs are not torn down on exit; the caller is responsible for calling `clean_up` on them.
+
     Args:
         name_prefix (str): prefix to be used to name virtualmachines
         namespace_name (str): Namespace to be used for vm creation
@@ -101,25 +110,49 @@ def create_vms(
         client (DynamicClient): DynamicClient object
         ssh (bool): enable SSH on the VM
         cpu_model (str): CPU model to be used for the VMs
+        qps (float): Maximum sustained VM creations per second
+        burst (int): Maximum VM creations submitted at once
 
     Returns:
-        list: List of VirtualMachineForTests
+        list: List of VirtualMachineForTests, ordered by index
+
+    Raises:
+        Exception: The first creation error, after the VMs that were created are cleaned up
     """
-    vms_list = []
-    for idx in range(vm_count):
-        vm_name = f"{name_prefix}-{idx}"
-        with VirtualMachineForTests(
+    vm_body = fedora_vm_body(name=name_prefix)
+    rate_limiter = TokenBucket(qps=qps, burst=burst)
+
+    def _create_vm(vm_name):
+        body = deepcopy(vm_body)
+        body["metadata"]["name"] = vm_name
+        body["metadata"].setdefault("labels", {})[f"{Resource.ApiGroup.KUBEVIRT_IO}/vm"] = vm_name
+        vm = VirtualMachineForTests(
             name=vm_name,
             namespace=namespace_name,
-            body=fedora_vm_body(name=vm_name),
+            body=body,
             node_selector_labels=node_selector_labels,
             teardown=False,
             run_strategy=VirtualMachine.RunStrategy.ALWAYS,
             ssh=ssh,
             client=client,
             cpu_model=cpu_model,
-        ) as vm:
-            vms_list.append(vm)
+        )
+        rate_limiter.acquire()
+        return vm.deploy()
+
+    LOGGER.info(f"Creating {vm_count} VMs {name_prefix}-<index> in namespace {namespace_name}")
+    with ThreadPoolExecutor(max_workers=min(burst, vm_count) or 1, thread_name_prefix="create-vms") as executor:
+        futures = [executor.submit(_create_vm, vm_name=f"{name_prefix}-{idx}") for idx in range(vm_count)]
+        wait(futures)
+
+    vms_list = [future.result() for future in futures if future.exception() is None]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        LOGGER.error(f"Failed to create {len(errors)} of {vm_count} VMs, cleaning up the created VMs")
+        for vm in vms_list:
+            vm.clean_up(wait=False)
+        raise errors[0]
+
     return vms_list
 
 
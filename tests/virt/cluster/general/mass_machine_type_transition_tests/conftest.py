@@ -62,7 +62,7 @@ def kubevirt_api_lifecycle_automation_job(
 
 @pytest.fixture(scope="class")
 def kubevirt_api_lifecycle_namespace(admin_client):
-    yield from create_ns(name=KUBEVIRT_API_LIFECYCLE_AUTOMATION, admin_client=admin_client)
+    yield from create_ns(name=KUBEVIRT_API_LIFECYCLE_AUTOMATION, admin_client=admin_client, worker_suffix=False)
 
 
 @pytest.fixture(scope="class")
@@ -39,6 +39,7 @@ from utilities.virt import (
     VirtualMachineForTestsFromTemplate,
     fedora_vm_body,
     running_vm,
+    running_vms,
     wait_for_ssh_connectivity,
 )
 
@@ -239,8 +240,8 @@ def verify_windows_upgraded_recently_multi_vms(vm_list):
 def wait_vms_booted_and_start_processes(vms_list, os_type, wsl2_guest=False):
     vms_and_pids = {}
 
+    running_vms(vms=vms_list)
     for vm in vms_list:
-        running_vm(vm=vm)
         if wsl2_guest:
             verify_wsl2_guest_works(vm=vm)
         vms_and_pids.update(start_process_in_guest(vm=vm, os_type=os_type))
@@ -6,12 +6,7 @@ import logging
 
 import pytest
 
-from utilities.virt import (
-    VirtualMachineForTests,
-    fedora_vm_body,
-    running_vm,
-    wait_for_vm_interfaces,
-)
+from utilities.virt import wait_for_vm_interfaces
 
 pytestmark = pytest.mark.arm64
 
@@ -19,16 +14,9 @@ LOGGER = logging.getLogger(__name__)
 
 
 @pytest.fixture()
-def vm_to_restart(unprivileged_client, namespace):
-    name = "vm-to-restart"
-    with VirtualMachineForTests(
-        client=unprivileged_client,
-        name=name,
-        namespace=namespace.name,
-        body=fedora_vm_body(name=name),
-    ) as vm:
-        running_vm(vm=vm)
-        yield vm
+def vm_to_restart(pooled_fedora_vm):
+    # Stopping and starting the VM changes its spec, so the pool replaces it after the test
+    return pooled_fedora_vm
 
 
 @pytest.mark.s390x
@@ -5,24 +5,14 @@ Check VM, VMI, POD owner references
 import pytest
 
 from tests.virt.utils import wait_for_virt_launcher_pod
-from utilities.virt import VirtualMachineForTests, fedora_vm_body
 
 pytestmark = pytest.mark.post_upgrade
 
 
 @pytest.fixture()
-def fedora_vm(admin_client, unprivileged_client, namespace):
-    name = "owner-references-vm"
-    with VirtualMachineForTests(
-        name=name,
-        namespace=namespace.name,
-        body=fedora_vm_body(name=name),
-        client=unprivileged_client,
-    ) as vm:
-        vm.start(wait=True)
-        vm.vmi.wait_until_running()
-        wait_for_virt_launcher_pod(vmi=vm.vmi, privileged_client=admin_client)
-        yield vm
+def fedora_vm(admin_client, pooled_fedora_vm):
+    wait_for_virt_launcher_pod(vmi=pooled_fedora_vm.vmi, privileged_client=admin_client)
+    return pooled_fedora_vm
 
 
 @pytest.mark.gating
@@ -15,7 +15,8 @@ from utilities.constants.timeouts import (
 )
 from utilities.hco import ResourceEditorValidateHCOReconcile
 from utilities.infra import ExecCommandOnPod, label_nodes
-from utilities.virt import migrate_vm_and_verify, running_vm
+from utilities.reaper import get_teardown_reaper
+from utilities.virt import migrate_vm_and_verify, running_vms
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -164,11 +165,9 @@ def vms_for_ksm_test(namespace, cpu_for_migration):
         node_selector_labels=KERNEL_SAMEPAGE_MERGING_TEST_LABEL,
         cpu_model=cpu_for_migration,
     )
-    for vm in vms_list:
-        running_vm(vm=vm)
+    running_vms(vms=vms_list)
     yield vms_list
-    for vm in vms_list:
-        vm.clean_up()
+    get_teardown_reaper().reap(resources=vms_list, wait=True)
 
 
 @pytest.fixture()
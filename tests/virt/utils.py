@@ -435,6 +435,7 @@ def get_or_create_golden_image_data_source(
     data_source_name = os_dict.get(DATA_SOURCE_STR, "dummy")
 
     data_source = DataSource(client=admin_client, name=data_source_name, namespace=golden_images_namespace.name)
+    # Not read from the session catalog, which may not have seen a DataSource created moments ago yet
     if data_source.exists and data_source.source.exists:
         LOGGER.info(f"DataSource {data_source_name} already exists and has a source pvc/snapshot.")
         yield data_source
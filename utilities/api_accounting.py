@@ -0,0 +1,211 @@
+"""
+Kubernetes API call accounting per test.
+
+Clients passed through `instrument_client` count every request they send, by verb and resource, with its latency.
+When accounting is enabled (`--api-calls-report`), the calls are attributed to the running test and, during setup and
+teardown (its finalizers), to the fixture being executed.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from _pytest.fixtures import FixtureDef
+    from kubernetes.dynamic import DynamicClient
+
+LOGGER = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+TOP_TESTS_IN_REPORT = 20
+NO_TEST_SCOPE = "session"
+
+_INSTRUMENTED_ATTR = "_api_accounting_instrumented"
+
+
+def _api_call_verb(method: str, name: str | None, params: dict[str, Any]) -> str:
+    method = method.upper()
+    if method == "GET":
+        if params.get("watch"):
+            return "watch"
+        return "get" if name else "list"
+    if method == "DELETE":
+        return "delete" if name else "deletecollection"
+    return {"POST": "create", "PUT": "update", "PATCH": "patch"}.get(method, method.lower())
+
+
+def _api_call_resource(path: str) -> tuple[str, str | None]:
+    """
+    Return the resource (with subresource) and object name of an API path.
+
+    For example, `/apis/kubevirt.io/v1/namespaces/ns/virtualmachines/vm/status` is ("virtualmachines/status", "vm").
+    """
+    segments = path.split("?")[0].strip("/").split("/")
+    # /api/<version>/... or /apis/<group>/<version>/...
+    segments = segments[2:] if segments[0] == "api" else segments[3:]
+    if len(segments) > 2 and segments[0] == "namespaces":
+        segments = segments[2:]
+
+    if not segments:
+        return "", None
+    resource = "/".join([segments[0], *segments[2:3]])
+    return resource, segments[1] if len(segments) > 1 else None
+
+
+class ApiCallStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.latency_histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "seconds": round(self.seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+            "latency_histogram": dict(
+                zip([f"le_{bucket}" for bucket in LATENCY_BUCKETS] + ["le_inf"], self.latency_histogram)
+            ),
+        }
+
+
+class ApiCallRecorder:
+    """
+    Record API calls per test, by "<verb> <resource>" and by fixture.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.current_test = NO_TEST_SCOPE
+        self.current_fixture: str | None = None
+        self.tests_calls: dict[str, dict[str, ApiCallStats]] = defaultdict(lambda: defaultdict(ApiCallStats))
+        self.tests_fixtures_calls: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record(self, verb: str, resource: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.tests_calls[self.current_test][f"{verb} {resource}"].add(seconds=seconds)
+            if self.current_fixture:
+                self.tests_fixtures_calls[self.current_test][self.current_fixture] += 1
+
+    def test_summary(self, test_name: str) -> tuple[int, float]:
+        """
+        Return the number of API calls of a test and their total duration in seconds.
+        """
+        with self._lock:
+            calls = list(self.tests_calls.get(test_name, {}).values())
+        return sum(stats.count for stats in calls), round(sum(stats.seconds for stats in calls), 3)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            tests = {
+                test_name: {
+                    "count": sum(stats.count for stats in calls.values()),
+                    "seconds": round(sum(stats.seconds for stats in calls.values()), 3),
+                    "calls": {call: stats.to_dict() for call, stats in sorted(calls.items())},
+                    "fixtures": dict(self.tests_fixtures_calls.get(test_name, {})),
+                }
+                for test_name, calls in self.tests_calls.items()
+            }
+
+        top_tests = sorted(tests, key=lambda test_name: tests[test_name]["count"], reverse=True)[:TOP_TESTS_IN_REPORT]
+        return {
+            "total_calls": sum(test["count"] for test in tests.values()),
+            "top_tests": [{"test": test_name, "count": tests[test_name]["count"]} for test_name in top_tests],
+            "tests": tests,
+        }
+
+
+API_CALL_RECORDER = ApiCallRecorder()
+
+
+def instrument_client(client: DynamicClient) -> DynamicClient:
+    """
+    Record the requests sent by `client` in `API_CALL_RECORDER`; calling it again on the same client is a no-op.
+
+    Args:
+        client (DynamicClient): client to instrument.
+
+    Returns:
+        DynamicClient: the same client.
+    """
+    if getattr(client, _INSTRUMENTED_ATTR, False):
+        return client
+
+    request = client.request
+
+    def _recorded_request(method: str, path: str, body: Any = None, **params: Any) -> Any:
+        start_time = time.monotonic()
+        try:
+            return request(method, path, body=body, **params)
+        finally:
+            resource, name = _api_call_resource(path=path)
+            API_CALL_RECORDER.record(
+                verb=_api_call_verb(method=method, name=name, params=params),
+                resource=resource,
+                seconds=time.monotonic() - start_time,
+            )
+
+    client.request = _recorded_request  # type: ignore[method-assign]
+    setattr(client, _INSTRUMENTED_ATTR, True)
+    return client
+
+
+@contextmanager
+def fixture_api_calls_scope(fixturedef: FixtureDef) -> Generator[None]:
+    """
+    Attribute the API calls made within the fixture setup, from any thread, to the fixture.
+
+    The calls of the fixture teardown are attributed to the fixture from its start, registered here, until
+    `end_fixture_api_calls_teardown`.
+    """
+    previous_fixture = API_CALL_RECORDER.current_fixture
+    API_CALL_RECORDER.current_fixture = fixturedef.argname
+    try:
+        yield
+    finally:
+        API_CALL_RECORDER.current_fixture = previous_fixture
+        if API_CALL_RECORDER.enabled:
+            # Finalizers run last-in first-out: this one runs before the fixture teardown code
+            fixturedef.addfinalizer(functools.partial(_start_fixture_teardown, fixture_name=fixturedef.argname))
+
+
+def _start_fixture_teardown(fixture_name: str) -> None:
+    API_CALL_RECORDER.current_fixture = fixture_name
+
+
+def end_fixture_api_calls_teardown() -> None:
+    """
+    Stop attributing the API calls to the fixture torn down; called once all its finalizers ran.
+    """
+    API_CALL_RECORDER.current_fixture = None
+
+
+def write_api_calls_report(report_path: str) -> None:
+    report = API_CALL_RECORDER.report()
+    with open(report_path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+    LOGGER.info(f"{report['total_calls']} API calls recorded, top tests: {report['top_tests'][:5]}")
+    LOGGER.info(f"API calls report written to {report_path}")
@@ -0,0 +1,161 @@
+"""
+Local cache of the downloaded artifacts.
+
+An artifact is downloaded once to the cache directory and copied from it by the later downloads, across tests and
+sessions. Cached artifacts are identified by their URL and the ETag (or Last-Modified) the server returns for it, so
+an artifact changed on the server is downloaded again; their content is stored once, by SHA-256.
+
+An interrupted download is resumed with an HTTP range request by the next download of the artifact. Workers and
+sessions downloading the same artifact concurrently wait for a single download, using a file lock.
+Artifacts served without an ETag or Last-Modified header are downloaded without the cache.
+
+The cache directory is `$CNV_TESTS_ARTIFACT_CACHE_DIR`, `~/.cache/openshift-virtualization-tests/artifacts` by default.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+import requests
+
+from utilities.constants.timeouts import TIMEOUT_1MIN
+
+LOGGER = logging.getLogger(__name__)
+
+ARTIFACT_CACHE_DIR_ENV = "CNV_TESTS_ARTIFACT_CACHE_DIR"
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def get_artifact_cache_dir() -> str:
+    return os.environ.get(ARTIFACT_CACHE_DIR_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "openshift-virtualization-tests", "artifacts"
+    )
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Generator[None]:
+    lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(lock_fd)
+
+
+def _file_sha256(file_path: str) -> Any:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest
+
+
+def _download(url: str, file_path: str, headers: dict[str, str], validator: str | None, timeout: int) -> str:
+    """
+    Download `url` to `file_path`, resuming the partial file if `validator` is set.
+
+    Returns:
+        str: SHA-256 of the downloaded file.
+    """
+    offset = os.path.getsize(file_path) if validator and os.path.exists(file_path) else 0
+    request_headers = dict(headers)
+    if offset:
+        # The server sends the whole artifact instead of the range if it changed since the partial download
+        request_headers.update({"Range": f"bytes={offset}-", "If-Range": validator})
+
+    with requests.get(url, headers=request_headers, verify=False, stream=True, timeout=timeout) as response:
+        if response.status_code == requests.codes.requested_range_not_satisfiable:
+            os.remove(file_path)
+            return _download(url=url, file_path=file_path, headers=headers, validator=validator, timeout=timeout)
+        response.raise_for_status()
+
+        if offset and response.status_code == requests.codes.partial_content:
+            LOGGER.info(f"Resuming the download of {url} from byte {offset}")
+            digest, mode = _file_sha256(file_path=file_path), "ab"
+        else:
+            digest, mode = hashlib.sha256(), "wb"
+        with open(file_path, mode) as file:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _get_cached_blob_path(cache_dir: str, index_path: str) -> str | None:
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path) as index_file:
+        index = json.load(index_file)
+    blob_path = os.path.join(cache_dir, "blobs", index["sha256"])
+    if os.path.exists(blob_path) and os.path.getsize(blob_path) == index["size"]:
+        return blob_path
+    return None
+
+
+def _write_index(index_path: str, index: dict[str, Any]) -> None:
+    tmp_index_path = f"{index_path}.tmp"
+    with open(tmp_index_path, "w") as index_file:
+        json.dump(index, index_file)
+    os.replace(tmp_index_path, index_path)
+
+
+def download_cached_artifact(
+    url: str, local_path: str | os.PathLike[str], headers: dict[str, str] | None = None, timeout: int = TIMEOUT_1MIN
+) -> str | os.PathLike[str]:
+    """
+    Download an artifact to `local_path` through the artifact cache.
+
+    Args:
+        url (str): Artifact URL.
+        local_path (str | PathLike): Path of the downloaded file; a copy the caller may modify.
+        headers (dict): HTTP request headers, e.g. authentication headers.
+        timeout (int): Timeout of the connection and of each read from the server.
+
+    Returns:
+        str | PathLike: `local_path`.
+
+    Raises:
+        requests.HTTPError: If the server returned an error.
+    """
+    headers = headers or {}
+    head_response = requests.head(url, headers=headers, verify=False, allow_redirects=True, timeout=timeout)
+    if head_response.status_code != requests.codes.method_not_allowed:
+        head_response.raise_for_status()
+    validator = head_response.headers.get("ETag") or head_response.headers.get("Last-Modified")
+
+    if not validator:
+        LOGGER.info(f"Download {url} to {local_path}, without cache: the server returns no ETag or Last-Modified")
+        _download(url=url, file_path=os.fspath(local_path), headers=headers, validator=None, timeout=timeout)
+        return local_path
+
+    cache_dir = get_artifact_cache_dir()
+    for cache_subdir in ("index", "blobs", "partial"):
+        os.makedirs(os.path.join(cache_dir, cache_subdir), exist_ok=True)
+    key = hashlib.sha256(f"{url}\n{validator}".encode()).hexdigest()
+    index_path = os.path.join(cache_dir, "index", f"{key}.json")
+
+    with _file_lock(lock_path=os.path.join(cache_dir, "partial", f"{key}.lock")):
+        if not (blob_path := _get_cached_blob_path(cache_dir=cache_dir, index_path=index_path)):
+            LOGGER.info(f"Download {url} to the artifact cache {cache_dir}")
+            # Kept on failures, for the next download to resume it
+            partial_path = os.path.join(cache_dir, "partial", f"{key}.part")
+            sha256 = _download(url=url, file_path=partial_path, headers=headers, validator=validator, timeout=timeout)
+            blob_path = os.path.join(cache_dir, "blobs", sha256)
+            # The content may already be cached for another URL; it is the same file
+            os.replace(partial_path, blob_path)
+            _write_index(
+                index_path=index_path,
+                index={"url": url, "validator": validator, "sha256": sha256, "size": os.path.getsize(blob_path)},
+            )
+
+    LOGGER.info(f"Copy {url} from the artifact cache to {local_path}")
+    shutil.copyfile(blob_path, local_path)
+    return local_path
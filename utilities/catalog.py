@@ -0,0 +1,162 @@
+"""
+Session catalog of the common templates, DataSources and DataImportCrons.
+
+The resources of a catalog kind are listed once, in all namespaces, and kept current by the shared watch stream of
+`utilities.watcher`. They are indexed by label, so looking up the templates by OS, workload, flavor and architecture
+labels, or the golden images DataSources and DataImportCrons, is served from memory instead of a list call per lookup.
+
+A change made in the cluster is seen by the catalog once its watch event arrives; a lookup sampled until it reflects
+the change (e.g. with TimeoutSampler) sees it within the sampling interval.
+
+Example:
+    get_resource_catalog(client=admin_client, resource_class=Template).list(
+        label_selector=[Template.Labels.BASE, f"{Template.Labels.ARCHITECTURE}=amd64"], namespace="openshift"
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from utilities.cluster import get_resource_class_api_version
+from utilities.constants.timeouts import TIMEOUT_1MIN
+from utilities.watcher import get_watch_stream
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from kubernetes.dynamic.resource import ResourceInstance
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+CATALOG_SYNC_TIMEOUT = TIMEOUT_1MIN
+
+ObjectKey = tuple[str, str]
+
+
+def _label_index_keys(instance: ResourceInstance) -> set[str]:
+    # Both `key` (label exists) and `key=value` selectors are served by the index
+    labels = instance.to_dict()["metadata"].get("labels") or {}
+    return {index_key for key, value in labels.items() for index_key in (key, f"{key}={value}")}
+
+
+def _parse_label_selector(label_selector: str | list[str]) -> list[str]:
+    terms = label_selector.split(",") if isinstance(label_selector, str) else label_selector
+    parsed_terms = []
+    for term in terms:
+        term = term.strip().replace("==", "=")
+        if "!" in term or " " in term:
+            raise ValueError(f"Unsupported label selector term {term}, only `key` and `key=value` are supported")
+        parsed_terms.append(term)
+    return parsed_terms
+
+
+class ResourceCatalog:
+    """
+    Objects of a kind in all namespaces, indexed by label and kept current by a watch stream.
+
+    Args:
+        client (DynamicClient): Client allowed to list/watch the kind in all namespaces.
+        resource_class (type[Resource]): Catalog kind.
+    """
+
+    def __init__(self, client: DynamicClient, resource_class: type[Resource]) -> None:
+        self.client = client
+        self.resource_class = resource_class
+        self._objects: dict[ObjectKey, ResourceInstance] = {}
+        self._label_index: dict[str, set[ObjectKey]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._stream = get_watch_stream(
+            client=client,
+            api_version=get_resource_class_api_version(client=client, resource_class=resource_class),
+            kind=resource_class.kind,
+            namespace=None,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.resource_class.kind} catalog"
+
+    def start(self) -> None:
+        """
+        Start following the kind and wait for the objects to be listed.
+        """
+        LOGGER.info(f"Starting {self}")
+        self._stream.add_listener(listener=self._on_change)
+        try:
+            self._stream.wait_for_sync(timeout=CATALOG_SYNC_TIMEOUT)
+        except Exception:
+            self._stream.remove_listener(listener=self._on_change)
+            raise
+
+    def list(
+        self, label_selector: str | list[str] | None = None, namespace: str | None = None
+    ) -> list[ResourceInstance]:
+        """
+        Return the objects matching all the label selector terms, sorted by namespace and name.
+
+        Args:
+            label_selector (str | list): Comma separated string or list of `key` or `key=value` terms.
+            namespace (str): Namespace of the objects, all namespaces if not set.
+
+        Returns:
+            list: The matching objects.
+        """
+        terms = _parse_label_selector(label_selector=label_selector) if label_selector else []
+        with self._lock:
+            keys = set(self._objects)
+            for term in terms:
+                keys &= self._label_index.get(term, set())
+            return [self._objects[key] for key in sorted(keys) if namespace is None or key[0] == namespace]
+
+    def get(self, name: str, namespace: str | None = None) -> ResourceInstance | None:
+        with self._lock:
+            return self._objects.get((namespace or "", name))
+
+    def resource(self, instance: ResourceInstance) -> Resource:
+        """
+        Return the resource object of a catalog object, without reading it from the cluster.
+        """
+        if instance.metadata.namespace:
+            return self.resource_class(  # type: ignore[call-arg]
+                client=self.client, name=instance.metadata.name, namespace=instance.metadata.namespace
+            )
+        return self.resource_class(client=self.client, name=instance.metadata.name)
+
+    def _on_change(self, event_type: str, instance: ResourceInstance) -> None:
+        key = (instance.metadata.namespace or "", instance.metadata.name)
+        with self._lock:
+            if previous_instance := self._objects.pop(key, None):
+                for index_key in _label_index_keys(instance=previous_instance):
+                    self._label_index[index_key].discard(key)
+
+            if event_type != "DELETED":
+                self._objects[key] = instance
+                for index_key in _label_index_keys(instance=instance):
+                    self._label_index[index_key].add(key)
+
+
+_CATALOGS: dict[tuple[int, str], ResourceCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_resource_catalog(client: DynamicClient, resource_class: type[Resource]) -> ResourceCatalog:
+    """
+    Return the catalog of the kind for the client, listing the kind on first use.
+
+    Args:
+        client (DynamicClient): Client allowed to list/watch the kind in all namespaces.
+        resource_class (type[Resource]): Catalog kind, e.g. Template, DataSource or DataImportCron.
+
+    Returns:
+        ResourceCatalog: The kind catalog.
+    """
+    key = (id(client), resource_class.kind)
+    with _CATALOGS_LOCK:
+        if key not in _CATALOGS:
+            catalog = ResourceCatalog(client=client, resource_class=resource_class)
+            catalog.start()
+            _CATALOGS[key] = catalog
+        return _CATALOGS[key]
@@ -2,10 +2,12 @@ from functools import cache
 from subprocess import TimeoutExpired
 
 from kubernetes.dynamic import DynamicClient
-from ocp_resources.resource import get_client
+from ocp_resources.resource import Resource, get_client
 from pyhelper_utils.shell import run_command
 from timeout_sampler import TimeoutSampler
 
+from utilities.api_accounting import instrument_client
+
 
 @cache
 def cache_admin_client() -> DynamicClient:
@@ -19,7 +21,23 @@ def cache_admin_client() -> DynamicClient:
 
     """
 
-    return get_client()
+    return instrument_client(client=get_client())
+
+
+def get_resource_class_api_version(client: DynamicClient, resource_class: type[Resource]) -> str:
+    """Return the `<group>/<version>` of a resource kind
+
+    The classes of API group resources (e.g. VirtualMachineInstance) only have `api_version` set once they were
+    listed with `get`; instances resolve it on creation, so a placeholder instance is used to resolve it.
+
+    Args:
+        client (DynamicClient): client used for the API discovery.
+        resource_class (type[Resource]): resource kind.
+
+    Returns:
+        str: the kind API version, e.g. `kubevirt.io/v1`.
+    """
+    return resource_class.api_version or resource_class(client=client, name=resource_class.kind.lower()).api_version
 
 
 def get_oc_whoami_username(*, wait_timeout: int = 30, sleep: int = 3):
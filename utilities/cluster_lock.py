@@ -0,0 +1,232 @@
+"""
+Cluster lock shared by the test sessions running against the same cluster.
+
+Every session holds a coordination.k8s.io Lease in the run in progress namespace, renewed by a heartbeat thread.
+A session declares its lock mode:
+- exclusive (default): the session may change anything on the cluster and runs alone.
+- shared: the session only changes the cluster-scoped resources it declares (HCO CR, nodes, storage classes).
+  Shared sessions run together as long as they do not declare the same resource; read-only sessions declare none.
+
+A Lease not renewed for its duration belongs to a session that ended without releasing it and is taken over.
+Concurrent sessions starting together are ordered by the creation time of their Lease: the later one backs off.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from ocp_resources.lease import Lease
+
+from utilities.constants.cluster import CNV_TEST_RUN_IN_PROGRESS, CNV_TEST_RUN_IN_PROGRESS_NS
+from utilities.constants.timeouts import TIMEOUT_5MIN
+from utilities.exceptions import ClusterLockConflictError
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from kubernetes.dynamic.resource import ResourceField
+
+LOGGER = logging.getLogger(__name__)
+
+CLUSTER_LOCK_EXCLUSIVE = "exclusive"
+CLUSTER_LOCK_SHARED = "shared"
+CLUSTER_LOCK_MODES = (CLUSTER_LOCK_EXCLUSIVE, CLUSTER_LOCK_SHARED)
+CLUSTER_LOCK_RESOURCES = ("hco", "nodes", "storage-classes")
+LOCK_MODE_ANNOTATION = f"{CNV_TEST_RUN_IN_PROGRESS}/mode"
+MUTATED_RESOURCES_ANNOTATION = f"{CNV_TEST_RUN_IN_PROGRESS}/mutated-resources"
+RUN_DATA_ANNOTATION = f"{CNV_TEST_RUN_IN_PROGRESS}/run-data"
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(tz=datetime.UTC)
+
+
+def _format_micro_time(time: datetime.datetime) -> str:
+    # Lease times are MicroTime: RFC 3339 with microseconds
+    return time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def parse_mutated_resources(mutated_resources: str | None) -> list[str]:
+    """
+    Parse a comma-separated list of the cluster-scoped resources a session mutates.
+
+    Raises:
+        ValueError: If a resource is not one of `CLUSTER_LOCK_RESOURCES`.
+    """
+    resources = [resource.strip() for resource in (mutated_resources or "").split(",") if resource.strip()]
+    if unknown_resources := set(resources) - set(CLUSTER_LOCK_RESOURCES):
+        raise ValueError(
+            f"Unknown cluster lock resources: {sorted(unknown_resources)}, supported: {list(CLUSTER_LOCK_RESOURCES)}"
+        )
+    return resources
+
+
+def locks_conflict(
+    mode: str, mutated_resources: list[str], other_mode: str, other_mutated_resources: list[str]
+) -> bool:
+    """
+    Check if two sessions can not run together on the cluster.
+    """
+    if CLUSTER_LOCK_EXCLUSIVE in (mode, other_mode):
+        return True
+
+    return bool(set(mutated_resources) & set(other_mutated_resources))
+
+
+def _is_stale(lease: ResourceField, now: datetime.datetime) -> bool:
+    renew_time = lease.spec.renewTime or lease.spec.acquireTime
+    if not renew_time:
+        return False
+
+    expiry = datetime.datetime.fromisoformat(renew_time) + datetime.timedelta(seconds=lease.spec.leaseDurationSeconds)
+    return expiry < now
+
+
+def _describe_lease(lease: ResourceField) -> str:
+    annotations = lease.metadata.annotations or {}
+    return (
+        f"Lease {lease.metadata.name} held by {lease.spec.holderIdentity}, "
+        f"mode: {annotations.get(LOCK_MODE_ANNOTATION, CLUSTER_LOCK_EXCLUSIVE)}, "
+        f"mutated resources: {annotations.get(MUTATED_RESOURCES_ANNOTATION) or None}, "
+        f"last renewed: {lease.spec.renewTime}\n{annotations.get(RUN_DATA_ANNOTATION, '')}"
+    )
+
+
+class ClusterLock:
+    """
+    Lease-based lock of the cluster by a test session.
+
+    Args:
+        client (DynamicClient): Admin client.
+        session_id (str): Test session id, used to name the Lease.
+        mode (str): `exclusive` or `shared`.
+        mutated_resources (list): Cluster-scoped resources mutated by a shared session, from `CLUSTER_LOCK_RESOURCES`.
+        run_data (dict): Session details (user, host, command) shown to the sessions blocked by this one.
+        lease_duration (int): Seconds without heartbeat after which the Lease is considered stale.
+    """
+
+    def __init__(
+        self,
+        client: DynamicClient,
+        session_id: str,
+        mode: str = CLUSTER_LOCK_EXCLUSIVE,
+        mutated_resources: list[str] | None = None,
+        run_data: dict[str, Any] | None = None,
+        lease_duration: int = TIMEOUT_5MIN,
+    ) -> None:
+        self.client = client
+        self.mode = mode
+        self.mutated_resources = [] if mode == CLUSTER_LOCK_EXCLUSIVE else sorted(mutated_resources or [])
+        self.lease_duration = lease_duration
+        self.acquired = False
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, name="cluster-lock-heartbeat", daemon=True)
+        now = _format_micro_time(time=_now())
+        self.lease = Lease(
+            client=client,
+            # Lease names must be DNS subdomains, session ids are not
+            name=f"{CNV_TEST_RUN_IN_PROGRESS}-{hashlib.sha256(session_id.encode()).hexdigest()[:12]}",
+            namespace=CNV_TEST_RUN_IN_PROGRESS_NS,
+            holder_identity=session_id,
+            acquire_time=now,
+            renew_time=now,
+            lease_duration_seconds=lease_duration,
+            annotations={
+                LOCK_MODE_ANNOTATION: self.mode,
+                MUTATED_RESOURCES_ANNOTATION: ",".join(self.mutated_resources),
+                RUN_DATA_ANNOTATION: json.dumps(run_data or {}, indent=2),
+            },
+        )
+
+    def _get_other_leases(self) -> list[ResourceField]:
+        return [
+            lease
+            for lease in Lease.get(client=self.client, namespace=CNV_TEST_RUN_IN_PROGRESS_NS, raw=True)
+            if lease.metadata.name != self.lease.name
+        ]
+
+    def _take_over_stale_leases(self) -> None:
+        now = _now()
+        for lease in self._get_other_leases():
+            if _is_stale(lease=lease, now=now):
+                LOGGER.warning(f"Taking over stale cluster lock:\n{_describe_lease(lease=lease)}")
+                Lease(client=self.client, name=lease.metadata.name, namespace=CNV_TEST_RUN_IN_PROGRESS_NS).clean_up(
+                    wait=False
+                )
+
+    def _get_conflicting_leases(self) -> list[ResourceField]:
+        own_order = (self.lease.instance.metadata.creationTimestamp, self.lease.name)
+        now = _now()
+        conflicting_leases = []
+        for lease in self._get_other_leases():
+            annotations = lease.metadata.annotations or {}
+            if (
+                (lease.metadata.creationTimestamp, lease.metadata.name) < own_order
+                and not _is_stale(lease=lease, now=now)
+                and locks_conflict(
+                    mode=self.mode,
+                    mutated_resources=self.mutated_resources,
+                    other_mode=annotations.get(LOCK_MODE_ANNOTATION, CLUSTER_LOCK_EXCLUSIVE),
+                    other_mutated_resources=parse_mutated_resources(
+                        mutated_resources=annotations.get(MUTATED_RESOURCES_ANNOTATION)
+                    ),
+                )
+            ):
+                conflicting_leases.append(lease)
+        return conflicting_leases
+
+    def acquire(self) -> None:
+        """
+        Take the cluster lock and start renewing it.
+
+        Raises:
+            ClusterLockConflictError: If a session holding a conflicting lock is running.
+        """
+        self._take_over_stale_leases()
+        self.lease.deploy()
+        # Checked after creating the Lease, so of two sessions starting together at least one sees the other
+        if conflicting_leases := self._get_conflicting_leases():
+            self.lease.clean_up(wait=False)
+            raise ClusterLockConflictError(
+                "\n".join(_describe_lease(lease=lease) for lease in conflicting_leases)
+                + "\nAfter verifying no one else is performing tests against the cluster, run:\n"
+                + "\n".join(
+                    f"'oc delete lease -n {CNV_TEST_RUN_IN_PROGRESS_NS} {lease.metadata.name}'"
+                    for lease in conflicting_leases
+                )
+            )
+
+        self.acquired = True
+        self._heartbeat_thread.start()
+        LOGGER.info(
+            f"Acquired {self.mode} cluster lock {self.lease.name}"
+            + (f", mutating: {self.mutated_resources}" if self.mode == CLUSTER_LOCK_SHARED else "")
+        )
+
+    def _heartbeat(self) -> None:
+        while not self._stop_heartbeat.wait(timeout=self.lease_duration / 3):
+            try:
+                self.lease.update(
+                    resource_dict={
+                        "metadata": {"name": self.lease.name},
+                        "spec": {"renewTime": _format_micro_time(time=_now())},
+                    }
+                )
+            except Exception as exception:
+                LOGGER.warning(f"Failed to renew cluster lock {self.lease.name}: {exception}")
+
+    def release(self) -> None:
+        """
+        Stop renewing the cluster lock and delete its Lease.
+        """
+        self._stop_heartbeat.set()
+        if self._heartbeat_thread.is_alive():
+            self._heartbeat_thread.join()
+
+        if self.acquired:
+            self.lease.clean_up(wait=False)
+            self.acquired = False
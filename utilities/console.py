@@ -3,6 +3,9 @@ import os
 import pty
 import shlex
 import subprocess
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
 
 import pexpect
 import pexpect.fdpexpect
@@ -197,3 +200,147 @@ class Console:
         Logout from shell
         """
         self.disconnect()
+
+
+class ConsoleSession:
+    """
+    A logged-in VM console kept open between commands.
+
+    The console is (re)connected on use if it was never connected, the `virtctl console` process exited (for
+    example, the VMI was migrated or another client took over the console) or the previous command failed.
+    """
+
+    def __init__(self, vm: VirtualMachine, prompt: str | list[str] | None = None) -> None:
+        self.console = Console(vm=vm, prompt=prompt)
+        self.prompt = prompt
+        self.lock = threading.Lock()
+        self._child: pexpect.fdpexpect.fdspawn | None = None
+
+    @property
+    def connected(self) -> bool:
+        proc = self.console._proc
+        return self._child is not None and proc is not None and proc.poll() is None
+
+    def connect(self) -> pexpect.fdpexpect.fdspawn:
+        if not self.connected:
+            if self._child is not None:
+                LOGGER.warning(f"{self.console.vm.name}: console session was disconnected, reconnecting")
+                self.close()
+            self._child = self.console.connect()
+        return self._child
+
+    def close(self) -> None:
+        if self._child is None:
+            return
+
+        try:
+            if self.connected:
+                self.console.disconnect()
+        except pexpect.exceptions.ExceptionPexpect:
+            LOGGER.warning(f"{self.console.vm.name}: failed to logout from console")
+        finally:
+            self._child.close()
+            self.console._terminate_proc()
+            self._child = None
+
+
+class ConsoleSessionRegistry:
+    """
+    Keep one logged-in console session per VM and serialize the commands sent through it.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[tuple[str, str], ConsoleSession] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(
+        self, vm: VirtualMachine, prompt: str | list[str] | None = None
+    ) -> Generator[pexpect.fdpexpect.fdspawn]:
+        """
+        Yield the logged-in console of `vm`, connecting it if needed.
+
+        A session that fails while in use is closed, so the next use reconnects and logs in again.
+
+        Args:
+            vm (VirtualMachine): VM to connect to.
+            prompt (str | list[str] | None): Shell prompt pattern(s) to expect.
+
+        Yields:
+            pexpect.fdpexpect.fdspawn: The console child; the caller holds the session until the context exits.
+        """
+        with self._lock:
+            vm_id = (vm.namespace, vm.name)
+            session = self._sessions.get(vm_id)
+            if session is None or session.prompt != prompt:
+                if session is not None:
+                    session.close()
+                session = self._sessions[vm_id] = ConsoleSession(vm=vm, prompt=prompt)
+
+        with session.lock:
+            child = session.connect()
+            try:
+                yield child
+            except Exception:
+                session.close()
+                raise
+
+    def close_vm_session(self, vm: VirtualMachine) -> None:
+        with self._lock:
+            session = self._sessions.pop((vm.namespace, vm.name), None)
+        if session is not None:
+            with session.lock:
+                session.close()
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            with session.lock:
+                session.close()
+
+
+_ACTIVE_REGISTRY: ConsoleSessionRegistry | None = None
+
+
+def get_console_session_registry() -> ConsoleSessionRegistry | None:
+    """
+    Return the console session registry of the active `console_sessions` scope, if any.
+    """
+    return _ACTIVE_REGISTRY
+
+
+@contextmanager
+def console_sessions() -> Generator[ConsoleSessionRegistry]:
+    """
+    Reuse logged-in VM consoles within the scope instead of logging in and out per `vm_console_run_commands` call.
+
+    Nested scopes share the outermost registry; the sessions are logged out when the outermost scope exits.
+
+    Example:
+        @pytest.fixture(scope="module")
+        def vm_console_sessions():
+            with console_sessions() as registry:
+                yield registry
+    """
+    global _ACTIVE_REGISTRY
+
+    if _ACTIVE_REGISTRY is not None:
+        yield _ACTIVE_REGISTRY
+        return
+
+    _ACTIVE_REGISTRY = ConsoleSessionRegistry()
+    try:
+        yield _ACTIVE_REGISTRY
+    finally:
+        registry, _ACTIVE_REGISTRY = _ACTIVE_REGISTRY, None
+        registry.close()
+
+
+def close_vm_console_session(vm: VirtualMachine) -> None:
+    """
+    Logout from the registered console session of `vm`, if any.
+    """
+    if _ACTIVE_REGISTRY is not None:
+        _ACTIVE_REGISTRY.close_vm_session(vm=vm)
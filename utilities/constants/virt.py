@@ -83,6 +83,14 @@ TWELVE_GI_MEMORY = "12Gi"
 
 NODE_HUGE_PAGES_1GI_KEY = "hugepages-1Gi"
 
+# Concurrent VM readiness waits in running_vms
+RUNNING_VMS_MAX_WORKERS = 10
+# Client-side rate limit of bulk VM creation (requests per second, burst)
+VM_CREATE_QPS = 20
+VM_CREATE_BURST = 40
+# VMIs per list request of namespace-wide status checks
+VMIS_LIST_PAGE_SIZE = 500
+
 # For GPU Passthrough (compute) and SR-IOV VF binding (networking).
 KERNEL_DRIVER = "vfio-pci"
 
@@ -1,9 +1,10 @@
 import datetime
 import logging
+from functools import cache
 
 from _pytest.nodes import Collector
 from pytest import Item
-from sqlalchemy import Integer, String, create_engine
+from sqlalchemy import Integer, String, create_engine, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 from utilities.data_collector import get_data_collector_base, get_scope_identifier
@@ -21,35 +22,74 @@ class CnvTestTable(Base):
     __tablename__ = "CnvTestTable"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
-    test_name: Mapped[str] = mapped_column(String(500))
+    test_name: Mapped[str] = mapped_column(String(500), index=True)
     start_time: Mapped[int] = mapped_column(Integer, nullable=False)
 
 
 class Database:
+    """
+    Tests start times database.
+
+    Start times are kept in memory and inserted in batches by `flush`, the session is expected to flush at the end of
+    each test class/module and before the database is read by another process.
+    Use `get_database` to share one instance, and so one engine and its connections, across the session.
+    """
+
     def __init__(
-        self, database_file_name: str = CNV_TEST_DB, verbose: bool = True, base_dir: str | None = None
+        self, database_file_name: str = CNV_TEST_DB, verbose: bool = False, base_dir: str | None = None
     ) -> None:
         self.database_file_path = f"{get_data_collector_base(base_dir=base_dir)}{database_file_name}"
         self.connection_string = f"sqlite:///{self.database_file_path}"
         self.verbose = verbose
         self.engine = create_engine(url=self.connection_string, echo=self.verbose)
         Base.metadata.create_all(bind=self.engine)
+        # WAL is persisted in the database file, readers are not blocked by the batched writes
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+        self._start_times: dict[str, int] = {}
+        self._pending_start_times: dict[str, int] = {}
 
     def insert_start_time(self, name: str, start_time: int) -> None:
         """
         Insert start time only if it doesn't exist.
 
+        The start time is written to the database by the next `flush`.
+
         Args:
             name (str): Test/class/module identifier.
             start_time (int): Start time in seconds since epoch.
         """
+        if name not in self._start_times:
+            self._start_times[name] = self._pending_start_times[name] = start_time
+
+    def flush(self) -> None:
+        """
+        Insert the pending start times in one transaction, keeping the start times already in the database.
+        """
+        if not self._pending_start_times:
+            return
+
         with Session(bind=self.engine) as db_session:
-            existing_entry = db_session.query(CnvTestTable).filter_by(test_name=name).first()
+            existing_names = set(
+                db_session.scalars(
+                    select(CnvTestTable.test_name).where(CnvTestTable.test_name.in_(self._pending_start_times))
+                )
+            )
+            db_session.add_all([
+                CnvTestTable(test_name=name, start_time=start_time)
+                for name, start_time in self._pending_start_times.items()
+                if name not in existing_names
+            ])
+            db_session.commit()
 
-            if not existing_entry:
-                new_entry = CnvTestTable(test_name=name, start_time=start_time)
-                db_session.add(new_entry)
-                db_session.commit()
+        self._pending_start_times.clear()
+
+    def close(self) -> None:
+        """
+        Flush the pending start times and close the database connections.
+        """
+        self.flush()
+        self.engine.dispose()
 
     def get_start_time(self, name: str) -> int | None:
         """
@@ -61,6 +101,9 @@ class Database:
         Returns:
             int | None: Start time in seconds since epoch, or None if not found.
         """
+        if name in self._start_times:
+            return self._start_times[name]
+
         with Session(bind=self.engine) as db_session:
             result = (
                 db_session.query(CnvTestTable).with_entities(CnvTestTable.start_time).filter_by(test_name=name).first()
@@ -100,3 +143,16 @@ class Database:
             LOGGER.warning(f"[DATA_COLLECTOR] Error: {db_exception} in accessing database.")
 
         return test_start_time
+
+
+@cache
+def get_database(base_dir: str | None = None) -> Database:
+    """Get the session database once and reuse it
+
+    Args:
+        base_dir (str): base directory of the database file.
+
+    Returns:
+        Database: the session database.
+    """
+    return Database(base_dir=base_dir)
@@ -0,0 +1,298 @@
+"""
+Persistent test durations history and duration-aware scheduling.
+
+Every run with `--durations-history-db` appends the setup, call and teardown durations of its tests to a SQLite
+database kept across runs. The expected duration of a test is the median of its last runs, on the same cluster profile
+when available. The expected durations are used at collection to run the longest test modules first
+(`--durations-order`) or to split the tests between several runs with balanced wall time (`--durations-shard`).
+
+Tests are ordered and sharded by module, so class and module scoped fixtures and incremental classes are kept whole.
+All the shards of a tier must read the same history to select disjoint tests.
+In parallel runs the durations are recorded by the xdist workers, which run the tests, and not by the controller.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import statistics
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import Float, Integer, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from utilities.parallel import is_xdist_controller
+
+if TYPE_CHECKING:
+    from _pytest.reports import TestReport
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CLUSTER_PROFILE = "default"
+DURATION_HISTORY_SIZE = 5
+# Expected duration of tests without history when no test has history
+DEFAULT_TEST_DURATION = 60.0
+# Time to wait for the database lock; the xdist workers of a run write their durations at the same time
+DATABASE_LOCK_TIMEOUT = 60
+
+
+class DurationsBase(DeclarativeBase):
+    pass
+
+
+class TestDurationTable(DurationsBase):
+    __tablename__ = "TestDurationTable"
+    __test__ = False
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
+    test_name: Mapped[str] = mapped_column(String(500), index=True)
+    matrix_params: Mapped[str] = mapped_column(String(500), default="")
+    cluster_profile: Mapped[str] = mapped_column(String(100))
+    setup_duration: Mapped[float] = mapped_column(Float, default=0.0)
+    call_duration: Mapped[float] = mapped_column(Float, default=0.0)
+    teardown_duration: Mapped[float] = mapped_column(Float, default=0.0)
+    outcome: Mapped[str] = mapped_column(String(20))
+    end_time: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class DurationsHistory:
+    """
+    Tests durations history database.
+
+    Args:
+        database_file_path (str): SQLite database file, created if missing.
+        cluster_profile (str): Name of the cluster profile the durations are recorded for.
+    """
+
+    def __init__(self, database_file_path: str, cluster_profile: str = DEFAULT_CLUSTER_PROFILE) -> None:
+        self.cluster_profile = cluster_profile
+        self.engine = create_engine(
+            url=f"sqlite:///{database_file_path}", connect_args={"timeout": DATABASE_LOCK_TIMEOUT}
+        )
+        DurationsBase.metadata.create_all(bind=self.engine)
+
+    def add_test_durations(self, tests_durations: list[dict]) -> None:
+        """
+        Insert the durations of a run in one transaction.
+
+        Args:
+            tests_durations (list): Dicts with the `TestDurationTable` columns, except `cluster_profile` and `end_time`.
+        """
+        end_time = int(datetime.datetime.now().strftime("%s"))
+        with Session(bind=self.engine) as db_session:
+            db_session.add_all([
+                TestDurationTable(**test_durations, cluster_profile=self.cluster_profile, end_time=end_time)
+                for test_durations in tests_durations
+            ])
+            db_session.commit()
+
+    def get_expected_durations(self, history_size: int = DURATION_HISTORY_SIZE) -> dict[str, float]:
+        """
+        Get the expected duration of the tests with history.
+
+        Only the runs on the current cluster profile are used for tests that ran on it.
+
+        Args:
+            history_size (int): Number of most recent runs of a test to take the median of.
+
+        Returns:
+            dict: Test node id to expected duration in seconds.
+        """
+        profile_durations: dict[str, list[float]] = defaultdict(list)
+        all_durations: dict[str, list[float]] = defaultdict(list)
+        with Session(bind=self.engine) as db_session:
+            rows = (
+                db_session
+                .query(TestDurationTable)
+                .with_entities(
+                    TestDurationTable.test_name,
+                    TestDurationTable.cluster_profile,
+                    TestDurationTable.setup_duration
+                    + TestDurationTable.call_duration
+                    + TestDurationTable.teardown_duration,
+                )
+                .order_by(TestDurationTable.id.desc())
+                .all()
+            )
+
+        for test_name, cluster_profile, duration in rows:
+            if len(all_durations[test_name]) < history_size:
+                all_durations[test_name].append(duration)
+            if cluster_profile == self.cluster_profile and len(profile_durations[test_name]) < history_size:
+                profile_durations[test_name].append(duration)
+
+        return {
+            test_name: statistics.median(profile_durations.get(test_name) or durations)
+            for test_name, durations in all_durations.items()
+        }
+
+
+def get_items_expected_durations(items: list[pytest.Item], expected_durations: dict[str, float]) -> dict[str, float]:
+    """
+    Get the expected duration of each test; tests without history are expected to take the median known duration.
+    """
+    default_duration = statistics.median(expected_durations.values()) if expected_durations else DEFAULT_TEST_DURATION
+    return {item.nodeid: expected_durations.get(item.nodeid, default_duration) for item in items}
+
+
+def _group_items_by_module(items: list[pytest.Item]) -> dict[str, list[pytest.Item]]:
+    modules_items: dict[str, list[pytest.Item]] = defaultdict(list)
+    for item in items:
+        modules_items[item.nodeid.split("::")[0]].append(item)
+    return modules_items
+
+
+def order_items_by_duration(items: list[pytest.Item], items_durations: dict[str, float]) -> list[pytest.Item]:
+    """
+    Order the test modules from the longest to the shortest; the tests order within a module is kept.
+    """
+    modules_items = _group_items_by_module(items=items)
+    ordered_modules = sorted(
+        modules_items,
+        key=lambda module: sum(items_durations[item.nodeid] for item in modules_items[module]),
+        reverse=True,
+    )
+    return [item for module in ordered_modules for item in modules_items[module]]
+
+
+def shard_items(
+    items: list[pytest.Item], items_durations: dict[str, float], shard_index: int, shards_count: int
+) -> tuple[list[pytest.Item], list[pytest.Item]]:
+    """
+    Split the test modules into shards with balanced expected durations.
+
+    Modules are assigned longest first to the shard with the least expected duration so far.
+
+    Args:
+        items (list): Collected tests.
+        items_durations (dict): Test node id to expected duration.
+        shard_index (int): 1-based index of the shard to keep.
+        shards_count (int): Number of shards.
+
+    Returns:
+        tuple: The tests of the shard, in collection order, and the other tests.
+    """
+    modules_items = _group_items_by_module(items=items)
+    modules_durations = {
+        module: sum(items_durations[item.nodeid] for item in module_items)
+        for module, module_items in modules_items.items()
+    }
+    shards_durations = [0.0] * shards_count
+    selected_modules = set()
+    for module in sorted(modules_durations, key=lambda module: (-modules_durations[module], module)):
+        shard = shards_durations.index(min(shards_durations))
+        shards_durations[shard] += modules_durations[module]
+        if shard == shard_index - 1:
+            selected_modules.add(module)
+
+    LOGGER.info(
+        f"Shard {shard_index}/{shards_count} expected duration: {round(shards_durations[shard_index - 1])}s, "
+        f"all shards: {[round(duration) for duration in shards_durations]}"
+    )
+    keep, discard = [], []
+    for item in items:
+        (keep if item.nodeid.split("::")[0] in selected_modules else discard).append(item)
+    return keep, discard
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    """
+    Parse a `<index>/<count>` shard option value.
+    """
+    try:
+        shard_index, shards_count = (int(value) for value in shard.split("/"))
+    except ValueError as error:
+        raise ValueError(f"--durations-shard must be <index>/<count>, got {shard}") from error
+
+    if not 1 <= shard_index <= shards_count:
+        raise ValueError(f"--durations-shard index must be between 1 and {shards_count}, got {shard_index}")
+    return shard_index, shards_count
+
+
+class DurationsHistoryPlugin:
+    """
+    Record the tests durations in the history and order or shard the collected tests by expected duration.
+
+    Registered by `register_durations_history_plugin`.
+    """
+
+    def __init__(self, history: DurationsHistory, order: bool = False, shard: str | None = None) -> None:
+        self.history = history
+        self.order = order
+        self.shard = parse_shard(shard=shard) if shard else None
+        self.matrix_params: dict[str, str] = {}
+        self.tests_durations: dict[str, dict] = {}
+
+    # Run after the marker and keyword deselection, so only the tests that will run are balanced
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:
+        self.matrix_params = {item.nodeid: item.callspec.id if hasattr(item, "callspec") else "" for item in items}
+        if not (self.order or self.shard):
+            return
+
+        items_durations = get_items_expected_durations(
+            items=items, expected_durations=self.history.get_expected_durations()
+        )
+        if self.shard:
+            keep, discard = shard_items(
+                items=items, items_durations=items_durations, shard_index=self.shard[0], shards_count=self.shard[1]
+            )
+            items[:] = keep
+            if discard:
+                config.hook.pytest_deselected(items=discard)
+        if self.order:
+            items[:] = order_items_by_duration(items=items, items_durations=items_durations)
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        test_durations = self.tests_durations.setdefault(
+            report.nodeid,
+            {
+                "test_name": report.nodeid,
+                "matrix_params": self.matrix_params.get(report.nodeid, ""),
+                "outcome": "passed",
+            },
+        )
+        test_durations[f"{report.when}_duration"] = report.duration
+        if report.failed:
+            test_durations["outcome"] = "error" if report.when != "call" else "failed"
+        elif report.skipped and test_durations["outcome"] == "passed":
+            test_durations["outcome"] = "skipped"
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if self.tests_durations:
+            self.history.add_test_durations(tests_durations=list(self.tests_durations.values()))
+            LOGGER.info(f"Added {len(self.tests_durations)} tests durations to the history")
+
+
+def register_durations_history_plugin(config: pytest.Config) -> None:
+    """
+    Register `DurationsHistoryPlugin` when `--durations-history-db` is passed.
+
+    In parallel runs the plugin is registered on the xdist workers only. The workers collect, order and run the tests;
+    the controller gets the reports of every worker, so it would record each test a second time.
+
+    Raises:
+        ValueError: If `--durations-order` or `--durations-shard` is passed without `--durations-history-db`.
+    """
+    durations_history_db = config.getoption("durations_history_db")
+    if not durations_history_db:
+        if config.getoption("durations_order") or config.getoption("durations_shard"):
+            raise ValueError("--durations-order and --durations-shard require --durations-history-db")
+        return
+
+    if is_xdist_controller(config=config):
+        return
+
+    config.pluginmanager.register(
+        plugin=DurationsHistoryPlugin(
+            history=DurationsHistory(
+                database_file_path=durations_history_db,
+                cluster_profile=config.getoption("durations_cluster_profile"),
+            ),
+            order=config.getoption("durations_order"),
+            shard=config.getoption("durations_shard"),
+        ),
+        name="durations_history",
+    )
@@ -0,0 +1,194 @@
+"""
+Session cache of the images imported to DataVolumes.
+
+With --dv-source-cache, an artifactory image requested by `create_dv` is imported once per session for each storage
+class, volume mode, access mode and size: the first request imports the image to a reference DataVolume of the cache
+namespace, and this request and the later ones get a DataVolume cloned from the reference PVC. CDI clones with the
+clone strategy of the storage profile, i.e. from a CSI snapshot or a CSI clone where the storage supports it, which
+takes seconds instead of the minutes (up to an hour for Windows) of an import.
+
+DataVolumes with a custom secret or certificate ConfigMap, a preallocation setting or a content type other than
+kubevirt are always imported. The CDI import tests must not be run with the cache, since their DataVolumes are cloned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ocp_resources.cluster_role import ClusterRole
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.namespace import Namespace
+from ocp_resources.role_binding import RoleBinding
+
+import utilities.artifactory
+import utilities.storage
+from utilities.cluster import cache_admin_client
+from utilities.constants.storage import BIND_IMMEDIATE_ANNOTATION
+from utilities.constants.timeouts import TIMEOUT_2MIN, TIMEOUT_60MIN
+from utilities.parallel import get_worker_namespace_name
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+
+LOGGER = logging.getLogger(__name__)
+
+DV_SOURCE_CACHE_NAMESPACE = "dv-source-cache"
+CACHED_SOURCES = ("http", "registry")
+
+
+@dataclass(frozen=True)
+class DataVolumeSourceKey:
+    source: str
+    url: str
+    storage_class: str
+    volume_mode: str | None
+    access_modes: str | None
+    size: str
+
+    @property
+    def dv_name(self) -> str:
+        return f"{self.source}-{hashlib.sha256(repr(self).encode()).hexdigest()[:16]}"
+
+
+class DataVolumeSourceCache:
+    """
+    Reference DataVolumes of the imported images, cloned instead of importing the images again.
+
+    The cache is enabled by setting `enabled`.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._namespace: Namespace | None = None
+        # None for the images which failed to import to the cache
+        self._reference_dvs: dict[DataVolumeSourceKey, DataVolume | None] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[DataVolumeSourceKey, threading.Lock] = defaultdict(threading.Lock)
+
+    def get_source_dict(
+        self,
+        source: str,
+        url: str | None,
+        storage_class: str | None,
+        volume_mode: str | None,
+        access_modes: str | None,
+        size: str,
+    ) -> dict[str, Any] | None:
+        """
+        Return the source of a DataVolume cloned from the reference DataVolume of the image.
+
+        The image is imported to the reference DataVolume on the first request.
+
+        Args:
+            source (str): DataVolume source type.
+            url (str): Image URL.
+            storage_class (str): Storage class of the DataVolume.
+            volume_mode (str): Volume mode of the DataVolume.
+            access_modes (str): Access mode of the DataVolume.
+            size (str): Size of the DataVolume.
+
+        Returns:
+            dict | None: PVC clone source, or None if the image must be imported.
+        """
+        if not (self.enabled and source in CACHED_SOURCES and url and storage_class):
+            return None
+
+        key = DataVolumeSourceKey(
+            source=source,
+            url=url,
+            storage_class=storage_class,
+            volume_mode=volume_mode,
+            access_modes=access_modes,
+            size=size,
+        )
+        with self._lock:
+            key_lock = self._key_locks[key]
+        # Concurrent requests of the same image wait for a single import
+        with key_lock:
+            if key not in self._reference_dvs:
+                self._reference_dvs[key] = self._import(key=key)
+
+        if reference_dv := self._reference_dvs[key]:
+            LOGGER.info(f"DataVolume source {url} is cloned from {reference_dv.namespace}/{reference_dv.name}")
+            return {"pvc": {"name": reference_dv.name, "namespace": reference_dv.namespace}}
+        return None
+
+    def clean_up(self) -> None:
+        """
+        Delete the cache namespace and its reference DataVolumes.
+        """
+        with self._lock:
+            if self._namespace:
+                LOGGER.info(f"Deleting DataVolume source cache namespace {self._namespace.name}")
+                self._namespace.clean_up(wait=False)
+                self._namespace = None
+            self._reference_dvs.clear()
+
+    def _import(self, key: DataVolumeSourceKey) -> DataVolume | None:
+        admin_client = cache_admin_client()
+        namespace = self._get_namespace(admin_client=admin_client)
+        LOGGER.info(f"Importing {key.url} to the DataVolume source cache, storage class {key.storage_class}")
+        reference_dv = DataVolume(
+            name=key.dv_name,
+            namespace=namespace.name,
+            client=admin_client,
+            size=key.size,
+            storage_class=key.storage_class,
+            access_modes=key.access_modes,
+            volume_mode=key.volume_mode,
+            # No first consumer is created for the reference DataVolume
+            annotations=BIND_IMMEDIATE_ANNOTATION,
+            api_name="storage",
+            source_dict=utilities.storage.construct_datavolume_source_dict(
+                source=key.source,
+                url=key.url,
+                secret_name=utilities.artifactory.get_artifactory_secret(
+                    namespace=namespace.name, client=admin_client
+                ).name,
+                cert_configmap_name=utilities.artifactory.get_artifactory_config_map(
+                    namespace=namespace.name, client=admin_client
+                ).name,
+            ),
+        )
+        try:
+            reference_dv.deploy()
+            reference_dv.wait_for_dv_success(timeout=TIMEOUT_60MIN)
+        except Exception as exception:
+            LOGGER.warning(
+                f"{key.url} not imported to the DataVolume source cache, each DataVolume imports it: {exception}"
+            )
+            reference_dv.clean_up()
+            return None
+        return reference_dv
+
+    def _get_namespace(self, admin_client: DynamicClient) -> Namespace:
+        with self._lock:
+            if not self._namespace:
+                namespace = Namespace(
+                    client=admin_client, name=get_worker_namespace_name(name=DV_SOURCE_CACHE_NAMESPACE)
+                )
+                if namespace.exists:
+                    # Left by an interrupted session, its images may be outdated
+                    namespace.clean_up()
+                namespace.deploy()
+                namespace.wait_for_status(status=Namespace.Status.ACTIVE, timeout=TIMEOUT_2MIN)
+                # Unprivileged clients clone from the namespace
+                RoleBinding(
+                    client=admin_client,
+                    name=f"{DV_SOURCE_CACHE_NAMESPACE}-view",
+                    namespace=namespace.name,
+                    subjects_kind="Group",
+                    subjects_name="system:authenticated",
+                    role_ref_kind=ClusterRole.kind,
+                    role_ref_name="view",
+                ).deploy()
+                self._namespace = namespace
+            return self._namespace
+
+
+DV_SOURCE_CACHE = DataVolumeSourceCache()
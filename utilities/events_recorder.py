@@ -0,0 +1,147 @@
+"""
+Continuous recording of the Kubernetes Events of the test namespaces.
+
+Every namespace created with `create_ns` is recorded from its creation to its teardown: the shared watch stream of
+`utilities.watcher` passes each new or updated Event to the recorder, which appends it, tagged with the node id of the
+test running at that time, to `<output_dir>/<namespace>.jsonl.gz`.
+Events are kept after they expire on the cluster, and reading them does not need a must-gather.
+
+The Events stream of a namespace can also be used by a waiter to abort early, for example:
+
+    get_watch_stream(client=client, api_version="v1", kind=Event.kind, namespace=namespace).add_listener(listener)
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import logging
+import os
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TextIO
+
+from ocp_resources.event import Event
+
+from utilities.cluster import get_resource_class_api_version
+from utilities.watcher import ResourceEventListener, ResourceWatchStream, get_watch_stream
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic.resource import ResourceInstance
+    from ocp_resources.namespace import Namespace
+
+LOGGER = logging.getLogger(__name__)
+
+NO_TEST_SCOPE = "session"
+
+
+def _event_record(event: dict, test: str) -> dict:
+    involved_object = event.get("involvedObject") or {}
+    return {
+        "test": test,
+        "recorded_time": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+        "time": event.get("lastTimestamp") or event.get("eventTime") or event["metadata"].get("creationTimestamp"),
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "object": f"{involved_object.get('kind')}/{involved_object.get('name')}",
+        "count": event.get("count"),
+        "message": event.get("message"),
+    }
+
+
+@dataclass
+class _NamespaceRecording:
+    stream: ResourceWatchStream
+    listener: ResourceEventListener
+    file: TextIO
+
+
+class EventsRecorder:
+    """
+    Record the Events of the test namespaces to compressed JSON lines files, one per namespace.
+
+    Recording is enabled by setting `output_dir`.
+    """
+
+    def __init__(self) -> None:
+        self.output_dir: str | None = None
+        self.current_test = NO_TEST_SCOPE
+        self._recordings: dict[str, _NamespaceRecording] = {}
+        self._lock = threading.Lock()
+
+    def start(self, namespace: Namespace) -> None:
+        """
+        Start recording the Events of `namespace`.
+
+        Args:
+            namespace (Namespace): Namespace to record; its client must be allowed to list/watch Events.
+        """
+        if not self.output_dir or namespace.name in self._recordings:
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        file_path = os.path.join(self.output_dir, f"{namespace.name}.jsonl.gz")
+        LOGGER.info(f"Recording events of namespace {namespace.name} to {file_path}")
+        stream = get_watch_stream(
+            client=namespace.client,
+            api_version=get_resource_class_api_version(client=namespace.client, resource_class=Event),
+            kind=Event.kind,
+            namespace=namespace.name,
+        )
+
+        with self._lock:
+            recording = _NamespaceRecording(
+                stream=stream,
+                listener=lambda event_type, instance: self._record(
+                    namespace=namespace.name, event_type=event_type, instance=instance
+                ),
+                # Appending keeps the events of a namespace re-created in the same session
+                file=gzip.open(filename=file_path, mode="at"),
+            )
+            self._recordings[namespace.name] = recording
+        recording.stream.add_listener(listener=recording.listener)
+
+    def stop(self, namespace_name: str) -> None:
+        """
+        Stop recording the Events of the namespace and close its recording file.
+        """
+        with self._lock:
+            recording = self._recordings.pop(namespace_name, None)
+        # Events received after the pop are not written
+        if recording:
+            recording.stream.remove_listener(listener=recording.listener)
+            recording.file.close()
+
+    def stop_all(self) -> None:
+        for namespace_name in list(self._recordings):
+            self.stop(namespace_name=namespace_name)
+
+    @contextmanager
+    def recording(self, namespace: Namespace) -> Generator[Namespace]:
+        """
+        Record the Events of `namespace` until the end of the context.
+        """
+        try:
+            self.start(namespace=namespace)
+        except Exception as exception:
+            LOGGER.warning(f"Events of namespace {namespace.name} are not recorded: {exception}")
+        try:
+            yield namespace
+        finally:
+            self.stop(namespace_name=namespace.name)
+
+    def _record(self, namespace: str, event_type: str, instance: ResourceInstance) -> None:
+        # The deletion of an Event is its expiration, not a new occurrence
+        if event_type == "DELETED":
+            return
+
+        line = json.dumps(_event_record(event=instance.to_dict(), test=self.current_test))
+        with self._lock:
+            if recording := self._recordings.get(namespace):
+                recording.file.write(f"{line}\n")
+
+
+EVENTS_RECORDER = EventsRecorder()
@@ -166,3 +166,46 @@ def raise_multiple_exceptions(exceptions):
         raise exceptions.pop()
     finally:
         raise_multiple_exceptions(exceptions=exceptions)
+
+
+class VMsNotRunningError(Exception):
+    """Exception raised when some of the VMs brought up together failed to become ready."""
+
+    def __init__(self, vm_errors: dict[str, BaseException], pending_vms: list[str] | None = None) -> None:
+        self.vm_errors = vm_errors
+        self.pending_vms = pending_vms or []
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        msg = "\n".join(
+            [f"{len(self.vm_errors)} VM(s) failed to become ready:"]
+            + [f"  {vm_name}: {type(error).__name__}: {error}" for vm_name, error in self.vm_errors.items()]
+        )
+        if self.pending_vms:
+            msg += f"\nStill waiting for (abandoned): {self.pending_vms}"
+        return msg
+
+
+class VMErrorStateError(Exception):
+    """Exception raised when a VM waited for reached an error state it does not recover from by itself."""
+
+    def __init__(self, vm_name: str, error: str, warning_events: list[str] | None = None) -> None:
+        self.vm_name = vm_name
+        self.error = error
+        self.warning_events = warning_events or []
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [f"VM {self.vm_name} is in an error state: {self.error}"]
+            + (["Warning events:"] if self.warning_events else [])
+            + [f"  {event}" for event in self.warning_events]
+        )
+
+
+class SessionResourceSetupError(Exception):
+    """Exception raised when the leader worker failed to set up a session resource shared by the workers."""
+
+
+class ClusterLockConflictError(Exception):
+    """Exception raised when a test session holding a conflicting cluster lock is running."""
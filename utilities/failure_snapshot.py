@@ -0,0 +1,227 @@
+"""
+Lightweight snapshot of the resources of a failing test.
+
+A full CNV must-gather takes minutes, even for a trivial failure. The failure snapshot dumps only what the failing test
+works with: the namespaces, VMs and DataVolumes created with `create_ns`, `VirtualMachineForTests` and `create_dv` and
+not torn down yet, the Events of their namespaces, and the VMIs status and virt-launcher pod logs of the VMs.
+The list calls, log reads and writes run concurrently, so a snapshot takes seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import yaml
+from ocp_resources.event import Event
+from ocp_resources.pod import Pod
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+from utilities.cluster import get_resource_class_api_version
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+FAILURE_SNAPSHOT_MAX_WORKERS = 10
+VIRT_LAUNCHER_LABEL_SELECTOR = "kubevirt.io=virt-launcher"
+VM_NAME_LABEL = "vm.kubevirt.io/name"
+VIRT_LAUNCHER_CONTAINER = "compute"
+
+
+def _resource_key(resource: Resource) -> tuple[str, str | None, str]:
+    return resource.kind, getattr(resource, "namespace", None), resource.name
+
+
+def _resource_namespace(resource: Resource) -> str:
+    # A Namespace is dumped under its own directory
+    return getattr(resource, "namespace", None) or resource.name
+
+
+def _write_file(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fd:
+        fd.write(content)
+
+
+def _list_items(client: DynamicClient, resource_class: type[Resource], namespace: str, **kwargs: Any) -> list[dict]:
+    return (
+        client.resources
+        .get(
+            api_version=get_resource_class_api_version(client=client, resource_class=resource_class),
+            kind=resource_class.kind,
+        )
+        .get(namespace=namespace, **kwargs)
+        .to_dict()
+        .get("items")
+        or []
+    )
+
+
+class FailureSnapshotCollector:
+    """
+    Track the resources created by the tests and dump them when a test fails.
+
+    Args:
+        max_workers (int): Maximum number of concurrent API calls and writes.
+    """
+
+    def __init__(self, max_workers: int = FAILURE_SNAPSHOT_MAX_WORKERS) -> None:
+        self.enabled = False
+        self.max_workers = max_workers
+        self._resources: dict[tuple[str, str | None, str], Resource] = {}
+        self._lock = threading.Lock()
+
+    def track(self, resource: Resource) -> None:
+        if self.enabled:
+            with self._lock:
+                self._resources[_resource_key(resource=resource)] = resource
+
+    def untrack(self, resource: Resource) -> None:
+        with self._lock:
+            self._resources.pop(_resource_key(resource=resource), None)
+
+    @contextmanager
+    def tracking(self, resource: Resource) -> Generator[Resource]:
+        """
+        Track the resource until the end of the context.
+        """
+        self.track(resource=resource)
+        try:
+            yield resource
+        finally:
+            self.untrack(resource=resource)
+
+    def collect(self, target_dir: str) -> None:
+        """
+        Dump the tracked resources, the Events of their namespaces, and the VMIs status and virt-launcher pod logs
+        of the tracked VMs under `target_dir/<namespace>`.
+        """
+        with self._lock:
+            resources = list(self._resources.values())
+        if not resources:
+            LOGGER.info("[DATA_COLLECTOR] No tracked resources for the failure snapshot")
+            return
+
+        namespaces_clients: dict[str, DynamicClient] = {}
+        namespaces_vm_names: dict[str, set[str]] = defaultdict(set)
+        for resource in resources:
+            namespace = _resource_namespace(resource=resource)
+            namespaces_clients.setdefault(namespace, resource.client)
+            if resource.kind == VirtualMachine.kind:
+                namespaces_vm_names[namespace].add(resource.name)
+
+        LOGGER.info(f"[DATA_COLLECTOR] Collecting failure snapshot of {len(resources)} resources under {target_dir}")
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="failure-snapshot") as executor:
+            tasks: dict[Future, str] = {}
+
+            def _submit(func: Callable[..., Any], description: str, **kwargs: Any) -> None:
+                tasks[executor.submit(func, **kwargs)] = description
+
+            for resource in resources:
+                _submit(
+                    func=self._dump_resource,
+                    description=f"{resource.kind} {resource.name}",
+                    resource=resource,
+                    target_dir=target_dir,
+                )
+            for namespace, client in namespaces_clients.items():
+                _submit(
+                    func=self._dump_events,
+                    description=f"{namespace} events",
+                    client=client,
+                    namespace=namespace,
+                    target_dir=target_dir,
+                )
+            launcher_pods_futures = {}
+            for namespace, vm_names in namespaces_vm_names.items():
+                _submit(
+                    func=self._dump_vmis_status,
+                    description=f"{namespace} VMIs",
+                    client=namespaces_clients[namespace],
+                    namespace=namespace,
+                    vm_names=vm_names,
+                    target_dir=target_dir,
+                )
+                launcher_pods_futures[namespace] = executor.submit(
+                    _list_items,
+                    client=namespaces_clients[namespace],
+                    resource_class=Pod,
+                    namespace=namespace,
+                    label_selector=VIRT_LAUNCHER_LABEL_SELECTOR,
+                )
+
+            for namespace, launcher_pods_future in launcher_pods_futures.items():
+                tasks[launcher_pods_future] = f"{namespace} virt-launcher pods"
+                # A failed list is logged with the other failed tasks
+                if launcher_pods_future.exception():
+                    continue
+                for pod in launcher_pods_future.result():
+                    if pod["metadata"].get("labels", {}).get(VM_NAME_LABEL) in namespaces_vm_names[namespace]:
+                        _submit(
+                            func=self._dump_pod_log,
+                            description=f"{namespace}/{pod['metadata']['name']} log",
+                            pod=Pod(
+                                client=namespaces_clients[namespace], name=pod["metadata"]["name"], namespace=namespace
+                            ),
+                            target_dir=target_dir,
+                        )
+
+            wait_futures(fs=tasks)
+
+        for future, description in tasks.items():
+            if exception := future.exception():
+                LOGGER.warning(f"[DATA_COLLECTOR] Failure snapshot of {description} failed: {exception}")
+
+    @staticmethod
+    def _dump_resource(resource: Resource, target_dir: str) -> None:
+        _write_file(
+            path=os.path.join(
+                target_dir, _resource_namespace(resource=resource), f"{resource.kind.lower()}-{resource.name}.yaml"
+            ),
+            content=yaml.dump(resource.instance.to_dict()),
+        )
+
+    @staticmethod
+    def _dump_events(client: DynamicClient, namespace: str, target_dir: str) -> None:
+        events = sorted(
+            _list_items(client=client, resource_class=Event, namespace=namespace),
+            key=lambda event: event.get("lastTimestamp") or event.get("eventTime") or "",
+        )
+        _write_file(
+            path=os.path.join(target_dir, namespace, "events.txt"),
+            content="\n".join(
+                f"{event.get('lastTimestamp') or event.get('eventTime')} {event.get('type')} {event.get('reason')} "
+                f"{event['involvedObject'].get('kind')}/{event['involvedObject'].get('name')}: {event.get('message')}"
+                for event in events
+            ),
+        )
+
+    @staticmethod
+    def _dump_vmis_status(client: DynamicClient, namespace: str, vm_names: set[str], target_dir: str) -> None:
+        vmis_status = {
+            vmi["metadata"]["name"]: vmi.get("status")
+            for vmi in _list_items(client=client, resource_class=VirtualMachineInstance, namespace=namespace)
+            if vmi["metadata"]["name"] in vm_names
+        }
+        _write_file(path=os.path.join(target_dir, namespace, "vmis-status.yaml"), content=yaml.dump(vmis_status))
+
+    @staticmethod
+    def _dump_pod_log(pod: Pod, target_dir: str) -> None:
+        _write_file(
+            path=os.path.join(target_dir, pod.namespace, f"{pod.name}-{VIRT_LAUNCHER_CONTAINER}.log"),
+            content=pod.log(container=VIRT_LAUNCHER_CONTAINER),
+        )
+
+
+FAILURE_SNAPSHOT = FailureSnapshotCollector()
@@ -0,0 +1,157 @@
+"""
+Fixture setup and teardown timing.
+
+With `--fixtures-profile-dir`, the wall time of every fixture setup and teardown is recorded, with the fixture scope
+and the tests that triggered its setups. At session end a report sorted by total time and a folded-stack file (one
+`<test module>;<scope> <fixture>;<setup|teardown> <milliseconds>` line per stack, as consumed by flamegraph.pl or
+speedscope) are written, so fixtures rebuilt far more often than expected stand out.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from _pytest.fixtures import FixtureDef
+
+LOGGER = logging.getLogger(__name__)
+
+FIXTURES_PROFILE_REPORT_FILE_NAME = "fixtures_profile.json"
+FIXTURES_PROFILE_FOLDED_FILE_NAME = "fixtures_profile.folded"
+TOP_FIXTURES_TO_LOG = 20
+SETUP_PHASE = "setup"
+TEARDOWN_PHASE = "teardown"
+
+
+@dataclass
+class FixtureTimings:
+    name: str
+    scope: str
+    baseid: str
+    setups: int = 0
+    setup_seconds: float = 0.0
+    max_setup_seconds: float = 0.0
+    teardowns: int = 0
+    teardown_seconds: float = 0.0
+    tests: list[str] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.setup_seconds + self.teardown_seconds
+
+
+class FixtureProfiler:
+    """
+    Record the setup and teardown wall time of fixtures.
+
+    Dependencies are set up before the fixture setup starts, so each timing excludes the fixtures it requests.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.current_test = "session"
+        self.fixtures: dict[tuple[str, str, str], FixtureTimings] = {}
+        # Folded stack to milliseconds
+        self.stacks: dict[str, int] = defaultdict(int)
+        self._teardown_start_times: dict[int, float] = {}
+
+    def _fixture_timings(self, fixturedef: FixtureDef) -> FixtureTimings:
+        key = (fixturedef.baseid, fixturedef.argname, fixturedef.scope)
+        if key not in self.fixtures:
+            self.fixtures[key] = FixtureTimings(
+                name=fixturedef.argname, scope=fixturedef.scope, baseid=fixturedef.baseid
+            )
+        return self.fixtures[key]
+
+    def _add_stack(self, fixturedef: FixtureDef, phase: str, seconds: float) -> None:
+        test_module = self.current_test.split("::")[0]
+        self.stacks[f"{test_module};{fixturedef.scope} {fixturedef.argname};{phase}"] += round(seconds * 1000)
+
+    @contextmanager
+    def profile_setup(self, fixturedef: FixtureDef) -> Generator[None]:
+        """
+        Time the setup of a fixture and register the start of its teardown.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            seconds = time.monotonic() - start_time
+            timings = self._fixture_timings(fixturedef=fixturedef)
+            timings.setups += 1
+            timings.setup_seconds += seconds
+            timings.max_setup_seconds = max(timings.max_setup_seconds, seconds)
+            timings.tests.append(self.current_test)
+            self._add_stack(fixturedef=fixturedef, phase=SETUP_PHASE, seconds=seconds)
+            # Finalizers run last-in first-out: this one runs before the fixture teardown code
+            fixturedef.addfinalizer(functools.partial(self._start_teardown, fixturedef=fixturedef))
+
+    def _start_teardown(self, fixturedef: FixtureDef) -> None:
+        self._teardown_start_times[id(fixturedef)] = time.monotonic()
+
+    def end_teardown(self, fixturedef: FixtureDef) -> None:
+        """
+        Record the teardown time of a fixture; called once all its finalizers ran.
+        """
+        start_time = self._teardown_start_times.pop(id(fixturedef), None)
+        if start_time is None:
+            return
+
+        seconds = time.monotonic() - start_time
+        timings = self._fixture_timings(fixturedef=fixturedef)
+        timings.teardowns += 1
+        timings.teardown_seconds += seconds
+        self._add_stack(fixturedef=fixturedef, phase=TEARDOWN_PHASE, seconds=seconds)
+
+    def report(self) -> list[dict[str, Any]]:
+        """
+        Return the fixtures timings, sorted by total setup and teardown time.
+        """
+        return [
+            {
+                **asdict(timings),
+                "setup_seconds": round(timings.setup_seconds, 3),
+                "max_setup_seconds": round(timings.max_setup_seconds, 3),
+                "teardown_seconds": round(timings.teardown_seconds, 3),
+                "total_seconds": round(timings.total_seconds, 3),
+            }
+            for timings in sorted(self.fixtures.values(), key=lambda timings: timings.total_seconds, reverse=True)
+        ]
+
+    def write_report(self, report_dir: str) -> None:
+        """
+        Write the sorted JSON report and the folded stacks file to `report_dir`.
+        """
+        os.makedirs(report_dir, exist_ok=True)
+        report = self.report()
+        with open(os.path.join(report_dir, FIXTURES_PROFILE_REPORT_FILE_NAME), "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+        with open(os.path.join(report_dir, FIXTURES_PROFILE_FOLDED_FILE_NAME), "w") as folded_file:
+            folded_file.writelines(
+                f"{stack} {milliseconds}\n" for stack, milliseconds in sorted(self.stacks.items()) if milliseconds
+            )
+
+        for timings in report[:TOP_FIXTURES_TO_LOG]:
+            LOGGER.info(
+                f"{timings['scope']} fixture {timings['name']}: {timings['total_seconds']}s total, "
+                f"{timings['setups']} setups ({timings['setup_seconds']}s), teardown {timings['teardown_seconds']}s"
+            )
+        LOGGER.info(f"Fixtures profile written to {report_dir}")
+
+
+FIXTURE_PROFILER = FixtureProfiler()
@@ -34,6 +34,7 @@ from utilities.constants.timeouts import (
     TIMEOUT_10MIN,
     TIMEOUT_30MIN,
 )
+from utilities.parallel import hold_exclusive_workers_lock, release_exclusive_workers_lock
 from utilities.ssp import (
     wait_for_at_least_one_auto_update_data_import_cron,
     wait_for_deleted_data_import_crons,
@@ -84,9 +85,14 @@ class ResourceEditorValidateHCOReconcile(ResourceEditor):
         self.wait_for_reconcile_post_update = wait_for_reconcile_post_update
         self._consecutive_checks_count = consecutive_checks_count
         self.list_resource_reconcile = list_resource_reconcile or []
+        self._holds_workers_lock = False
         LOGGER.info(f"Patches: {self.patches}")
 
     def update(self, backup_resources=False):
+        # The other xdist workers must not run tests against the edited HCO, until the edit is restored
+        if not self._holds_workers_lock:
+            hold_exclusive_workers_lock()
+            self._holds_workers_lock = True
         super().update(backup_resources=backup_resources)
         if self.wait_for_reconcile_post_update:
             wait_for_hco_conditions(
@@ -104,6 +110,9 @@ class ResourceEditorValidateHCOReconcile(ResourceEditor):
             consecutive_checks_count=self._consecutive_checks_count,
             list_dependent_crs_to_check=self.list_resource_reconcile,
         )
+        if self._holds_workers_lock:
+            release_exclusive_workers_lock()
+            self._holds_workers_lock = False
 
 
 def wait_for_hco_conditions(
@@ -0,0 +1,167 @@
+"""
+Concurrent streaming uploads of images to the CDI upload proxy.
+
+An image is memory-mapped and streamed to the upload proxy, so it is never read into memory as a whole, and many
+images are uploaded concurrently without the memory of one copy per upload.
+`upload_images` uploads a list of images to their upload targets (a DataVolume upload token each) with a bounded
+number of concurrent uploads, and logs the throughput of each upload and the aggregate throughput, as a signal of
+upload performance regressions.
+
+Example:
+    report = upload_images(
+        targets=[UploadTarget(url=uploadproxy_url, token=token, image_path=image_path) for token in tokens],
+        max_workers=4,
+    )
+    assert not report.failed_uploads, report.failed_uploads
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import requests
+
+from utilities.constants.timeouts import TIMEOUT_30MIN
+
+LOGGER = logging.getLogger(__name__)
+
+UPLOAD_MAX_WORKERS = 4
+MEGABYTE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class UploadTarget:
+    url: str
+    token: str
+    image_path: str
+
+
+@dataclass
+class UploadResult:
+    target: UploadTarget
+    size: int
+    seconds: float
+    status_code: int | None = None
+    # Set if the upload did not get a response, e.g. on a connection error
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status_code == requests.codes.ok
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.size / MEGABYTE / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class UploadReport:
+    results: list[UploadResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return sum(result.size for result in self.results if result.succeeded)
+
+    @property
+    def mb_per_sec(self) -> float:
+        """
+        Aggregate throughput of the successful uploads, over the wall-clock time of all the uploads.
+        """
+        return self.size / MEGABYTE / self.seconds if self.seconds else 0.0
+
+    @property
+    def failed_uploads(self) -> list[UploadResult]:
+        return [result for result in self.results if not result.succeeded]
+
+
+@contextmanager
+def _mapped_image(image_path: str) -> Generator[mmap.mmap | bytes]:
+    with open(image_path, "rb") as image_file:
+        # An empty file cannot be mapped
+        if not os.fstat(image_file.fileno()).st_size:
+            yield b""
+            return
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            yield image
+
+
+def stream_upload(target: UploadTarget, timeout: int = TIMEOUT_30MIN) -> UploadResult:
+    """
+    Upload an image to the upload proxy, streamed from the memory-mapped image file.
+
+    Args:
+        target (UploadTarget): Upload proxy URL, upload token and image path.
+        timeout (int): Timeout of the connection and of each read of the response.
+
+    Returns:
+        UploadResult: Upload response status code, size and duration.
+
+    Raises:
+        OSError: If the image file is not readable.
+    """
+    with _mapped_image(image_path=target.image_path) as image:
+        result = UploadResult(target=target, size=len(image), seconds=0.0)
+        start_time = time.monotonic()
+        try:
+            # A file-like body is sent in chunks, with the Content-Length of the mapping
+            response = requests.post(
+                url=target.url,
+                data=image,
+                headers={"Authorization": f"Bearer {target.token}"},
+                verify=False,
+                timeout=timeout,
+            )
+            result.status_code = response.status_code
+        except requests.RequestException as exception:
+            result.error = exception
+        result.seconds = time.monotonic() - start_time
+
+    LOGGER.info(
+        f"Upload of {target.image_path} to {target.url}: status {result.status_code or result.error}, "
+        f"{result.size / MEGABYTE:.1f} MB in {result.seconds:.1f}s ({result.mb_per_sec:.1f} MB/s)"
+    )
+    return result
+
+
+def upload_images(
+    targets: list[UploadTarget], max_workers: int = UPLOAD_MAX_WORKERS, timeout: int = TIMEOUT_30MIN
+) -> UploadReport:
+    """
+    Upload images to their upload targets concurrently.
+
+    A failed upload does not stop the others; the caller checks `UploadReport.failed_uploads`.
+
+    Args:
+        targets (list[UploadTarget]): Upload proxy URL, upload token and image path of each upload.
+        max_workers (int): Maximum number of concurrent uploads.
+        timeout (int): Timeout of the connection and of each read of the response, per upload.
+
+    Returns:
+        UploadReport: Results of the uploads, in the order of `targets`, and the aggregate throughput.
+
+    Raises:
+        OSError: If an image file is not readable.
+    """
+    report = UploadReport()
+    if not targets:
+        return report
+
+    LOGGER.info(f"Uploading {len(targets)} images, {min(max_workers, len(targets))} concurrently")
+    start_time = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-upload") as executor:
+        report.results = list(executor.map(lambda target: stream_upload(target=target, timeout=timeout), targets))
+    report.seconds = time.monotonic() - start_time
+
+    LOGGER.info(
+        f"Uploaded {len(targets) - len(report.failed_uploads)}/{len(targets)} images: "
+        f"{report.size / MEGABYTE:.1f} MB in {report.seconds:.1f}s ({report.mb_per_sec:.1f} MB/s aggregate)"
+    )
+    return report
@@ -0,0 +1,128 @@
+"""
+Namespace-scoped informer cache for frequently read resources.
+
+When enabled for a namespace, VirtualMachine, VirtualMachineInstance, Pod and DataVolume objects are kept current in
+memory by the shared list+watch streams of `utilities.watcher`, and `instance` reads of resources using
+`InformerCachedInstanceMixin` are served from memory instead of a GET per access.
+
+The cache is opt-in: reads may lag a write by the time it takes the watch event to arrive.
+Use `fresh_instance` when the read must reflect a write made by the caller.
+
+Example:
+    with informer_cache(client=admin_client, namespace=namespace.name):
+        running_vms = [vm for vm in vms if vm.vmi.status == vm.Status.RUNNING]
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.pod import Pod
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+from utilities.cluster import get_resource_class_api_version
+from utilities.watcher import ResourceWatchStream, get_watch_stream
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from kubernetes.dynamic.resource import ResourceInstance
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+INFORMER_CACHED_KINDS = (VirtualMachine, VirtualMachineInstance, Pod, DataVolume)
+
+_INFORMERS: dict[tuple[str, str, str], ResourceWatchStream] = {}
+_INFORMERS_LOCK = threading.Lock()
+
+
+def start_informer_cache(client: DynamicClient, namespace: str) -> None:
+    """
+    Start serving reads of the cached kinds in `namespace` from memory.
+
+    Args:
+        client (DynamicClient): Client used to list and watch; must be allowed to list/watch the cached kinds.
+        namespace (str): Namespace name.
+    """
+    LOGGER.info(f"Starting informer cache in namespace {namespace}")
+    with _INFORMERS_LOCK:
+        for resource_class in INFORMER_CACHED_KINDS:
+            api_version = get_resource_class_api_version(client=client, resource_class=resource_class)
+            key = (api_version, resource_class.kind, namespace)
+            if key in _INFORMERS:
+                continue
+            stream = get_watch_stream(
+                client=client,
+                api_version=api_version,
+                kind=resource_class.kind,
+                namespace=namespace,
+            )
+            stream.start_informer()
+            _INFORMERS[key] = stream
+
+
+def stop_informer_cache(namespace: str) -> None:
+    """
+    Stop serving reads in `namespace` from memory; subsequent reads are fresh GETs.
+
+    Args:
+        namespace (str): Namespace name.
+    """
+    LOGGER.info(f"Stopping informer cache in namespace {namespace}")
+    with _INFORMERS_LOCK:
+        for key in [key for key in _INFORMERS if key[2] == namespace]:
+            _INFORMERS.pop(key).stop_informer()
+
+
+@contextmanager
+def informer_cache(client: DynamicClient, namespace: str) -> Generator[None]:
+    start_informer_cache(client=client, namespace=namespace)
+    try:
+        yield
+    finally:
+        stop_informer_cache(namespace=namespace)
+
+
+def get_cached_instance(resource: Resource) -> ResourceInstance | None:
+    """
+    Return the in-memory instance of `resource`.
+
+    Args:
+        resource (Resource): Resource to look up.
+
+    Returns:
+        ResourceInstance | None: None if no informer is running for the resource kind and namespace, the informer is
+            not synced yet, or the object was not seen by the informer (for example, it was just created).
+    """
+    stream = _INFORMERS.get((resource.api_version, resource.kind, resource.namespace))
+    if stream and stream.synced:
+        return stream.get(name=resource.name)
+    return None
+
+
+class InformerCachedInstanceMixin:
+    """
+    Serve `instance` from the informer cache when enabled for the resource namespace, otherwise from the cluster.
+    """
+
+    @property
+    def instance(self) -> ResourceInstance:
+        cached_instance = get_cached_instance(resource=self)  # type: ignore[arg-type]
+        return cached_instance if cached_instance is not None else self.fresh_instance
+
+    @property
+    def fresh_instance(self) -> ResourceInstance:
+        """
+        Read the resource from the cluster, bypassing the informer cache.
+        """
+        return super().instance  # type: ignore[misc]
+
+
+class CachedVirtualMachineInstance(InformerCachedInstanceMixin, VirtualMachineInstance):
+    pass
@@ -47,6 +47,7 @@ from requests import HTTPError, Timeout, TooManyRedirects
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler, retry
 
 import utilities.virt
+from utilities.artifact_cache import download_cached_artifact
 from utilities.cluster import cache_admin_client
 from utilities.constants.architecture import (
     AMD_64,
@@ -81,6 +82,9 @@ from utilities.exceptions import (
     UrlNotFoundError,
     UtilityPodNotFoundError,
 )
+from utilities.events_recorder import EVENTS_RECORDER
+from utilities.failure_snapshot import FAILURE_SNAPSHOT
+from utilities.parallel import get_worker_namespace_name
 from utilities.ssp import guest_agent_version_parser
 
 NON_EXIST_URL = "https://noneexist.test"  # Use 'test' domain rfc6761
@@ -103,10 +107,15 @@ def create_ns(
     labels: dict[str, str] | None = None,
     teardown: bool = True,
     delete_timeout: int = TIMEOUT_6MIN,
+    worker_suffix: bool = True,
 ):
     """
     For kubemacpool labeling opt-modes, provide kmp_vm_label and admin_client as admin_client
+
+    In parallel runs, the worker id is appended to the name unless `worker_suffix` is False (well-known namespaces).
     """
+    if worker_suffix:
+        name = get_worker_namespace_name(name=name)
     if not unprivileged_client:
         with Namespace(
             client=admin_client,
@@ -116,13 +125,15 @@ def create_ns(
             delete_timeout=delete_timeout,
         ) as ns:
             ns.wait_for_status(status=Namespace.Status.ACTIVE, timeout=TIMEOUT_2MIN)
-            yield ns
+            with FAILURE_SNAPSHOT.tracking(resource=ns), EVENTS_RECORDER.recording(namespace=ns):
+                yield ns
     else:
         ProjectRequest(name=name, client=unprivileged_client, teardown=teardown).deploy()
         label_project(name=name, label=labels, admin_client=admin_client)
         ns = Namespace(client=unprivileged_client, name=name, ensure_exists=True)
 
-        yield ns
+        with FAILURE_SNAPSHOT.tracking(resource=ns), EVENTS_RECORDER.recording(namespace=ns):
+            yield ns
 
         ns.client = admin_client
         if teardown and not ns.clean_up():
@@ -693,10 +704,7 @@ def get_all_console_links(console_cli_downloads_spec_links):
 )
 def _download_file(url: str, local_file_name: str) -> str:
     urllib3.disable_warnings()  # TODO: remove this when we fix the SSL warning
-    response = requests.get(url=url, verify=False, timeout=TIMEOUT_30SEC)
-    response.raise_for_status()
-    with open(local_file_name, "wb") as file_downloaded:
-        file_downloaded.write(response.content)
+    download_cached_artifact(url=url, local_path=local_file_name, timeout=TIMEOUT_30SEC)
     return local_file_name
 
 
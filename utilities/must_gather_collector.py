@@ -0,0 +1,160 @@
+"""
+Asynchronous, coalesced must-gather collection on test failures.
+
+A must-gather takes minutes; collecting it in `pytest_exception_interact` blocks the next test, and when a shared
+fixture breaks, every failing test collects a near-identical must-gather. The collector runs the collections in a
+background thread instead. Failures within the coalescing window of the first pending one are collected once, with the
+widest `--since` and the union of the namespaces to inspect; the directories of the other failures point to it.
+`wait` collects the pending failures and joins the thread at session end.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shlex
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pyhelper_utils.shell import run_command
+
+from utilities.constants.timeouts import TIMEOUT_1MIN
+from utilities.data_collector import collect_default_cnv_must_gather_with_vm_gather, write_to_file
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+
+LOGGER = logging.getLogger(__name__)
+
+INSPECT_BASE_COMMAND = "oc adm inspect"
+MUST_GATHER_LOCATION_FILE_NAME = "must_gather_location.txt"
+
+
+@dataclass
+class MustGatherRequest:
+    test_name: str
+    since_time: int
+    target_dir: str
+    inspect_resources: list[str] = field(default_factory=list)
+    requested_at: float = field(default_factory=time.monotonic)
+
+
+class MustGatherCollector:
+    """
+    Collect must-gathers for test failures in a background thread, coalescing close failures.
+
+    Args:
+        coalesce_window (int): Seconds to wait after a failure for more failures to collect together.
+    """
+
+    def __init__(self, coalesce_window: int = TIMEOUT_1MIN) -> None:
+        self.coalesce_window = coalesce_window
+        self.admin_client: DynamicClient | None = None
+        self._pending: list[MustGatherRequest] = []
+        self._closing = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def request(
+        self,
+        admin_client: DynamicClient,
+        test_name: str,
+        since_time: int,
+        target_dir: str,
+        inspect_resources: list[str] | None = None,
+    ) -> None:
+        """
+        Queue a must-gather collection for a failed test.
+
+        Args:
+            admin_client (DynamicClient): Admin client.
+            test_name (str): Failed test name.
+            since_time (int): Seconds before now to collect the logs from.
+            target_dir (str): Directory to collect into.
+            inspect_resources (list, optional): Resources to `oc adm inspect`, e.g. `namespace/openshift-storage`.
+        """
+        with self._condition:
+            self.admin_client = admin_client
+            self._pending.append(
+                MustGatherRequest(
+                    test_name=test_name,
+                    since_time=since_time,
+                    target_dir=target_dir,
+                    inspect_resources=inspect_resources or [],
+                )
+            )
+            if not self._thread:
+                self._closing = False
+                self._thread = threading.Thread(target=self._run, name="must-gather-collector", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        LOGGER.info(f"[DATA_COLLECTOR] Must-gather collection queued for {test_name}")
+
+    def _next_requests(self) -> list[MustGatherRequest]:
+        with self._condition:
+            while not (self._pending or self._closing):
+                self._condition.wait()
+            if self._pending:
+                deadline = self._pending[0].requested_at + self.coalesce_window
+                while not self._closing and (remaining := deadline - time.monotonic()) > 0:
+                    self._condition.wait(timeout=remaining)
+            requests, self._pending = self._pending, []
+            return requests
+
+    def _run(self) -> None:
+        while requests := self._next_requests():
+            self._collect(requests=requests)
+
+    def _collect(self, requests: list[MustGatherRequest]) -> None:
+        now = time.monotonic()
+        # Widest window: each request's `since` grew by the time it waited
+        since_time = max(int(request.since_time + now - request.requested_at) for request in requests)
+        inspect_resources = sorted({resource for request in requests for resource in request.inspect_resources})
+        target_dir = requests[0].target_dir
+        LOGGER.info(
+            f"[DATA_COLLECTOR] Collecting must-gather for {[request.test_name for request in requests]} "
+            f"under {target_dir}, for the last {since_time}s"
+        )
+        try:
+            collect_default_cnv_must_gather_with_vm_gather(
+                since_time=since_time, target_dir=target_dir, admin_client=self.admin_client
+            )
+            if inspect_resources:
+                inspect_command = (
+                    f"{INSPECT_BASE_COMMAND} {' '.join(inspect_resources)} --since={since_time}s "
+                    f"--dest-dir={os.path.join(target_dir, 'inspect_collection')}"
+                )
+                LOGGER.info(f"running inspect command on {inspect_command}")
+                run_command(command=shlex.split(inspect_command), check=False, verify_stderr=False)
+        except Exception as current_exception:
+            LOGGER.warning(
+                f"Failed to collect logs: {requests[0].test_name}: {current_exception} {traceback.format_exc()}"
+            )
+
+        for request in requests[1:]:
+            write_to_file(
+                file_name=MUST_GATHER_LOCATION_FILE_NAME,
+                content=f"Must-gather collected together with {requests[0].test_name} under: {target_dir}\n",
+                base_directory=request.target_dir,
+            )
+
+    def wait(self) -> None:
+        """
+        Collect the pending failures without waiting for the coalescing window, then stop the collector thread.
+        """
+        with self._condition:
+            if not self._thread:
+                return
+            self._closing = True
+            self._condition.notify()
+
+        if self._pending:
+            LOGGER.info("[DATA_COLLECTOR] Waiting for the pending must-gather collections")
+        self._thread.join()
+        self._thread = None
+
+
+MUST_GATHER_COLLECTOR = MustGatherCollector()
@@ -0,0 +1,324 @@
+"""
+Parallel test execution with pytest-xdist workers.
+
+Run with `pytest -n <workers> --dist loadfile`, so every test module runs whole on one worker:
+- Namespaces created with `create_ns` get the worker id as suffix, so workers never share a namespace.
+- Cluster-global session resources (the utility daemonset, the unprivileged user identity provider) are set up by
+  one leader worker and reused by the others; see `SessionResourceLeader`.
+- Modules with `destructive` tests run alone: the other workers finish their current module and wait; see
+  `WorkersLock`. A worker editing the HCO CR runs alone from the edit until the edit is restored, also across
+  modules, so the other workers never run tests against the edited HCO CR.
+
+Outside of xdist workers, all of the above is a no-op.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from timeout_sampler import TimeoutSampler
+
+from utilities.constants.timeouts import TIMEOUT_5SEC, TIMEOUT_30MIN
+from utilities.exceptions import SessionResourceSetupError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+LOGGER = logging.getLogger(__name__)
+
+NAMESPACE_NAME_MAX_LENGTH = 63
+EXCLUSIVE_MODULE_MARKERS = ("destructive",)
+
+
+def get_worker_id() -> str | None:
+    """
+    Return the xdist worker id (gw0, gw1, ...), or None when not running as a worker.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def is_xdist_controller(config: pytest.Config) -> bool:
+    """
+    Return True in the xdist controller process of a parallel run, which collects no tests and runs none.
+    """
+    # --numprocesses is added by pytest-xdist
+    return bool(getattr(config.option, "numprocesses", None)) and not get_worker_id()
+
+
+def get_worker_namespace_name(name: str) -> str:
+    """
+    Return the namespace name with the worker id as suffix, truncated to the namespace name length limit.
+    """
+    worker_id = get_worker_id()
+    if not worker_id:
+        return name
+
+    suffix = f"-{worker_id}"
+    return f"{name[: NAMESPACE_NAME_MAX_LENGTH - len(suffix)].rstrip('-')}{suffix}"
+
+
+def get_worker_path(path: str) -> str:
+    """
+    Return a per-worker variant of a file path (`report.json` -> `report-gw0.json`) so workers do not overwrite
+    each other's files.
+    """
+    worker_id = get_worker_id()
+    if not worker_id:
+        return path
+
+    root, extension = os.path.splitext(path)
+    return f"{root}-{worker_id}{extension}"
+
+
+def _get_coordination_dir() -> str:
+    # Shared by all the workers of a run, unique per run
+    coordination_dir = os.path.join(
+        tempfile.gettempdir(), f"cnv-tests-workers-{os.environ.get('PYTEST_XDIST_TESTRUNUID', 'local')}"
+    )
+    os.makedirs(coordination_dir, exist_ok=True)
+    return coordination_dir
+
+
+@contextmanager
+def _locked_workers_state() -> Generator[dict[str, Any]]:
+    """
+    Read and update the state shared by the workers, under an exclusive file lock.
+    """
+    state_fd = os.open(os.path.join(_get_coordination_dir(), "state.json"), os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(state_fd, fcntl.LOCK_EX)
+        with os.fdopen(os.dup(state_fd)) as state_file:
+            state = json.loads(state_file.read() or "{}")
+        yield state
+        os.ftruncate(state_fd, 0)
+        os.pwrite(state_fd, json.dumps(state).encode(), 0)
+    finally:
+        os.close(state_fd)
+
+
+class SessionResourceLeader:
+    """
+    Coordinate the workers using a cluster-global session resource.
+
+    The first worker to enter is the leader: it sets the resource up and calls `ready`; the other workers call
+    `wait_ready` and reuse it. The leader calls `wait_for_followers` before tearing the resource down, so it is not
+    deleted under workers still using it. A worker entering while the resource is torn down waits and leads a new setup.
+    Outside of xdist workers, the process is always the leader and the waits return immediately.
+
+    Example:
+        with SessionResourceLeader(name="utility-daemonset") as leader:
+            if leader.is_leader:
+                with DaemonSet(...) as daemonset:
+                    leader.ready()
+                    yield daemonset
+                    leader.wait_for_followers()
+            else:
+                leader.wait_ready()
+                yield DaemonSet(...)
+
+    Args:
+        name (str): Resource name, the same in all the workers.
+        timeout (int): Maximum time to wait for the leader setup or for the followers to be done.
+    """
+
+    def __init__(self, name: str, timeout: int = TIMEOUT_30MIN) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.worker_id = get_worker_id()
+        self.is_leader = True
+
+    def __enter__(self) -> SessionResourceLeader:
+        if self.worker_id:
+            for joined in TimeoutSampler(wait_timeout=self.timeout, sleep=TIMEOUT_5SEC, func=self._join):
+                if joined:
+                    break
+            LOGGER.info(f"{self.worker_id} is the {'leader' if self.is_leader else 'follower'} of {self.name}")
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if not self.worker_id:
+            return
+
+        with _locked_workers_state() as state:
+            resource_state = state[self.name]
+            resource_state["users"] -= 1
+            if self.is_leader:
+                if resource_state["ready"]:
+                    # Torn down, the next worker to enter sets it up again
+                    del state[self.name]
+                else:
+                    resource_state["failed"] = True
+
+    def _join(self) -> bool:
+        with _locked_workers_state() as state:
+            resource_state = state.setdefault(
+                self.name, {"leader": self.worker_id, "users": 0, "ready": False, "failed": False, "closing": False}
+            )
+            if resource_state["closing"]:
+                return False
+
+            resource_state["users"] += 1
+            self.is_leader = resource_state["leader"] == self.worker_id
+            return True
+
+    def _get_state(self) -> dict[str, Any]:
+        with _locked_workers_state() as state:
+            return state[self.name]
+
+    def ready(self) -> None:
+        """
+        Leader: the resource is set up and can be used by the other workers.
+        """
+        if self.worker_id:
+            with _locked_workers_state() as state:
+                state[self.name]["ready"] = True
+
+    def wait_ready(self) -> None:
+        """
+        Follower: wait for the leader to set the resource up.
+
+        Raises:
+            SessionResourceSetupError: If the leader failed to set the resource up.
+        """
+        if not self.worker_id:
+            return
+
+        for resource_state in TimeoutSampler(wait_timeout=self.timeout, sleep=TIMEOUT_5SEC, func=self._get_state):
+            if resource_state["failed"]:
+                raise SessionResourceSetupError(f"Leader {resource_state['leader']} failed to set up {self.name}")
+            if resource_state["ready"]:
+                return
+
+    def _close_if_unused(self) -> bool:
+        with _locked_workers_state() as state:
+            resource_state = state[self.name]
+            resource_state["closing"] = resource_state["users"] == 1
+            return resource_state["closing"]
+
+    def wait_for_followers(self) -> None:
+        """
+        Leader: wait for the other workers to be done with the resource before tearing it down.
+        """
+        if self.worker_id:
+            # Called at session teardown; workers waiting for the exclusive lock may be the ones to wait for
+            if _WORKERS_LOCK:
+                _WORKERS_LOCK.release()
+            LOGGER.info(f"Waiting for the workers using {self.name} before tearing it down")
+            for closed in TimeoutSampler(wait_timeout=self.timeout, sleep=TIMEOUT_5SEC, func=self._close_if_unused):
+                if closed:
+                    return
+
+
+class WorkersLock:
+    """
+    Shared/exclusive lock between the workers, held per test module.
+
+    Modules take the shared lock; a module holding the exclusive lock runs alone. A turnstile lock taken before
+    the shared/exclusive lock keeps workers waiting for the exclusive lock from being starved by shared holders.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._turnstile_fd = os.open(os.path.join(directory, "turnstile.lock"), os.O_RDWR | os.O_CREAT)
+        self._lock_fd = os.open(os.path.join(directory, "workers.lock"), os.O_RDWR | os.O_CREAT)
+        self.exclusive: bool | None = None
+        # Cluster-global edits not restored yet; the exclusive lock is kept past the end of the module while set
+        self.holds = 0
+
+    def acquire(self, exclusive: bool) -> None:
+        if self.exclusive == exclusive:
+            return
+
+        if self.exclusive is not None:
+            # flock lock conversion is not atomic, release first to not hold the lock while waiting on the turnstile
+            self.release()
+
+        if exclusive:
+            LOGGER.info("Waiting for the other workers to finish their test modules")
+        fcntl.flock(self._turnstile_fd, fcntl.LOCK_EX)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        finally:
+            fcntl.flock(self._turnstile_fd, fcntl.LOCK_UN)
+        self.exclusive = exclusive
+
+    def release(self) -> None:
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        self.exclusive = None
+
+    def close(self) -> None:
+        self.release()
+        os.close(self._turnstile_fd)
+        os.close(self._lock_fd)
+
+
+_WORKERS_LOCK: WorkersLock | None = None
+
+
+def hold_exclusive_workers_lock() -> None:
+    """
+    Run alone until the matching `release_exclusive_workers_lock`, across test modules; called before editing
+    cluster-global configuration.
+    """
+    if _WORKERS_LOCK:
+        _WORKERS_LOCK.acquire(exclusive=True)
+        _WORKERS_LOCK.holds += 1
+
+
+def release_exclusive_workers_lock() -> None:
+    """
+    Release a hold of `hold_exclusive_workers_lock`, called once the edit is restored; the exclusive lock is released
+    at the end of the current test module if no other hold is left.
+    """
+    if _WORKERS_LOCK and _WORKERS_LOCK.holds:
+        _WORKERS_LOCK.holds -= 1
+
+
+def _get_module_id(item: pytest.Item) -> str:
+    return item.nodeid.split("::")[0]
+
+
+class ParallelWorkerPlugin:
+    """
+    Hold the workers lock for each test module; registered in `pytest_configure` on xdist workers.
+    """
+
+    def __init__(self) -> None:
+        self.exclusive_modules: set[str] = set()
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        global _WORKERS_LOCK
+
+        _WORKERS_LOCK = WorkersLock(directory=_get_coordination_dir())
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        self.exclusive_modules = {
+            _get_module_id(item=item)
+            for item in items
+            if any(item.get_closest_marker(name=marker) for marker in EXCLUSIVE_MODULE_MARKERS)
+        }
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: pytest.Item | None) -> Generator[None]:
+        module_id = _get_module_id(item=item)
+        if _WORKERS_LOCK.exclusive is None:
+            _WORKERS_LOCK.acquire(exclusive=module_id in self.exclusive_modules)
+
+        yield
+
+        if (nextitem is None or _get_module_id(item=nextitem) != module_id) and not _WORKERS_LOCK.holds:
+            _WORKERS_LOCK.release()
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        global _WORKERS_LOCK
+
+        if _WORKERS_LOCK:
+            _WORKERS_LOCK.close()
+            _WORKERS_LOCK = None
@@ -25,13 +25,13 @@ from xml.etree import ElementTree
 
 import pytest
 from kubernetes.dynamic import DynamicClient
-from ocp_resources.config_map import ConfigMap
 from ocp_resources.namespace import Namespace
 from ocp_resources.resource import ResourceEditor
 from pytest_testconfig import config as py_config
 
 from utilities.architecture import get_cluster_architecture
 from utilities.bitwarden import get_cnv_tests_secret_by_name
+from utilities.cluster_lock import ClusterLock, parse_mutated_resources
 from utilities.constants.architecture import (
     AMD_64,
     MULTIARCH,
@@ -39,7 +39,6 @@ from utilities.constants.architecture import (
     SUPPORTED_MULTIARCH_OPTIONS,
 )
 from utilities.constants.cluster import (
-    CNV_TEST_RUN_IN_PROGRESS,
     CNV_TEST_RUN_IN_PROGRESS_NS,
     CNV_TESTS_CONTAINER,
     POD_SECURITY_NAMESPACE_LABELS,
@@ -54,7 +53,11 @@ from utilities.data_collector import (
     get_data_collector_base_directory,
     write_to_file,
 )
-from utilities.exceptions import MissingEnvironmentVariableError, UnsupportedCPUArchitectureError
+from utilities.exceptions import (
+    ClusterLockConflictError,
+    MissingEnvironmentVariableError,
+    UnsupportedCPUArchitectureError,
+)
 from utilities.os_utils import (
     generate_latest_os_dict,
     generate_linux_instance_type_os_matrix,
@@ -319,18 +322,35 @@ def reorder_early_fixtures(metafunc):
             break
 
 
-def stop_if_run_in_progress(client: DynamicClient) -> None:
-    run_in_progress = run_in_progress_config_map(client=client)
-    if run_in_progress.exists:
+def acquire_cluster_lock(client: DynamicClient, session: pytest.Session) -> ClusterLock:
+    """
+    Take the cluster lock of the test session, exit if a session holding a conflicting lock is running.
+
+    Args:
+        client (DynamicClient): Admin client.
+        session (pytest.Session): Test session, with the `--cluster-lock-mode` and `--cluster-lock-mutates` options.
+
+    Returns:
+        ClusterLock: The acquired lock, to release at session finish.
+    """
+    cluster_lock = ClusterLock(
+        client=client,
+        session_id=session.config.option.session_id,
+        mode=session.config.getoption("cluster_lock_mode"),
+        mutated_resources=parse_mutated_resources(mutated_resources=session.config.getoption("cluster_lock_mutates")),
+        run_data=get_current_running_data(session=session),
+    )
+    try:
+        cluster_lock.acquire()
+    except ClusterLockConflictError as error:
         exit_pytest_execution(
-            log_message=f"openshift-virtualization-tests run already in progress: \n{run_in_progress.instance.data}"
-            f"\nAfter verifying no one else is performing tests against the cluster, run:"
-            f"\n'oc delete configmap -n {run_in_progress.namespace} {run_in_progress.name}'",
+            log_message=f"openshift-virtualization-tests run already in progress: \n{error}",
             return_code=100,
             message="openshift-virtualization-tests run already in progress",
             filename="cnv_tests_run_in_progress_failure.txt",
             admin_client=client,
         )
+    return cluster_lock
 
 
 def deploy_run_in_progress_namespace(client: DynamicClient) -> Namespace:
@@ -342,19 +362,6 @@ def deploy_run_in_progress_namespace(client: DynamicClient) -> Namespace:
     return run_in_progress_namespace
 
 
-def deploy_run_in_progress_config_map(client: DynamicClient, session) -> None:
-    run_in_progress_config_map(client=client, session=session).deploy(wait=True)
-
-
-def run_in_progress_config_map(client: DynamicClient, session=None) -> ConfigMap:
-    return ConfigMap(
-        client=client,
-        name=CNV_TEST_RUN_IN_PROGRESS,
-        namespace=CNV_TEST_RUN_IN_PROGRESS_NS,
-        data=get_current_running_data(session=session) if session else None,
-    )
-
-
 def get_current_running_data(session):
     return {
         "user": getpass.getuser(),
@@ -0,0 +1,51 @@
+"""
+Client-side rate limiting of API requests.
+
+Bulk operations (creating or deleting hundreds of VMs) submitted from a thread pool would otherwise hit the API
+server as fast as the pool allows; a shared `TokenBucket` caps them at a sustained rate with a bounded burst, like the
+QPS/burst settings of client-go.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Up to `burst` calls to `acquire` return immediately, then calls are released at `qps` per second.
+
+    Example:
+        rate_limiter = TokenBucket(qps=20, burst=40)
+        for vm in vms:
+            rate_limiter.acquire()
+            vm.deploy()
+    """
+
+    def __init__(self, qps: float, burst: int) -> None:
+        if qps <= 0 or burst < 1:
+            raise ValueError(f"qps must be positive and burst at least 1, got qps={qps}, burst={burst}")
+
+        self.qps = qps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available and consume it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.qps)
+            self._last_refill = now
+            # Reserve the token now, so waiting callers are released in order, `1 / qps` apart
+            self._tokens -= 1
+            wait_time = -self._tokens / self.qps if self._tokens < 0 else 0
+
+        if wait_time:
+            time.sleep(wait_time)
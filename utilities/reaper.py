@@ -0,0 +1,226 @@
+"""
+Concurrent teardown of test resources.
+
+Deleting resources one by one and waiting for each deletion in turn makes the teardown of large namespaces take
+minutes. The teardown reaper issues the deletes from a thread pool and waits for the deletions in the background;
+`wait` is the barrier for callers that need the resources gone, and the session reaper is drained at session end.
+
+Example:
+    reaper = get_teardown_reaper()
+    reaper.reap_collection(client=admin_client, resource_class=VirtualMachine, namespace=namespace.name)
+    reaper.reap(resources=data_volumes)
+    reaper.wait()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import TYPE_CHECKING, Any
+
+from kubernetes.dynamic.exceptions import ForbiddenError, NotFoundError
+from ocp_resources.exceptions import ResourceTeardownError
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+
+from utilities.cluster import get_resource_class_api_version
+from utilities.constants.timeouts import TIMEOUT_5SEC, TIMEOUT_10MIN
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+TEARDOWN_REAPER_MAX_WORKERS = 20
+
+
+class TeardownReaper:
+    """
+    Delete resources concurrently and track their deletion in the background.
+
+    Args:
+        max_workers (int): Maximum number of resources deleted concurrently.
+        timeout (int): Time to wait for each deletion to complete.
+    """
+
+    def __init__(self, max_workers: int = TEARDOWN_REAPER_MAX_WORKERS, timeout: int = TIMEOUT_10MIN) -> None:
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="teardown-reaper")
+        self._futures: dict[Future, str] = {}
+        self._lock = threading.Lock()
+
+    def reap(self, resources: list[Resource], wait: bool = False) -> list[Future]:
+        """
+        Delete the resources concurrently.
+
+        Resources the client is not allowed to delete are skipped, as shared resources are not owned by the test.
+
+        Args:
+            resources (list): Resources to delete; `clean_up` is called on each, so resource-specific teardown
+                (for example, stopping a VM) is kept.
+            wait (bool): Wait for the resources to be deleted; otherwise the deletion is tracked in the background.
+
+        Returns:
+            list: Futures completed when each resource is deleted.
+
+        Raises:
+            ResourceTeardownError: If `wait` is set and any of the deletions failed or timed out.
+        """
+        futures = [
+            self._submit(
+                func=self._delete_resource, description=f"{_resource.kind} {_resource.name}", resource=_resource
+            )
+            for _resource in resources
+        ]
+        if wait:
+            self.wait(futures=futures)
+        return futures
+
+    def reap_collection(
+        self,
+        client: DynamicClient,
+        resource_class: type[Resource],
+        namespace: str,
+        label_selector: str | None = None,
+    ) -> Future:
+        """
+        Delete all the resources of a kind in a namespace.
+
+        The resources are deleted with one deletecollection request.
+
+        Args:
+            client (DynamicClient): Client allowed to delete the resources.
+            resource_class (type[Resource]): Kind to delete.
+            namespace (str): Namespace name.
+            label_selector (str, optional): Delete only the resources matching the selector.
+
+        Returns:
+            Future: Completed when no matching resource is left.
+        """
+        selector_str = f" with labels {label_selector}" if label_selector else ""
+        return self._submit(
+            func=self._delete_collection,
+            description=f"{resource_class.kind} collection in {namespace}{selector_str}",
+            client=client,
+            resource_class=resource_class,
+            namespace=namespace,
+            label_selector=label_selector,
+        )
+
+    def wait(self, futures: list[Future] | None = None) -> None:
+        """
+        Wait for the deletions to complete.
+
+        Args:
+            futures (list, optional): Deletions to wait for; all the pending deletions if not set.
+
+        Raises:
+            ResourceTeardownError: If any of the deletions failed or timed out.
+        """
+        with self._lock:
+            futures_to_wait = (
+                dict(self._futures)
+                if futures is None
+                else {future: self._futures.get(future, str(future)) for future in futures}
+            )
+        if not futures_to_wait:
+            return
+
+        LOGGER.info(f"Waiting for {len(futures_to_wait)} resource deletions")
+        wait_futures(futures_to_wait)
+        with self._lock:
+            for future in futures_to_wait:
+                self._futures.pop(future, None)
+
+        failed_deletions = {
+            description: future.exception() for future, description in futures_to_wait.items() if future.exception()
+        }
+        if failed_deletions:
+            raise ResourceTeardownError(resource=failed_deletions)
+
+    def close(self) -> None:
+        """
+        Wait for the pending deletions and stop the reaper.
+        """
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _submit(self, func: Any, description: str, **kwargs: Any) -> Future:
+        LOGGER.info(f"Reaping {description}")
+        future = self._executor.submit(func, **kwargs)
+        with self._lock:
+            self._futures[future] = description
+        return future
+
+    def _delete_resource(self, resource: Resource) -> None:
+        try:
+            resource.clean_up(wait=False)
+        except ForbiddenError:
+            LOGGER.warning(f"Not allowed to delete {resource.kind} {resource.name}, skipping")
+            return
+
+        if not resource.wait_deleted(timeout=self.timeout):
+            raise TimeoutExpiredError(f"{resource.kind} {resource.name} was not deleted")
+
+    def _delete_collection(
+        self,
+        client: DynamicClient,
+        resource_class: type[Resource],
+        namespace: str,
+        label_selector: str | None,
+    ) -> None:
+        resource_api = client.resources.get(
+            api_version=get_resource_class_api_version(client=client, resource_class=resource_class),
+            kind=resource_class.kind,
+        )
+        # The dynamic client requires a selector for deletecollection; the namespace field selector matches all the
+        # resources of the namespace
+        selector = (
+            {"label_selector": label_selector}
+            if label_selector
+            else {"field_selector": f"metadata.namespace={namespace}"}
+        )
+        try:
+            resource_api.delete(namespace=namespace, **selector)
+        except NotFoundError:
+            return
+
+        for remaining_resources in TimeoutSampler(
+            wait_timeout=self.timeout,
+            sleep=TIMEOUT_5SEC,
+            func=lambda: resource_api.get(namespace=namespace, label_selector=label_selector).items,
+        ):
+            if not remaining_resources:
+                return
+
+
+_TEARDOWN_REAPER: TeardownReaper | None = None
+_TEARDOWN_REAPER_LOCK = threading.Lock()
+
+
+def get_teardown_reaper() -> TeardownReaper:
+    """
+    Return the session teardown reaper; its pending deletions are waited for by `wait_for_teardown_reaper`.
+    """
+    global _TEARDOWN_REAPER
+
+    with _TEARDOWN_REAPER_LOCK:
+        if _TEARDOWN_REAPER is None:
+            _TEARDOWN_REAPER = TeardownReaper()
+        return _TEARDOWN_REAPER
+
+
+def wait_for_teardown_reaper() -> None:
+    """
+    Session end barrier: wait for all the deletions of the session teardown reaper.
+    """
+    global _TEARDOWN_REAPER
+
+    with _TEARDOWN_REAPER_LOCK:
+        reaper, _TEARDOWN_REAPER = _TEARDOWN_REAPER, None
+    if reaper is not None:
+        reaper.close()
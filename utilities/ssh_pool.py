@@ -0,0 +1,244 @@
+"""
+Pooled SSH sessions for VMs.
+
+Each SSH command to a VM normally spawns a new `virtctl port-forward --stdio` process and performs a full SSH
+handshake. The pool keeps one authenticated transport per VM and opens a new channel on it per command.
+
+A pooled session is keyed by the VMI UID, the node it runs on and the credentials, so it is replaced when the VMI is
+restarted or migrated. Building an executor does not read the VMI from the cluster: the pooled key is compared with
+the informer cache of the namespace when it is active (see `utilities.informer`), and the VMI is only re-read once
+the pooled transport failed.
+A session whose transport is closed is reopened before the next command; a command which failed on a broken transport
+is retried on a new session only if it was not sent, as commands are not known to be idempotent.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+from typing import TYPE_CHECKING, Any
+
+from kubernetes.dynamic.exceptions import NotFoundError
+from paramiko import ChannelException, SSHException
+from rrmngmnt import ssh
+
+from utilities.informer import get_cached_instance
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic.resource import ResourceInstance
+    from ocp_resources.virtual_machine import VirtualMachine
+    from rrmngmnt import Host
+    from rrmngmnt.user import User
+
+LOGGER = logging.getLogger(__name__)
+
+SSH_TRANSPORT_ERRORS = (SSHException, EOFError, OSError, socket.timeout)
+
+
+class _PersistentSession:
+    """
+    Context manager handing out an open session without closing it on exit.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+
+    def __enter__(self) -> Any:
+        return self._session
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class PooledSSHExecutor:
+    """
+    rrmngmnt remote executor that keeps its SSH session open between commands.
+
+    Attributes not overridden here are delegated to the wrapped `ssh.RemoteExecutor`.
+    """
+
+    def __init__(self, executor: ssh.RemoteExecutor, name: str) -> None:
+        self._executor = executor
+        self._name = name
+        self._session: Any = None
+        self._lock = threading.Lock()
+        # Set when the transport of the session broke; the VMI is re-read before the executor is reused
+        self.transport_failed = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._executor, name)
+
+    def session(self, timeout: int | None = None) -> _PersistentSession:
+        return _PersistentSession(session=self._open_session(timeout=timeout))
+
+    def run_cmd(
+        self, cmd: list[str], input_: str | None = None, tcp_timeout: int | None = None, io_timeout: int | None = None
+    ) -> tuple[int, str, str]:
+        session = None
+        try:
+            session = self._open_session(timeout=tcp_timeout)
+            # The session prepends sudo to the command list in place
+            return session.run_cmd(list(cmd), input_=input_, timeout=io_timeout)
+        except SSH_TRANSPORT_ERRORS as error:
+            self.transport_failed = True
+            self.close()
+            if session is not None and not _is_channel_open_error(error=error):
+                LOGGER.warning(f"Pooled SSH session to {self._name} failed: {error}; the command may have run")
+                raise
+            LOGGER.warning(f"Pooled SSH session to {self._name} failed: {error}; reconnecting")
+            return self._open_session(timeout=tcp_timeout).run_cmd(list(cmd), input_=input_, timeout=io_timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is None:
+                return
+            LOGGER.info(f"Closing pooled SSH session to {self._name}")
+            try:
+                self._session.close()
+            except Exception as error:
+                LOGGER.warning(f"Failed to close pooled SSH session to {self._name}: {error}")
+            self._session = None
+
+    def _open_session(self, timeout: int | None) -> Any:
+        with self._lock:
+            if self._session is not None and not _session_is_active(session=self._session):
+                self.transport_failed = True
+                self._session = None
+
+            if self._session is None:
+                LOGGER.info(f"Opening pooled SSH session to {self._name}")
+                session = self._executor.session(timeout)
+                session.open()
+                self._session = session
+            return self._session
+
+
+def _session_is_active(session: Any) -> bool:
+    ssh_client = getattr(session, "_ssh", None)
+    transport = ssh_client.get_transport() if ssh_client else None
+    # The transport of a closed client is None
+    return transport is not None and transport.is_active()
+
+
+def _is_channel_open_error(error: BaseException) -> bool:
+    """
+    Return True if `error` was raised opening the channel of a command, i.e. before the command was sent.
+    """
+    # Raised by paramiko's Transport.open_session on a transport which is no longer active
+    return isinstance(error, ChannelException) or (
+        isinstance(error, SSHException) and str(error) == "SSH session not active"
+    )
+
+
+_POOL: dict[tuple[str, str], tuple[tuple[Any, ...], PooledSSHExecutor]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _vmi_key(vmi_instance: ResourceInstance) -> tuple[Any, ...]:
+    return vmi_instance.metadata.uid, vmi_instance.status.nodeName
+
+
+def _credentials_key(user: User) -> tuple[Any, ...]:
+    return user.name, getattr(user, "credentials", None)
+
+
+def _vm_connection_key(vm: VirtualMachine, user: User) -> tuple[Any, ...] | None:
+    vmi_instance = get_cached_instance(resource=vm.vmi)
+    if vmi_instance is None:
+        try:
+            vmi_instance = vm.vmi.instance
+        except NotFoundError:
+            return None
+
+    return *_vmi_key(vmi_instance=vmi_instance), *_credentials_key(user=user)
+
+
+def _is_pooled_executor_current(vm: VirtualMachine, pooled_key: tuple[Any, ...], user: User) -> bool:
+    """
+    Return True if the pooled executor of `vm` can be reused without reading the VMI from the cluster.
+    """
+    pooled_vmi_key, pooled_credentials_key = pooled_key[:2], pooled_key[2:]
+    if pooled_credentials_key != _credentials_key(user=user):
+        return False
+
+    # Without an informer cache, a restart or migration is only noticed once the pooled transport fails
+    cached_vmi_instance = get_cached_instance(resource=vm.vmi)
+    return cached_vmi_instance is None or _vmi_key(vmi_instance=cached_vmi_instance) == pooled_vmi_key
+
+
+def get_pooled_executor(vm: VirtualMachine, executor: ssh.RemoteExecutor, user: User) -> PooledSSHExecutor | Any:
+    """
+    Return the pooled executor of `vm`, replacing it if the VMI or the credentials changed.
+
+    The VMI is read from the cluster only when no executor is pooled for `vm` or its transport failed.
+
+    Args:
+        vm (VirtualMachine): VM to connect to.
+        executor (ssh.RemoteExecutor): Executor to pool if no matching pooled executor exists.
+        user (User): SSH user.
+
+    Returns:
+        PooledSSHExecutor | ssh.RemoteExecutor: The pooled executor, or `executor` as-is if the VMI does not exist.
+    """
+    vm_id = (vm.namespace, vm.name)
+    with _POOL_LOCK:
+        pooled_key, pooled_executor = _POOL.get(vm_id, (None, None))
+    if (
+        pooled_executor is not None
+        and not pooled_executor.transport_failed
+        and _is_pooled_executor_current(vm=vm, pooled_key=pooled_key, user=user)
+    ):
+        return pooled_executor
+
+    key = _vm_connection_key(vm=vm, user=user)
+    if key is None:
+        return executor
+
+    with _POOL_LOCK:
+        pooled_key, pooled_executor = _POOL.get(vm_id, (None, None))
+        if pooled_executor is not None and pooled_key == key:
+            pooled_executor.transport_failed = False
+            return pooled_executor
+
+        if pooled_executor is not None:
+            LOGGER.info(f"VMI {vm.name} was restarted, migrated or credentials changed; replacing pooled SSH session")
+            pooled_executor.close()
+
+        pooled_executor = PooledSSHExecutor(executor=executor, name=f"{vm.namespace}/{vm.name}")
+        _POOL[vm_id] = (key, pooled_executor)
+        return pooled_executor
+
+
+def close_vm_ssh_session(vm: VirtualMachine) -> None:
+    """
+    Close and remove the pooled SSH session of `vm`, if any.
+    """
+    with _POOL_LOCK:
+        _, pooled_executor = _POOL.pop((vm.namespace, vm.name), (None, None))
+    if pooled_executor is not None:
+        pooled_executor.close()
+
+
+def close_all_ssh_sessions() -> None:
+    """
+    Close all the pooled SSH sessions.
+    """
+    with _POOL_LOCK:
+        pooled_executors = [pooled_executor for _, pooled_executor in _POOL.values()]
+        _POOL.clear()
+    for pooled_executor in pooled_executors:
+        pooled_executor.close()
+
+
+class PooledRemoteExecutorFactory(ssh.RemoteExecutorFactory):
+    """
+    Build executors sharing the pooled SSH session of a VM.
+    """
+
+    def __init__(self, vm: VirtualMachine, sock: str) -> None:
+        super().__init__(sock=sock)
+        self.vm = vm
+
+    def build(self, host: Host, user: User) -> PooledSSHExecutor | Any:
+        return get_pooled_executor(vm=self.vm, executor=super().build(host, user), user=user)
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 import utilities.infra
 import utilities.storage
 import utilities.virt
+from utilities.catalog import get_resource_catalog
 from utilities.constants.components import (
     SSP_KUBEVIRT_HYPERCONVERGED,
     SSP_OPERATOR,
@@ -104,7 +105,11 @@ def matrix_auto_boot_data_import_cron_prefixes():
 
 
 def get_data_import_crons(admin_client, namespace):
-    return list(DataImportCron.get(client=admin_client, namespace=namespace.name))
+    data_import_crons_catalog = get_resource_catalog(client=admin_client, resource_class=DataImportCron)
+    return [
+        data_import_crons_catalog.resource(instance=data_import_cron_instance)
+        for data_import_cron_instance in data_import_crons_catalog.list(namespace=namespace.name)
+    ]
 
 
 def get_ssp_resource(admin_client, namespace):
@@ -31,11 +31,14 @@ from pytest_testconfig import config as py_config
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler, retry
 
 import utilities.artifactory
+import utilities.dv_source_cache
 import utilities.infra
 import utilities.virt as virt_util
 from utilities import console
 from utilities.architecture import get_multiarch_cpu_arch
+from utilities.artifact_cache import download_cached_artifact
 from utilities.artifactory import get_test_artifact_server_url
+from utilities.catalog import get_resource_catalog
 from utilities.constants import Images
 from utilities.constants.components import HPP_POOL
 from utilities.constants.images import OS_FLAVOR_WINDOWS
@@ -61,6 +64,7 @@ from utilities.constants.timeouts import (
     TIMEOUT_60MIN,
 )
 from utilities.exceptions import UrlNotFoundError
+from utilities.failure_snapshot import FAILURE_SNAPSHOT
 
 HOTPLUG_VOLUME = "hotplugVolume"
 DATA_IMPORT_CRON_SUFFIX = "-image-cron"
@@ -206,6 +210,8 @@ def create_dv(
     or by building one via ``construct_datavolume_source_dict`` from the ``source`` parameter.
     When ``use_artifactory`` is True for http/registry sources, creates namespace-scoped
     Artifactory Secret and ConfigMap resources that are cleaned up on exit.
+    When the DataVolume source cache is enabled (``--dv-source-cache``), Artifactory images are cloned from a
+    reference DataVolume imported once per session instead; see ``utilities.dv_source_cache``.
 
     Args:
         dv_name: Name for the DataVolume resource.
@@ -246,31 +252,47 @@ def create_dv(
             if not source:
                 raise ValueError("'source' is required when 'source_dict' and 'source_ref' are not provided")
 
-            LOGGER.info("No 'source_dict' or 'source_ref' provided - will construct the 'source_dict'")
-
-            if source in ("http", "registry") and use_artifactory:
-                LOGGER.info(f"Creating artifactory resources for DV '{dv_name}' in namespace '{namespace}'")
-                LOGGER.info(f"DV source is '{source}' with url: {url}")
-
-                if not secret_name:
-                    artifactory_secret = utilities.artifactory.get_artifactory_secret(
-                        namespace=namespace, client=client
-                    )
-                    secret_name = artifactory_secret.name
-                if not cert_configmap_name:
-                    artifactory_config_map = utilities.artifactory.get_artifactory_config_map(
-                        namespace=namespace, client=client
-                    )
-                    cert_configmap_name = artifactory_config_map.name
-
-            source_dict = construct_datavolume_source_dict(
-                source=source,
-                url=url,
-                secret_name=secret_name,
-                cert_configmap_name=cert_configmap_name,
-                source_pvc_name=source_pvc_name,
-                source_pvc_namespace=source_pvc_namespace,
+            cacheable_source = (
+                use_artifactory
+                and not (secret_name or cert_configmap_name or preallocation)
+                and content_type in (None, DataVolume.ContentType.KUBEVIRT)
             )
+            if cacheable_source:
+                source_dict = utilities.dv_source_cache.DV_SOURCE_CACHE.get_source_dict(
+                    source=source,
+                    url=url,
+                    storage_class=storage_class,
+                    volume_mode=volume_mode,
+                    access_modes=access_modes,
+                    size=size,
+                )
+
+            if source_dict is None:
+                LOGGER.info("No 'source_dict' or 'source_ref' provided - will construct the 'source_dict'")
+
+                if source in ("http", "registry") and use_artifactory:
+                    LOGGER.info(f"Creating artifactory resources for DV '{dv_name}' in namespace '{namespace}'")
+                    LOGGER.info(f"DV source is '{source}' with url: {url}")
+
+                    if not secret_name:
+                        artifactory_secret = utilities.artifactory.get_artifactory_secret(
+                            namespace=namespace, client=client
+                        )
+                        secret_name = artifactory_secret.name
+                    if not cert_configmap_name:
+                        artifactory_config_map = utilities.artifactory.get_artifactory_config_map(
+                            namespace=namespace, client=client
+                        )
+                        cert_configmap_name = artifactory_config_map.name
+
+                source_dict = construct_datavolume_source_dict(
+                    source=source,
+                    url=url,
+                    secret_name=secret_name,
+                    cert_configmap_name=cert_configmap_name,
+                    source_pvc_name=source_pvc_name,
+                    source_pvc_namespace=source_pvc_namespace,
+                )
 
         with DataVolume(
             name=dv_name,
@@ -290,7 +312,8 @@ def create_dv(
         ) as dv:
             if storage_class and sc_volume_binding_mode_is_wffc(sc=storage_class, client=client) and consume_wffc:
                 create_dummy_first_consumer_pod(client=client, dv=dv)
-            yield dv
+            with FAILURE_SNAPSHOT.tracking(resource=dv):
+                yield dv
 
     finally:
         utilities.artifactory.cleanup_artifactory_secret_and_config_map(
@@ -411,22 +434,11 @@ def data_volume(
 @retry(wait_timeout=TIMEOUT_1MIN, sleep=TIMEOUT_1SEC)
 def get_downloaded_artifact(remote_name, local_name):
     """
-    Download image or artifact to local tmpdir path
+    Download image or artifact to local tmpdir path, through the local artifact cache
     """
-    artifactory_header = utilities.artifactory.get_artifactory_header()
     url = f"{get_test_artifact_server_url()}{remote_name}"
-    resp = requests.head(
-        url,
-        headers=artifactory_header,
-        verify=False,
-        allow_redirects=True,
-    )
-    assert resp.status_code == requests.codes.ok, f"Unable to connect to {url} with error: {resp}."
     LOGGER.info(f"Download {url} to {local_name}")
-    with requests.get(url, headers=artifactory_header, verify=False, stream=True) as created_request:
-        created_request.raise_for_status()
-        with open(local_name, "wb") as file_downloaded:
-            file_downloaded.writelines(created_request.iter_content(chunk_size=8192))
+    download_cached_artifact(url=url, local_path=local_name, headers=utilities.artifactory.get_artifactory_header())
     try:
         assert os.path.isfile(local_name)
         return True
@@ -1253,13 +1265,13 @@ def wait_for_succeeded_dv(namespace: str, dv_name: str, client: DynamicClient):
 
 
 def get_data_sources_managed_by_data_import_cron(client: DynamicClient, namespace: str) -> list[DataSource]:
-    return list(
-        DataSource.get(
-            client=client,
-            namespace=namespace,
-            label_selector=RESOURCE_MANAGED_BY_DATA_IMPORT_CRON_LABEL,
+    data_sources_catalog = get_resource_catalog(client=client, resource_class=DataSource)
+    return [
+        data_sources_catalog.resource(instance=data_source_instance)
+        for data_source_instance in data_sources_catalog.list(
+            label_selector=RESOURCE_MANAGED_BY_DATA_IMPORT_CRON_LABEL, namespace=namespace
         )
-    )
+    ]
 
 
 def verify_boot_sources_reimported(
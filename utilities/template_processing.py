@@ -0,0 +1,89 @@
+"""
+Local processing of OpenShift Templates.
+
+The parameters are substituted like the OpenShift processedtemplates API does:
+`${PARAM}` is replaced by the parameter value anywhere in a string, and a string which is only `${{PARAM}}` is replaced
+by the parameter value parsed as JSON (or by the value string if it is not valid JSON). References to undeclared
+parameters are left as is, and the template `labels` are added to the labels of every object.
+
+Parameters that the server would generate (`generate: expression` without a value) or reject (`required` without a
+value) cannot be processed locally; `process_template_locally` returns None and the template must be processed by the
+server.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+STRING_PARAMETER_REGEX = re.compile(r"\$\{([a-zA-Z0-9_]+?)\}")
+NON_STRING_PARAMETER_REGEX = re.compile(r"^\$\{\{([a-zA-Z0-9_]+)\}\}$")
+
+
+def _substitute_string(value: str, parameters: dict[str, str]) -> str:
+    return STRING_PARAMETER_REGEX.sub(lambda match: parameters.get(match[1], match[0]), value)
+
+
+def _substitute(value: Any, parameters: dict[str, str]) -> Any:
+    # New containers are returned, the template itself is not modified
+    if isinstance(value, dict):
+        return {
+            _substitute_string(value=key, parameters=parameters): _substitute(value=item, parameters=parameters)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_substitute(value=item, parameters=parameters) for item in value]
+    if isinstance(value, str):
+        if (match := NON_STRING_PARAMETER_REGEX.match(value)) and match[1] in parameters:
+            try:
+                return json.loads(parameters[match[1]])
+            except json.JSONDecodeError:
+                return parameters[match[1]]
+        return _substitute_string(value=value, parameters=parameters)
+    return value
+
+
+def get_template_parameters_values(template: dict[str, Any], parameters: dict[str, Any]) -> dict[str, str] | None:
+    """
+    Resolve the values of the template parameters.
+
+    Args:
+        template (dict): Template.
+        parameters (dict): Parameters values by name; parameters not declared by the template are ignored.
+
+    Returns:
+        dict | None: Value of every template parameter, or None if a parameter without a value must be generated or is
+            required.
+    """
+    values = {}
+    for parameter in template.get("parameters") or []:
+        name = parameter["name"]
+        value = str(parameters[name]) if name in parameters else parameter.get("value", "")
+        if not value and (parameter.get("generate") or parameter.get("required")):
+            return None
+        values[name] = value
+    return values
+
+
+def process_template_locally(template: dict[str, Any], parameters: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """
+    Process a template without the processedtemplates API.
+
+    Args:
+        template (dict): Template, not modified.
+        parameters (dict): Parameters values by name.
+
+    Returns:
+        list | None: The processed template objects, or None if the template must be processed by the server.
+    """
+    values = get_template_parameters_values(template=template, parameters=parameters)
+    if values is None:
+        return None
+
+    labels = _substitute(value=template.get("labels") or {}, parameters=values)
+    objects = _substitute(value=template.get("objects") or [], parameters=values)
+    for _object in objects:
+        if labels:
+            _object.setdefault("metadata", {}).setdefault("labels", {}).update(labels)
+    return objects
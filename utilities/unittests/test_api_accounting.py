@@ -0,0 +1,159 @@
+"""Unit tests for api_accounting module"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.api_accounting import (
+    ApiCallRecorder,
+    _api_call_resource,
+    _api_call_verb,
+    end_fixture_api_calls_teardown,
+    fixture_api_calls_scope,
+    instrument_client,
+    write_api_calls_report,
+)
+
+
+@pytest.fixture()
+def recorder():
+    api_call_recorder = ApiCallRecorder()
+    api_call_recorder.enabled = True
+    api_call_recorder.current_test = "test_a"
+    with patch("utilities.api_accounting.API_CALL_RECORDER", api_call_recorder):
+        yield api_call_recorder
+
+
+class TestApiCallClassification:
+    """Test cases for the API call verb and resource parsing"""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/api/v1/namespaces/ns/pods", ("pods", None)),
+            ("/api/v1/namespaces/ns/pods/virt-launcher-vm", ("pods", "virt-launcher-vm")),
+            ("/apis/kubevirt.io/v1/namespaces/ns/virtualmachines/vm/status", ("virtualmachines/status", "vm")),
+            ("/api/v1/namespaces/ns", ("namespaces", "ns")),
+            ("/apis/storage.k8s.io/v1/storageclasses?labelSelector=a", ("storageclasses", None)),
+        ],
+    )
+    def test_api_call_resource(self, path, expected):
+        """Test that the resource and name are parsed from namespaced and cluster scoped paths"""
+        assert _api_call_resource(path=path) == expected
+
+    @pytest.mark.parametrize(
+        "method, name, params, expected",
+        [
+            ("GET", "vm", {}, "get"),
+            ("GET", None, {}, "list"),
+            ("GET", None, {"watch": True}, "watch"),
+            ("POST", None, {}, "create"),
+            ("PATCH", "vm", {}, "patch"),
+            ("DELETE", "vm", {}, "delete"),
+            ("DELETE", None, {}, "deletecollection"),
+        ],
+    )
+    def test_api_call_verb(self, method, name, params, expected):
+        """Test that HTTP methods are mapped to Kubernetes verbs"""
+        assert _api_call_verb(method=method, name=name, params=params) == expected
+
+
+class TestInstrumentClient:
+    """Test cases for instrument_client"""
+
+    def test_requests_recorded(self, recorder):
+        """Test that the client requests are recorded by verb and resource and still return the response"""
+        client = MagicMock(spec=["request"])
+        request = client.request
+        instrument_client(client=client)
+
+        assert client.request("GET", "/api/v1/namespaces/ns/pods") is request.return_value
+        client.request("GET", "/api/v1/namespaces/ns/pods")
+        client.request("DELETE", "/api/v1/namespaces/ns/pods/pod-1")
+
+        assert recorder.test_summary(test_name="test_a")[0] == 3
+        assert recorder.tests_calls["test_a"]["list pods"].count == 2
+
+    def test_failed_requests_recorded(self, recorder):
+        """Test that requests raising an error are recorded"""
+        client = MagicMock(spec=["request"])
+        client.request.side_effect = ValueError
+        instrument_client(client=client)
+
+        with pytest.raises(ValueError):
+            client.request("GET", "/api/v1/namespaces/ns/pods/pod-1")
+
+        assert recorder.tests_calls["test_a"]["get pods"].count == 1
+
+    def test_instrumented_once(self, recorder):
+        """Test that instrumenting a client twice records each request once"""
+        client = MagicMock(spec=["request"])
+        instrument_client(client=instrument_client(client=client))
+
+        client.request("GET", "/api/v1/namespaces/ns/pods")
+
+        assert recorder.test_summary(test_name="test_a")[0] == 1
+
+    def test_disabled_recorder(self, recorder):
+        """Test that nothing is recorded when accounting is disabled"""
+        recorder.enabled = False
+        client = instrument_client(client=MagicMock(spec=["request"]))
+
+        client.request("GET", "/api/v1/namespaces/ns/pods")
+
+        assert not recorder.tests_calls
+
+
+class TestApiCallRecorder:
+    """Test cases for ApiCallRecorder"""
+
+    def test_fixture_attribution(self, recorder):
+        """Test that calls within a fixture scope are attributed to the fixture"""
+        with fixture_api_calls_scope(fixturedef=MagicMock(argname="vm_fixture")):
+            recorder.record(verb="create", resource="virtualmachines", seconds=0.2)
+        recorder.record(verb="get", resource="virtualmachines", seconds=0.01)
+
+        assert recorder.tests_fixtures_calls["test_a"] == {"vm_fixture": 1}
+        assert recorder.current_fixture is None
+
+    def test_fixture_teardown_attribution(self, recorder):
+        """Test that calls of the fixture finalizers are attributed to the fixture until its teardown ends"""
+        fixturedef = MagicMock(argname="vm_fixture")
+        with fixture_api_calls_scope(fixturedef=fixturedef):
+            pass
+
+        start_teardown = fixturedef.addfinalizer.call_args.args[0]
+        start_teardown()
+        recorder.record(verb="delete", resource="virtualmachines", seconds=0.1)
+        end_fixture_api_calls_teardown()
+        recorder.record(verb="get", resource="virtualmachines", seconds=0.01)
+
+        assert recorder.tests_fixtures_calls["test_a"] == {"vm_fixture": 1}
+        assert recorder.current_fixture is None
+
+    def test_latency_histogram(self, recorder):
+        """Test that latencies are counted in their histogram bucket"""
+        for seconds in (0.01, 0.3, 30):
+            recorder.record(verb="list", resource="pods", seconds=seconds)
+
+        stats = recorder.report()["tests"]["test_a"]["calls"]["list pods"]
+        assert stats["count"] == 3
+        assert stats["max_seconds"] == 30
+        assert stats["latency_histogram"]["le_0.05"] == 1
+        assert stats["latency_histogram"]["le_0.5"] == 1
+        assert stats["latency_histogram"]["le_inf"] == 1
+
+    def test_write_report(self, recorder, tmp_path):
+        """Test that the report is written as JSON with the tests ordered by calls count"""
+        recorder.record(verb="list", resource="pods", seconds=0.1)
+        recorder.current_test = "test_b"
+        for _ in range(2):
+            recorder.record(verb="get", resource="pods", seconds=0.1)
+        report_path = tmp_path / "api_calls.json"
+
+        write_api_calls_report(report_path=str(report_path))
+
+        report = json.loads(report_path.read_text())
+        assert report["total_calls"] == 3
+        assert [test["test"] for test in report["top_tests"]] == ["test_b", "test_a"]
@@ -0,0 +1,117 @@
+"""Unit tests for artifact_cache module"""
+
+import hashlib
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from utilities.artifact_cache import ARTIFACT_CACHE_DIR_ENV, download_cached_artifact
+
+ARTIFACT_URL = "https://artifactory.example.com/cdi/cirros.qcow2"
+ARTIFACT_CONTENT = b"qcow2-content" * 100
+
+
+def _head_response(headers):
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    response.headers = headers
+    return response
+
+
+def _get_response(content, status_code=requests.codes.ok):
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_content.return_value = [content[:10], content[10:]]
+    response.__enter__.return_value = response
+    return response
+
+
+@pytest.fixture()
+def artifact_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(ARTIFACT_CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
+class TestDownloadCachedArtifact:
+    """Test cases for download_cached_artifact"""
+
+    @patch("utilities.artifact_cache.requests.get")
+    @patch("utilities.artifact_cache.requests.head")
+    def test_artifact_downloaded_once(self, mock_head, mock_get, artifact_cache_dir, tmp_path):
+        """Test that the second download of an unchanged artifact is copied from the cache"""
+        mock_head.return_value = _head_response(headers={"ETag": '"v1"'})
+        mock_get.return_value = _get_response(content=ARTIFACT_CONTENT)
+
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "first.qcow2")
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "second.qcow2")
+
+        mock_get.assert_called_once()
+        assert (tmp_path / "first.qcow2").read_bytes() == ARTIFACT_CONTENT
+        assert (tmp_path / "second.qcow2").read_bytes() == ARTIFACT_CONTENT
+        assert os.listdir(artifact_cache_dir / "blobs") == [hashlib.sha256(ARTIFACT_CONTENT).hexdigest()]
+
+    @patch("utilities.artifact_cache.requests.get")
+    @patch("utilities.artifact_cache.requests.head")
+    def test_changed_artifact_downloaded_again(self, mock_head, mock_get, artifact_cache_dir, tmp_path):
+        """Test that an artifact with a new ETag is downloaded again"""
+        mock_get.side_effect = [_get_response(content=ARTIFACT_CONTENT), _get_response(content=b"new-content")]
+
+        mock_head.return_value = _head_response(headers={"ETag": '"v1"'})
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+        mock_head.return_value = _head_response(headers={"ETag": '"v2"'})
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+
+        assert mock_get.call_count == 2
+        assert (tmp_path / "artifact.qcow2").read_bytes() == b"new-content"
+
+    @patch("utilities.artifact_cache.requests.get")
+    @patch("utilities.artifact_cache.requests.head")
+    def test_partial_download_resumed(self, mock_head, mock_get, artifact_cache_dir, tmp_path):
+        """Test that an interrupted download is resumed from the partial file with a range request"""
+        mock_head.return_value = _head_response(headers={"Last-Modified": "Mon, 12 Oct 2026 10:00:00 GMT"})
+        interrupted_response = _get_response(content=ARTIFACT_CONTENT)
+
+        def _interrupted_iter_content(chunk_size):
+            yield ARTIFACT_CONTENT[:100]
+            raise requests.exceptions.ConnectionError("connection reset")
+
+        interrupted_response.iter_content.side_effect = _interrupted_iter_content
+        mock_get.side_effect = [
+            interrupted_response,
+            _get_response(content=ARTIFACT_CONTENT[100:], status_code=requests.codes.partial_content),
+        ]
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+
+        assert mock_get.call_args.kwargs["headers"]["Range"] == "bytes=100-"
+        assert mock_get.call_args.kwargs["headers"]["If-Range"] == "Mon, 12 Oct 2026 10:00:00 GMT"
+        assert (tmp_path / "artifact.qcow2").read_bytes() == ARTIFACT_CONTENT
+        assert os.listdir(artifact_cache_dir / "blobs") == [hashlib.sha256(ARTIFACT_CONTENT).hexdigest()]
+
+    @patch("utilities.artifact_cache.requests.get")
+    @patch("utilities.artifact_cache.requests.head")
+    def test_artifact_without_validator_not_cached(self, mock_head, mock_get, artifact_cache_dir, tmp_path):
+        """Test that an artifact without ETag and Last-Modified is downloaded directly every time"""
+        mock_head.return_value = _head_response(headers={})
+        mock_get.side_effect = [_get_response(content=ARTIFACT_CONTENT), _get_response(content=ARTIFACT_CONTENT)]
+
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+        download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
+
+        assert mock_get.call_count == 2
+        assert (tmp_path / "artifact.qcow2").read_bytes() == ARTIFACT_CONTENT
+        assert not artifact_cache_dir.exists()
+
+    @patch("utilities.artifact_cache.requests.head")
+    def test_server_error_raised(self, mock_head, artifact_cache_dir, tmp_path):
+        """Test that an error of the server is raised"""
+        mock_head.return_value.status_code = requests.codes.not_found
+        mock_head.return_value.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+
+        with pytest.raises(requests.HTTPError):
+            download_cached_artifact(url=ARTIFACT_URL, local_path=tmp_path / "artifact.qcow2")
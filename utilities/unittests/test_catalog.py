@@ -0,0 +1,134 @@
+"""Unit tests for catalog module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceInstance
+
+from utilities.catalog import ResourceCatalog, get_resource_catalog
+
+
+def _template_instance(name, namespace="openshift", labels=None):
+    return ResourceInstance(
+        client=MagicMock(),
+        instance={
+            "apiVersion": "template.openshift.io/v1",
+            "kind": "Template",
+            "metadata": {"name": name, "namespace": namespace, "labels": labels or {}},
+        },
+    )
+
+
+@pytest.fixture()
+def resource_class():
+    resource_class = MagicMock()
+    resource_class.kind = "Template"
+    return resource_class
+
+
+@pytest.fixture()
+def catalog(resource_class):
+    with (
+        patch("utilities.catalog.get_resource_class_api_version", return_value="template.openshift.io/v1"),
+        patch("utilities.catalog.get_watch_stream"),
+    ):
+        catalog = ResourceCatalog(client=MagicMock(), resource_class=resource_class)
+    catalog._on_change(
+        event_type="ADDED",
+        instance=_template_instance(name="rhel9-server-small", labels={"os.template.kubevirt.io/rhel9.6": "true"}),
+    )
+    catalog._on_change(
+        event_type="ADDED",
+        instance=_template_instance(name="fedora-server-small", labels={"os.template.kubevirt.io/fedora": "true"}),
+    )
+    catalog._on_change(
+        event_type="ADDED",
+        instance=_template_instance(
+            name="rhel9-server-small", namespace="custom", labels={"os.template.kubevirt.io/rhel9.6": "true"}
+        ),
+    )
+    return catalog
+
+
+class TestResourceCatalog:
+    """Test cases for ResourceCatalog"""
+
+    def test_list_by_label(self, catalog):
+        """Test that the objects are selected by `key=value` and `key` terms"""
+        assert [
+            (instance.metadata.namespace, instance.metadata.name)
+            for instance in catalog.list(label_selector="os.template.kubevirt.io/rhel9.6=true")
+        ] == [("custom", "rhel9-server-small"), ("openshift", "rhel9-server-small")]
+        assert [
+            instance.metadata.name for instance in catalog.list(label_selector=["os.template.kubevirt.io/fedora"])
+        ] == ["fedora-server-small"]
+
+    def test_list_by_namespace(self, catalog):
+        """Test that the namespace filters the matching objects"""
+        assert len(catalog.list(label_selector="os.template.kubevirt.io/rhel9.6=true", namespace="custom")) == 1
+        assert len(catalog.list(namespace="openshift")) == 2
+
+    def test_list_all_terms_must_match(self, catalog):
+        """Test that an object is selected only if it matches every term"""
+        assert not catalog.list(label_selector="os.template.kubevirt.io/rhel9.6=true,os.template.kubevirt.io/fedora")
+
+    def test_unsupported_selector(self, catalog):
+        """Test that set-based selector terms are rejected"""
+        with pytest.raises(ValueError, match="Unsupported label selector"):
+            catalog.list(label_selector="os.template.kubevirt.io/fedora!=true")
+
+    def test_modified_labels_reindexed(self, catalog):
+        """Test that an object whose labels changed is selected by its new labels only"""
+        catalog._on_change(
+            event_type="MODIFIED",
+            instance=_template_instance(name="fedora-server-small", labels={"template.kubevirt.io/deprecated": "true"}),
+        )
+
+        assert not catalog.list(label_selector="os.template.kubevirt.io/fedora")
+        assert catalog.list(label_selector="template.kubevirt.io/deprecated")
+
+    def test_deleted_object_removed(self, catalog):
+        """Test that a deleted object is no longer listed or returned"""
+        catalog._on_change(event_type="DELETED", instance=_template_instance(name="fedora-server-small"))
+
+        assert not catalog.list(label_selector="os.template.kubevirt.io/fedora")
+        assert catalog.get(name="fedora-server-small", namespace="openshift") is None
+
+    def test_get(self, catalog):
+        """Test that an object is returned by namespace and name"""
+        assert catalog.get(name="rhel9-server-small", namespace="custom").metadata.namespace == "custom"
+        assert catalog.get(name="rhel9-server-small", namespace="other") is None
+
+    def test_resource(self, catalog, resource_class):
+        """Test that the resource object is created without reading the object"""
+        catalog.resource(instance=_template_instance(name="fedora-server-small"))
+
+        resource_class.assert_called_once_with(
+            client=catalog.client, name="fedora-server-small", namespace="openshift"
+        )
+
+    def test_start_failure_removes_listener(self, catalog):
+        """Test that a catalog whose stream does not sync stops listening"""
+        catalog._stream.wait_for_sync.side_effect = TimeoutError("not synced")
+
+        with pytest.raises(TimeoutError):
+            catalog.start()
+
+        catalog._stream.remove_listener.assert_called_once_with(listener=catalog._on_change)
+
+
+class TestGetResourceCatalog:
+    """Test cases for get_resource_catalog"""
+
+    @patch("utilities.catalog._CATALOGS", {})
+    @patch("utilities.catalog.ResourceCatalog")
+    def test_catalog_shared_per_client_and_kind(self, mock_catalog_class, resource_class):
+        """Test that a catalog is created and started once per client and kind"""
+        client = MagicMock()
+
+        first_catalog = get_resource_catalog(client=client, resource_class=resource_class)
+        second_catalog = get_resource_catalog(client=client, resource_class=resource_class)
+
+        assert first_catalog is second_catalog
+        mock_catalog_class.assert_called_once_with(client=client, resource_class=resource_class)
+        first_catalog.start.assert_called_once()
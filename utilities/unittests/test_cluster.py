@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from timeout_sampler import TimeoutExpiredError
 
-from utilities.cluster import cache_admin_client, get_oc_whoami_username
+from utilities.cluster import cache_admin_client, get_oc_whoami_username, get_resource_class_api_version
 
 
 class TestCacheAdminClient:
@@ -104,6 +104,26 @@ class TestCacheAdminClient:
         assert info.misses == 1
 
 
+class TestGetResourceClassApiVersion:
+    """Test cases for get_resource_class_api_version function"""
+
+    def test_class_api_version(self):
+        """Test that the class api_version is used when set"""
+        resource_class = MagicMock(api_version="v1")
+
+        assert get_resource_class_api_version(client=MagicMock(), resource_class=resource_class) == "v1"
+        resource_class.assert_not_called()
+
+    def test_api_group_class_resolved_by_instance(self):
+        """Test that the api_version of an API group class is resolved by a placeholder instance"""
+        resource_class = MagicMock(api_version="", kind="VirtualMachineInstance")
+        resource_class.return_value.api_version = "kubevirt.io/v1"
+        client = MagicMock()
+
+        assert get_resource_class_api_version(client=client, resource_class=resource_class) == "kubevirt.io/v1"
+        resource_class.assert_called_once_with(client=client, name="virtualmachineinstance")
+
+
 class TestGetOcWhoamiUsername:
     """Test cases for get_oc_whoami_username function"""
 
@@ -0,0 +1,144 @@
+"""Unit tests for cluster_lock module"""
+
+import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.cluster_lock import (
+    LOCK_MODE_ANNOTATION,
+    MUTATED_RESOURCES_ANNOTATION,
+    ClusterLock,
+    locks_conflict,
+    parse_mutated_resources,
+)
+from utilities.exceptions import ClusterLockConflictError
+
+OWN_LEASE_NAME = "cnv-tests-run-in-progress-own"
+OWN_CREATION_TIMESTAMP = "2026-01-01T10:00:00Z"
+
+
+def _raw_lease(name, creation_timestamp, mode="exclusive", mutated_resources="", renewed_seconds_ago=10):
+    lease = MagicMock()
+    lease.metadata.name = name
+    lease.metadata.creationTimestamp = creation_timestamp
+    lease.metadata.annotations = {LOCK_MODE_ANNOTATION: mode, MUTATED_RESOURCES_ANNOTATION: mutated_resources}
+    lease.spec.renewTime = (
+        datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(seconds=renewed_seconds_ago)
+    ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    lease.spec.leaseDurationSeconds = 300
+    return lease
+
+
+@pytest.fixture()
+def mock_lease_class():
+    with patch("utilities.cluster_lock.Lease") as lease_class:
+        lease_class.return_value.name = OWN_LEASE_NAME
+        lease_class.return_value.instance.metadata.creationTimestamp = OWN_CREATION_TIMESTAMP
+        yield lease_class
+
+
+def _cluster_lock(mode="exclusive", mutated_resources=None):
+    cluster_lock = ClusterLock(client=MagicMock(), session_id="abc", mode=mode, mutated_resources=mutated_resources)
+    cluster_lock._heartbeat_thread = MagicMock()
+    return cluster_lock
+
+
+class TestLocksConflict:
+    """Test cases for locks_conflict function"""
+
+    @pytest.mark.parametrize(
+        "mode, mutated_resources, other_mode, other_mutated_resources, expected",
+        [
+            pytest.param("exclusive", [], "shared", [], True, id="exclusive_conflicts_with_shared"),
+            pytest.param("shared", [], "exclusive", [], True, id="shared_conflicts_with_exclusive"),
+            pytest.param("shared", [], "shared", [], False, id="read_only_sessions_share"),
+            pytest.param("shared", ["hco"], "shared", ["nodes"], False, id="disjoint_resources_share"),
+            pytest.param("shared", ["hco", "nodes"], "shared", ["nodes"], True, id="same_resource_conflicts"),
+        ],
+    )
+    def test_locks_conflict(self, mode, mutated_resources, other_mode, other_mutated_resources, expected):
+        """Test that sessions conflict when one is exclusive or both mutate the same resource"""
+        assert (
+            locks_conflict(
+                mode=mode,
+                mutated_resources=mutated_resources,
+                other_mode=other_mode,
+                other_mutated_resources=other_mutated_resources,
+            )
+            is expected
+        )
+
+    def test_parse_mutated_resources(self):
+        """Test that the declared resources are parsed and unknown resources are rejected"""
+        assert parse_mutated_resources(mutated_resources="hco, nodes") == ["hco", "nodes"]
+        assert parse_mutated_resources(mutated_resources=None) == []
+        with pytest.raises(ValueError, match="pods"):
+            parse_mutated_resources(mutated_resources="hco,pods")
+
+
+class TestClusterLock:
+    """Test cases for ClusterLock"""
+
+    def test_acquire_without_other_sessions(self, mock_lease_class):
+        """Test that the Lease is created and the heartbeat started when no other session runs"""
+        mock_lease_class.get.return_value = []
+        cluster_lock = _cluster_lock()
+
+        cluster_lock.acquire()
+
+        assert cluster_lock.acquired
+        mock_lease_class.return_value.deploy.assert_called_once()
+        cluster_lock._heartbeat_thread.start.assert_called_once()
+
+    def test_earlier_conflicting_session_blocks(self, mock_lease_class):
+        """Test that a running conflicting session blocks the lock and the new Lease is deleted"""
+        mock_lease_class.get.return_value = [
+            _raw_lease(name="other", creation_timestamp="2026-01-01T09:00:00Z", mode="shared", mutated_resources="hco")
+        ]
+        cluster_lock = _cluster_lock(mode="shared", mutated_resources=["hco"])
+
+        with pytest.raises(ClusterLockConflictError, match="oc delete lease .* other"):
+            cluster_lock.acquire()
+
+        assert not cluster_lock.acquired
+        mock_lease_class.return_value.clean_up.assert_called_once_with(wait=False)
+        cluster_lock._heartbeat_thread.start.assert_not_called()
+
+    def test_compatible_and_later_sessions_ignored(self, mock_lease_class):
+        """Test that compatible sessions and sessions started after this one do not block the lock"""
+        mock_lease_class.get.return_value = [
+            _raw_lease(name="read-only", creation_timestamp="2026-01-01T09:00:00Z", mode="shared"),
+            _raw_lease(name="later", creation_timestamp="2026-01-01T11:00:00Z"),
+        ]
+        cluster_lock = _cluster_lock(mode="shared", mutated_resources=["nodes"])
+
+        cluster_lock.acquire()
+
+        assert cluster_lock.acquired
+
+    def test_stale_lease_taken_over(self, mock_lease_class):
+        """Test that a Lease not renewed for its duration is deleted and does not block the lock"""
+        mock_lease_class.get.return_value = [
+            _raw_lease(name="stale", creation_timestamp="2026-01-01T09:00:00Z", renewed_seconds_ago=600)
+        ]
+        cluster_lock = _cluster_lock()
+
+        cluster_lock.acquire()
+
+        assert cluster_lock.acquired
+        assert mock_lease_class.call_args.kwargs["name"] == "stale"
+        mock_lease_class.return_value.clean_up.assert_called_once_with(wait=False)
+
+    def test_heartbeat_renews_lease(self, mock_lease_class):
+        """Test that the heartbeat renews the Lease until the lock is released"""
+        cluster_lock = ClusterLock(client=MagicMock(), session_id="abc")
+        cluster_lock.acquired = True
+
+        with patch.object(cluster_lock._stop_heartbeat, "wait", side_effect=[False, True]):
+            cluster_lock._heartbeat()
+        cluster_lock.release()
+
+        assert "renewTime" in mock_lease_class.return_value.update.call_args.kwargs["resource_dict"]["spec"]
+        mock_lease_class.return_value.clean_up.assert_called_once_with(wait=False)
+        assert not cluster_lock.acquired
@@ -6,7 +6,14 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pexpect
 import pytest
-from console import Console
+from console import (
+    Console,
+    ConsoleSession,
+    ConsoleSessionRegistry,
+    close_vm_console_session,
+    console_sessions,
+    get_console_session_registry,
+)
 
 
 def _single_attempt_sampler(func, func_args=(), **kwargs):
@@ -667,3 +674,125 @@ class TestConsole:
 
         old_proc.terminate.assert_called_once()
         assert console._proc == new_proc
+
+
+@pytest.fixture()
+def mock_console_vm():
+    vm = MagicMock()
+    vm.name = "test-vm"
+    vm.namespace = "test-ns"
+    return vm
+
+
+class TestConsoleSession:
+    """Test cases for ConsoleSession class"""
+
+    @patch("console.get_data_collector_base_directory")
+    def test_connect_reuses_live_console(self, mock_get_dir, mock_console_vm):
+        """Test that connect logs in once while the console process is alive"""
+        session = ConsoleSession(vm=mock_console_vm)
+        session.console._proc = MagicMock()
+        session.console._proc.poll.return_value = None
+
+        with patch.object(session.console, "connect") as mock_connect:
+            assert session.connect() == mock_connect.return_value
+            assert session.connect() == mock_connect.return_value
+
+        mock_connect.assert_called_once()
+
+    @patch("console.get_data_collector_base_directory")
+    def test_connect_reconnects_after_eof(self, mock_get_dir, mock_console_vm):
+        """Test that connect logs in again when the console process exited"""
+        session = ConsoleSession(vm=mock_console_vm)
+        exited_proc = MagicMock()
+        exited_proc.poll.return_value = 1
+        session.console._proc = exited_proc
+        old_child = MagicMock()
+        session._child = old_child
+
+        with (
+            patch.object(session.console, "connect") as mock_connect,
+            patch.object(session.console, "disconnect") as mock_disconnect,
+            patch.object(session.console, "_terminate_proc"),
+        ):
+            assert session.connect() == mock_connect.return_value
+
+        old_child.close.assert_called_once()
+        mock_disconnect.assert_not_called()
+        mock_connect.assert_called_once()
+
+
+class TestConsoleSessionRegistry:
+    """Test cases for ConsoleSessionRegistry class"""
+
+    @patch("console.ConsoleSession")
+    def test_session_shared_per_vm(self, mock_console_session, mock_console_vm):
+        """Test that consecutive uses of a VM console share one session"""
+        registry = ConsoleSessionRegistry()
+        mock_console_session.return_value.prompt = "$ "
+        mock_console_session.return_value.lock = MagicMock()
+
+        with registry.session(vm=mock_console_vm, prompt="$ ") as first:
+            pass
+        with registry.session(vm=mock_console_vm, prompt="$ ") as second:
+            pass
+
+        mock_console_session.assert_called_once_with(vm=mock_console_vm, prompt="$ ")
+        assert first == second
+
+    @patch("console.ConsoleSession")
+    def test_session_closed_on_error(self, mock_console_session, mock_console_vm):
+        """Test that a session failing while in use is closed so the next use reconnects"""
+        registry = ConsoleSessionRegistry()
+        mock_console_session.return_value.prompt = None
+        mock_console_session.return_value.lock = MagicMock()
+
+        with pytest.raises(pexpect.exceptions.TIMEOUT):
+            with registry.session(vm=mock_console_vm):
+                raise pexpect.exceptions.TIMEOUT("timeout")
+
+        mock_console_session.return_value.close.assert_called_once()
+
+    @patch("console.ConsoleSession")
+    def test_close_vm_session(self, mock_console_session, mock_console_vm):
+        """Test that closing the session of a VM logs out and removes it"""
+        registry = ConsoleSessionRegistry()
+        mock_console_session.return_value.prompt = None
+        mock_console_session.return_value.lock = MagicMock()
+        with registry.session(vm=mock_console_vm):
+            pass
+
+        registry.close_vm_session(vm=mock_console_vm)
+
+        mock_console_session.return_value.close.assert_called_once()
+        assert not registry._sessions
+
+
+class TestConsoleSessions:
+    """Test cases for console_sessions scope"""
+
+    def test_registry_active_only_within_scope(self):
+        """Test that the registry is active within the scope and closed on exit"""
+        assert get_console_session_registry() is None
+
+        with patch.object(ConsoleSessionRegistry, "close") as mock_close:
+            with console_sessions() as registry:
+                assert get_console_session_registry() is registry
+
+        assert get_console_session_registry() is None
+        mock_close.assert_called_once()
+
+    def test_nested_scope_shares_registry(self):
+        """Test that a nested scope reuses the outer registry and does not close it"""
+        with patch.object(ConsoleSessionRegistry, "close") as mock_close:
+            with console_sessions() as outer:
+                with console_sessions() as inner:
+                    assert inner is outer
+                mock_close.assert_not_called()
+
+    def test_close_vm_console_session_without_scope(self, mock_console_vm):
+        """Test that closing a VM console session outside a scope is a no-op"""
+        with patch.object(ConsoleSessionRegistry, "close_vm_session") as mock_close_vm_session:
+            close_vm_console_session(vm=mock_console_vm)
+
+        mock_close_vm_session.assert_not_called()
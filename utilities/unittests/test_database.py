@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 # Add utilities to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import CNV_TEST_DB, Base, CnvTestTable, Database
+from database import CNV_TEST_DB, Base, CnvTestTable, Database, get_database
 
 
 class TestCnvTestTable:
@@ -46,15 +46,18 @@ class TestDatabase:
         # Check attributes
         assert db.database_file_path == f"/tmp/data/{CNV_TEST_DB}"
         assert db.connection_string == f"sqlite:////tmp/data/{CNV_TEST_DB}"
-        assert db.verbose is True
+        assert db.verbose is False
         assert db.engine == mock_engine
 
         # Check engine creation
         mock_create_engine.assert_called_once_with(
             url=f"sqlite:////tmp/data/{CNV_TEST_DB}",
-            echo=True,
+            echo=False,
         )
         mock_create_all.assert_called_once_with(bind=mock_engine)
+        mock_engine.connect.return_value.__enter__.return_value.exec_driver_sql.assert_called_once_with(
+            "PRAGMA journal_mode=WAL"
+        )
 
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
@@ -67,13 +70,13 @@ class TestDatabase:
 
         db = Database(
             database_file_name="test.db",
-            verbose=False,
+            verbose=True,
             base_dir="/custom/dir",
         )
 
         assert db.database_file_path == "/custom/path/test.db"
         assert db.connection_string == "sqlite:////custom/path/test.db"
-        assert db.verbose is False
+        assert db.verbose is True
 
         mock_get_base.assert_called_once_with(base_dir="/custom/dir")
 
@@ -89,21 +92,28 @@ class TestDatabase:
 
         # Mock session - no existing entry
         mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.scalars.return_value = []
         mock_session_class.return_value.__enter__.return_value = mock_session
 
         db = Database()
         db.insert_start_time(name="test_example", start_time=1234567890)
 
-        # Check that add and commit were called
-        mock_session.add.assert_called_once()
+        # Start times are only written on flush
+        mock_session_class.assert_not_called()
+        assert db.get_start_time(name="test_example") == 1234567890
+
+        db.flush()
+
+        # Check that add_all and commit were called
+        mock_session.add_all.assert_called_once()
         mock_session.commit.assert_called_once()
 
-        # Check the object that was added
-        added_obj = mock_session.add.call_args[0][0]
-        assert isinstance(added_obj, CnvTestTable)
-        assert added_obj.test_name == "test_example"
-        assert added_obj.start_time == 1234567890
+        # Check the objects that were added
+        added_objs = mock_session.add_all.call_args[0][0]
+        assert len(added_objs) == 1
+        assert isinstance(added_objs[0], CnvTestTable)
+        assert added_objs[0].test_name == "test_example"
+        assert added_objs[0].start_time == 1234567890
 
     @patch("database.Session")
     @patch("database.create_engine")
@@ -118,17 +128,64 @@ class TestDatabase:
         mock_create_engine.return_value = mock_engine
 
         # Mock session - existing entry
-        existing_entry = MagicMock()
         mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = existing_entry
+        mock_session.scalars.return_value = ["test_example"]
         mock_session_class.return_value.__enter__.return_value = mock_session
 
         db = Database()
         db.insert_start_time(name="test_example", start_time=1234567890)
+        db.flush()
 
-        # Check that add and commit were NOT called (entry already exists)
-        mock_session.add.assert_not_called()
-        mock_session.commit.assert_not_called()
+        # Check that the existing entry was not added again
+        mock_session.add_all.assert_called_once_with([])
+
+    @patch("database.Session")
+    @patch("database.create_engine")
+    @patch("database.get_data_collector_base")
+    @patch("database.Base.metadata.create_all")
+    def test_insert_start_time_batched(self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class):
+        """Test start times are flushed in one transaction and only once"""
+        mock_get_base.return_value = "/tmp/data/"
+        mock_create_engine.return_value = MagicMock()
+
+        mock_session = MagicMock()
+        mock_session.scalars.return_value = []
+        mock_session_class.return_value.__enter__.return_value = mock_session
+
+        db = Database()
+        db.insert_start_time(name="test_first", start_time=1)
+        db.insert_start_time(name="test_second", start_time=2)
+        # The first start time is kept
+        db.insert_start_time(name="test_first", start_time=3)
+        db.flush()
+        db.flush()
+
+        mock_session.commit.assert_called_once()
+        added_objs = mock_session.add_all.call_args[0][0]
+        assert [(obj.test_name, obj.start_time) for obj in added_objs] == [("test_first", 1), ("test_second", 2)]
+
+    @patch("database.Session")
+    @patch("database.create_engine")
+    @patch("database.get_data_collector_base")
+    @patch("database.Base.metadata.create_all")
+    def test_close_flushes_and_disposes_engine(
+        self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class
+    ):
+        """Test close writes the pending start times and disposes the engine"""
+        mock_get_base.return_value = "/tmp/data/"
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+
+        mock_session = MagicMock()
+        mock_session.scalars.return_value = []
+        mock_session_class.return_value.__enter__.return_value = mock_session
+
+        db = Database()
+        db.insert_start_time(name="test_example", start_time=1234567890)
+        db.close()
+
+        mock_session.commit.assert_called_once()
+        mock_engine.dispose.assert_called_once()
 
     @patch("database.Session")
     @patch("database.create_engine")
@@ -448,3 +505,17 @@ class TestDatabase:
         mock_logger.warning.assert_called_once()
         assert "Error:" in mock_logger.warning.call_args[0][0]
         assert "Database connection error" in mock_logger.warning.call_args[0][0]
+
+
+class TestGetDatabase:
+    """Test cases for get_database function"""
+
+    @patch("database.Database")
+    def test_get_database_reuses_instance(self, mock_database_class):
+        """Test get_database creates one Database per base directory"""
+        get_database.cache_clear()
+        try:
+            assert get_database(base_dir="/tmp/data") is get_database(base_dir="/tmp/data")
+            mock_database_class.assert_called_once_with(base_dir="/tmp/data")
+        finally:
+            get_database.cache_clear()
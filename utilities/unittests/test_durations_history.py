@@ -0,0 +1,177 @@
+"""Unit tests for durations_history module"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from utilities.durations_history import (
+    DEFAULT_TEST_DURATION,
+    DurationsHistory,
+    DurationsHistoryPlugin,
+    get_items_expected_durations,
+    order_items_by_duration,
+    parse_shard,
+    register_durations_history_plugin,
+    shard_items,
+)
+
+
+def _mock_item(nodeid):
+    item = MagicMock(spec=["nodeid"])
+    item.nodeid = nodeid
+    return item
+
+
+def _test_durations(test_name, call_duration):
+    return {"test_name": test_name, "call_duration": call_duration, "outcome": "passed"}
+
+
+@pytest.fixture()
+def history(tmp_path):
+    return DurationsHistory(database_file_path=str(tmp_path / "durations.db"), cluster_profile="bm")
+
+
+class TestDurationsHistory:
+    """Test cases for DurationsHistory"""
+
+    def test_expected_duration_is_median_of_last_runs(self, history):
+        """Test that the expected duration is the median of the most recent runs"""
+        for call_duration in (1000, 10, 20, 30):
+            history.add_test_durations(
+                tests_durations=[_test_durations(test_name="test_a", call_duration=call_duration)]
+            )
+
+        assert history.get_expected_durations(history_size=3) == {"test_a": 20}
+
+    def test_cluster_profile_runs_preferred(self, history, tmp_path):
+        """Test that runs on the current cluster profile are preferred over runs on other profiles"""
+        other_profile_history = DurationsHistory(
+            database_file_path=str(tmp_path / "durations.db"), cluster_profile="sno"
+        )
+        other_profile_history.add_test_durations(
+            tests_durations=[
+                _test_durations(test_name="test_a", call_duration=100),
+                _test_durations(test_name="test_b", call_duration=100),
+            ]
+        )
+        history.add_test_durations(tests_durations=[_test_durations(test_name="test_a", call_duration=10)])
+
+        assert history.get_expected_durations() == {"test_a": 10, "test_b": 100}
+
+    def test_setup_and_teardown_included(self, history):
+        """Test that the expected duration includes setup and teardown"""
+        history.add_test_durations(
+            tests_durations=[{**_test_durations(test_name="test_a", call_duration=1), "setup_duration": 2}]
+        )
+
+        assert history.get_expected_durations() == {"test_a": 3}
+
+
+class TestDurationScheduling:
+    """Test cases for duration-aware ordering and sharding"""
+
+    def test_unknown_tests_expected_duration(self):
+        """Test that tests without history get the median known duration, or a default without any history"""
+        items = [_mock_item(nodeid="a.py::test_1"), _mock_item(nodeid="b.py::test_1")]
+
+        assert get_items_expected_durations(items=items, expected_durations={"a.py::test_1": 5}) == {
+            "a.py::test_1": 5,
+            "b.py::test_1": 5,
+        }
+        assert get_items_expected_durations(items=items, expected_durations={})["a.py::test_1"] == DEFAULT_TEST_DURATION
+
+    def test_order_by_module_duration(self):
+        """Test that modules are ordered longest first and tests keep their order within a module"""
+        items = [_mock_item(nodeid=nodeid) for nodeid in ("a.py::test_1", "a.py::test_2", "b.py::test_1")]
+        durations = {"a.py::test_1": 1, "a.py::test_2": 1, "b.py::test_1": 5}
+
+        ordered_items = order_items_by_duration(items=items, items_durations=durations)
+
+        assert [item.nodeid for item in ordered_items] == ["b.py::test_1", "a.py::test_1", "a.py::test_2"]
+
+    def test_shards_balanced_by_duration(self):
+        """Test that the shards are disjoint, cover all tests and are balanced by expected duration"""
+        durations = {"a.py::test_1": 50, "b.py::test_1": 30, "c.py::test_1": 20, "d.py::test_1": 10, "d.py::test_2": 10}
+        items = [_mock_item(nodeid=nodeid) for nodeid in durations]
+
+        shards = [
+            shard_items(items=items, items_durations=durations, shard_index=shard_index, shards_count=2)[0]
+            for shard_index in (1, 2)
+        ]
+
+        assert [[item.nodeid for item in shard] for shard in shards] == [
+            ["a.py::test_1", "d.py::test_1", "d.py::test_2"],
+            ["b.py::test_1", "c.py::test_1"],
+        ]
+
+    @pytest.mark.parametrize("shard", ["2", "a/2", "0/2", "3/2"])
+    def test_invalid_shard(self, shard):
+        """Test that malformed or out of range shards are rejected"""
+        with pytest.raises(ValueError):
+            parse_shard(shard=shard)
+
+
+class TestDurationsHistoryPlugin:
+    """Test cases for DurationsHistoryPlugin"""
+
+    def test_run_durations_recorded(self, history):
+        """Test that the phases durations and outcome of the run are added to the history at session end"""
+        plugin = DurationsHistoryPlugin(history=history)
+        plugin.matrix_params = {"a.py::test_1[nfs]": "nfs"}
+        for when, duration, failed in (("setup", 2.0, False), ("call", 5.0, True), ("teardown", 1.0, False)):
+            plugin.pytest_runtest_logreport(
+                report=MagicMock(nodeid="a.py::test_1[nfs]", when=when, duration=duration, failed=failed, skipped=False)
+            )
+
+        plugin.pytest_sessionfinish(session=MagicMock())
+
+        assert plugin.tests_durations["a.py::test_1[nfs]"]["outcome"] == "failed"
+        assert plugin.tests_durations["a.py::test_1[nfs]"]["matrix_params"] == "nfs"
+        assert history.get_expected_durations() == {"a.py::test_1[nfs]": 8.0}
+
+
+def _mock_config(tmp_path, numprocesses=None):
+    config = MagicMock()
+    config.option.numprocesses = numprocesses
+    options = {
+        "durations_history_db": str(tmp_path / "durations.db"),
+        "durations_cluster_profile": "bm",
+        "durations_order": True,
+        "durations_shard": None,
+    }
+    config.getoption.side_effect = options.get
+    return config
+
+
+class TestRegisterDurationsHistoryPlugin:
+    """Test cases for register_durations_history_plugin"""
+
+    def test_registered_in_serial_run(self, tmp_path, monkeypatch):
+        """Test that the plugin is registered when the tests run in the pytest process"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        config = _mock_config(tmp_path=tmp_path)
+
+        register_durations_history_plugin(config=config)
+
+        assert isinstance(config.pluginmanager.register.call_args.kwargs["plugin"], DurationsHistoryPlugin)
+
+    def test_registered_on_xdist_workers_only(self, tmp_path, monkeypatch):
+        """Test that the xdist controller, which gets the reports of all the workers, records no durations"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        controller_config = _mock_config(tmp_path=tmp_path, numprocesses=4)
+        register_durations_history_plugin(config=controller_config)
+
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+        worker_config = _mock_config(tmp_path=tmp_path, numprocesses=4)
+        register_durations_history_plugin(config=worker_config)
+
+        controller_config.pluginmanager.register.assert_not_called()
+        worker_config.pluginmanager.register.assert_called_once()
+
+    def test_order_without_history_db(self, tmp_path):
+        """Test that ordering without a history database is rejected"""
+        config = _mock_config(tmp_path=tmp_path)
+        config.getoption.side_effect = {"durations_history_db": None, "durations_order": True}.get
+
+        with pytest.raises(ValueError, match="require --durations-history-db"):
+            register_durations_history_plugin(config=config)
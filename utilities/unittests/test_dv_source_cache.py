@@ -0,0 +1,114 @@
+"""Unit tests for dv_source_cache module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.dv_source_cache import DataVolumeSourceCache, DataVolumeSourceKey
+
+IMAGE_URL = "https://artifactory.example.com/rhel-images/rhel-96.qcow2"
+
+
+def _get_source_dict(cache, storage_class="ocs-storagecluster-ceph-rbd-virtualization", size="30Gi"):
+    return cache.get_source_dict(
+        source="http",
+        url=IMAGE_URL,
+        storage_class=storage_class,
+        volume_mode="Block",
+        access_modes="ReadWriteMany",
+        size=size,
+    )
+
+
+@pytest.fixture()
+def dv_source_cache():
+    cache = DataVolumeSourceCache()
+    cache.enabled = True
+    return cache
+
+
+class TestDataVolumeSourceCache:
+    """Test cases for DataVolumeSourceCache"""
+
+    def test_disabled_cache_not_used(self, dv_source_cache):
+        """Test that a disabled cache does not serve sources"""
+        dv_source_cache.enabled = False
+
+        with patch.object(DataVolumeSourceCache, "_import") as mock_import:
+            assert _get_source_dict(cache=dv_source_cache) is None
+
+        mock_import.assert_not_called()
+
+    def test_not_cached_source(self, dv_source_cache):
+        """Test that only http and registry sources with a storage class are cached"""
+        with patch.object(DataVolumeSourceCache, "_import") as mock_import:
+            assert (
+                dv_source_cache.get_source_dict(
+                    source="blank", url=None, storage_class="sc", volume_mode=None, access_modes=None, size="1Gi"
+                )
+                is None
+            )
+            assert _get_source_dict(cache=dv_source_cache, storage_class=None) is None
+
+        mock_import.assert_not_called()
+
+    def test_image_imported_once(self, dv_source_cache):
+        """Test that the image is imported on the first request and cloned for every request"""
+        reference_dv = MagicMock()
+        reference_dv.name = "http-1234"
+        reference_dv.namespace = "dv-source-cache"
+
+        with patch.object(DataVolumeSourceCache, "_import", return_value=reference_dv) as mock_import:
+            first_source_dict = _get_source_dict(cache=dv_source_cache)
+            second_source_dict = _get_source_dict(cache=dv_source_cache)
+
+        assert first_source_dict == second_source_dict == {"pvc": {"name": "http-1234", "namespace": "dv-source-cache"}}
+        mock_import.assert_called_once()
+
+    def test_image_imported_per_storage_settings(self, dv_source_cache):
+        """Test that the same image is imported again for another storage class or size"""
+        with patch.object(DataVolumeSourceCache, "_import", return_value=MagicMock()) as mock_import:
+            _get_source_dict(cache=dv_source_cache)
+            _get_source_dict(cache=dv_source_cache, storage_class="hostpath-csi-basic")
+            _get_source_dict(cache=dv_source_cache, size="40Gi")
+
+        assert mock_import.call_count == 3
+
+    def test_failed_import_not_retried(self, dv_source_cache):
+        """Test that an image which failed to import to the cache is imported by each DataVolume"""
+        with patch.object(DataVolumeSourceCache, "_import", return_value=None) as mock_import:
+            assert _get_source_dict(cache=dv_source_cache) is None
+            assert _get_source_dict(cache=dv_source_cache) is None
+
+        mock_import.assert_called_once()
+
+    def test_clean_up_deletes_namespace(self, dv_source_cache):
+        """Test that the cache namespace is deleted and the references are dropped"""
+        namespace = MagicMock()
+        dv_source_cache._namespace = namespace
+        dv_source_cache._reference_dvs[MagicMock()] = MagicMock()
+
+        dv_source_cache.clean_up()
+
+        namespace.clean_up.assert_called_once_with(wait=False)
+        assert dv_source_cache._namespace is None
+        assert not dv_source_cache._reference_dvs
+
+
+class TestDataVolumeSourceKey:
+    """Test cases for DataVolumeSourceKey"""
+
+    def test_dv_name_stable_per_key(self):
+        """Test that the reference DataVolume name depends only on the key"""
+        key_args = {
+            "source": "registry",
+            "url": "docker://quay.io/containerdisks/fedora:41",
+            "storage_class": "sc",
+            "volume_mode": None,
+            "access_modes": None,
+            "size": "10Gi",
+        }
+
+        assert DataVolumeSourceKey(**key_args).dv_name == DataVolumeSourceKey(**key_args).dv_name
+        assert DataVolumeSourceKey(**key_args).dv_name.startswith("registry-")
+        assert DataVolumeSourceKey(**{**key_args, "size": "20Gi"}).dv_name != DataVolumeSourceKey(**key_args).dv_name
@@ -0,0 +1,89 @@
+"""Unit tests for events_recorder module"""
+
+import gzip
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.events_recorder import EventsRecorder
+
+
+def _event(name, reason, event_type="Warning"):
+    event = MagicMock()
+    event.to_dict.return_value = {
+        "metadata": {"name": name},
+        "lastTimestamp": "2026-01-01T10:00:00Z",
+        "type": event_type,
+        "reason": reason,
+        "involvedObject": {"kind": "Pod", "name": "virt-launcher-vm-a-x"},
+        "message": "0/3 nodes are available",
+    }
+    return event
+
+
+def _read_records(file_path):
+    with gzip.open(file_path, "rt") as fd:
+        return [json.loads(line) for line in fd]
+
+
+@pytest.fixture()
+def namespace():
+    namespace = MagicMock()
+    namespace.name = "test-ns"
+    return namespace
+
+
+@pytest.fixture()
+def mock_stream():
+    with (
+        patch("utilities.events_recorder.get_resource_class_api_version", return_value="v1"),
+        patch("utilities.events_recorder.get_watch_stream") as mock_get_watch_stream,
+    ):
+        yield mock_get_watch_stream.return_value
+
+
+class TestEventsRecorder:
+    """Test cases for EventsRecorder"""
+
+    def test_recording_disabled_without_output_dir(self, namespace, mock_stream):
+        """Test that no stream is watched when the recorder is disabled"""
+        with EventsRecorder().recording(namespace=namespace):
+            pass
+
+        mock_stream.add_listener.assert_not_called()
+
+    def test_recording(self, namespace, mock_stream, tmp_path):
+        """Test that events are written with the current test until the recording stops"""
+        recorder = EventsRecorder()
+        recorder.output_dir = str(tmp_path)
+
+        with recorder.recording(namespace=namespace):
+            listener = mock_stream.add_listener.call_args.kwargs["listener"]
+            recorder.current_test = "tests/test_a.py::test_a"
+            listener("ADDED", _event(name="event-a", reason="FailedScheduling"))
+            # Expired events are not recorded
+            listener("DELETED", _event(name="event-a", reason="FailedScheduling"))
+            recorder.current_test = "tests/test_a.py::test_b"
+            listener("MODIFIED", _event(name="event-b", reason="Started", event_type="Normal"))
+
+        mock_stream.remove_listener.assert_called_once_with(listener=listener)
+        listener("ADDED", _event(name="event-c", reason="Killing"))
+
+        records = _read_records(file_path=tmp_path / "test-ns.jsonl.gz")
+        assert [(record["test"], record["reason"], record["type"]) for record in records] == [
+            ("tests/test_a.py::test_a", "FailedScheduling", "Warning"),
+            ("tests/test_a.py::test_b", "Started", "Normal"),
+        ]
+        assert records[0]["object"] == "Pod/virt-launcher-vm-a-x"
+
+    def test_recording_start_failure_does_not_fail(self, namespace, tmp_path):
+        """Test that a namespace is still usable when its events cannot be watched"""
+        recorder = EventsRecorder()
+        recorder.output_dir = str(tmp_path)
+
+        with patch("utilities.events_recorder.get_resource_class_api_version", side_effect=ValueError("forbidden")):
+            with recorder.recording(namespace=namespace) as recorded_namespace:
+                assert recorded_namespace is namespace
+
+        assert not recorder._recordings
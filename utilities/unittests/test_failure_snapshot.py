@@ -0,0 +1,108 @@
+"""Unit tests for failure_snapshot module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.failure_snapshot import VM_NAME_LABEL, FailureSnapshotCollector
+
+
+def _resource(kind, name, namespace=None):
+    resource = MagicMock()
+    resource.kind = kind
+    resource.name = name
+    resource.namespace = namespace
+    resource.instance.to_dict.return_value = {"kind": kind, "metadata": {"name": name}}
+    return resource
+
+
+def _items(*items):
+    result = MagicMock()
+    result.to_dict.return_value = {"items": list(items)}
+    return result
+
+
+@pytest.fixture()
+def snapshot_resources():
+    client = MagicMock()
+    namespace = _resource(kind="Namespace", name="test-ns")
+    vm = _resource(kind="VirtualMachine", name="vm-a", namespace="test-ns")
+    for resource in (namespace, vm):
+        resource.client = client
+
+    def _get(namespace, **kwargs):
+        if kwargs.get("label_selector"):
+            return _items(
+                {"metadata": {"name": "virt-launcher-vm-a-x", "labels": {VM_NAME_LABEL: "vm-a"}}},
+                {"metadata": {"name": "virt-launcher-other-y", "labels": {VM_NAME_LABEL: "other"}}},
+            )
+        return _items({
+            "metadata": {"name": "vm-a"},
+            "status": {"phase": "Scheduling"},
+            "lastTimestamp": "2026-01-01T10:00:00Z",
+            "type": "Warning",
+            "reason": "FailedScheduling",
+            "involvedObject": {"kind": "Pod", "name": "virt-launcher-vm-a-x"},
+            "message": "0/3 nodes are available",
+        })
+
+    client.resources.get.return_value.get.side_effect = _get
+    return namespace, vm
+
+
+class TestFailureSnapshotCollector:
+    """Test cases for FailureSnapshotCollector"""
+
+    @patch("utilities.failure_snapshot.VirtualMachine.kind", "VirtualMachine")
+    @patch("utilities.failure_snapshot.get_resource_class_api_version", return_value="v1")
+    @patch("utilities.failure_snapshot.Pod")
+    def test_collect(self, mock_pod_class, mock_api_version, snapshot_resources, tmp_path):
+        """Test that the tracked resources, namespace events, VMIs status and virt-launcher logs are dumped"""
+        mock_pod_class.side_effect = lambda client, name, namespace: MagicMock(name=name, namespace=namespace)
+        collector = FailureSnapshotCollector()
+        collector.enabled = True
+        for resource in snapshot_resources:
+            collector.track(resource=resource)
+
+        with patch.object(FailureSnapshotCollector, "_dump_pod_log") as mock_dump_pod_log:
+            collector.collect(target_dir=str(tmp_path))
+
+        namespace_dir = tmp_path / "test-ns"
+        assert sorted(path.name for path in namespace_dir.iterdir()) == [
+            "events.txt",
+            "namespace-test-ns.yaml",
+            "virtualmachine-vm-a.yaml",
+            "vmis-status.yaml",
+        ]
+        assert (
+            "FailedScheduling Pod/virt-launcher-vm-a-x: 0/3 nodes are available"
+            in (namespace_dir / "events.txt").read_text()
+        )
+        assert "Scheduling" in (namespace_dir / "vmis-status.yaml").read_text()
+        mock_dump_pod_log.assert_called_once()
+        assert mock_pod_class.call_args.kwargs["name"] == "virt-launcher-vm-a-x"
+
+    def test_tracking(self, snapshot_resources):
+        """Test that resources are tracked only while enabled and until the end of the context"""
+        namespace, vm = snapshot_resources
+        collector = FailureSnapshotCollector()
+        collector.track(resource=vm)
+        assert not collector._resources
+
+        collector.enabled = True
+        with collector.tracking(resource=namespace):
+            assert list(collector._resources.values()) == [namespace]
+        assert not collector._resources
+
+    @patch("utilities.failure_snapshot.get_resource_class_api_version", side_effect=RuntimeError("API unreachable"))
+    def test_collect_failures_logged(self, mock_api_version, snapshot_resources, tmp_path):
+        """Test that a failed API call does not stop the snapshot of the other resources"""
+        collector = FailureSnapshotCollector()
+        collector.enabled = True
+        for resource in snapshot_resources:
+            collector.track(resource=resource)
+
+        collector.collect(target_dir=str(tmp_path))
+
+        assert (tmp_path / "test-ns" / "virtualmachine-vm-a.yaml").exists()
+        assert not (tmp_path / "test-ns" / "events.txt").exists()
@@ -0,0 +1,108 @@
+"""Unit tests for fixture_profiler module"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.fixture_profiler import (
+    FIXTURES_PROFILE_FOLDED_FILE_NAME,
+    FIXTURES_PROFILE_REPORT_FILE_NAME,
+    FixtureProfiler,
+)
+
+
+def _mock_fixturedef(name, scope="class"):
+    fixturedef = MagicMock(argname=name, scope=scope, baseid="tests/storage")
+    fixturedef.finalizers = []
+    fixturedef.addfinalizer.side_effect = fixturedef.finalizers.append
+    return fixturedef
+
+
+def _finish(profiler, fixturedef):
+    """Run the fixture finalizers as pytest does, last-in first-out, then the post finalizer hook"""
+    while fixturedef.finalizers:
+        fixturedef.finalizers.pop()()
+    profiler.end_teardown(fixturedef=fixturedef)
+
+
+@pytest.fixture()
+def profiler():
+    fixture_profiler = FixtureProfiler()
+    fixture_profiler.enabled = True
+    fixture_profiler.current_test = "tests/storage/test_dv.py::TestDv::test_a"
+    return fixture_profiler
+
+
+class TestFixtureProfiler:
+    """Test cases for FixtureProfiler"""
+
+    @patch("utilities.fixture_profiler.time.monotonic", side_effect=[0.0, 2.0, 10.0, 13.0])
+    def test_setup_and_teardown_timed(self, mock_monotonic, profiler):
+        """Test that the setup and the teardown of a fixture are timed and attributed to the triggering test"""
+        fixturedef = _mock_fixturedef(name="data_volume")
+
+        with profiler.profile_setup(fixturedef=fixturedef):
+            pass
+        _finish(profiler=profiler, fixturedef=fixturedef)
+
+        [timings] = profiler.report()
+        assert timings["setups"] == 1
+        assert timings["setup_seconds"] == 2.0
+        assert timings["teardown_seconds"] == 3.0
+        assert timings["tests"] == ["tests/storage/test_dv.py::TestDv::test_a"]
+
+    def test_rebuilt_fixture_counted(self, profiler):
+        """Test that each rebuild of a fixture is counted with the test that triggered it"""
+        fixturedef = _mock_fixturedef(name="data_volume")
+        for test_name in ("test_a", "test_b"):
+            profiler.current_test = f"tests/storage/test_dv.py::{test_name}"
+            with profiler.profile_setup(fixturedef=fixturedef):
+                pass
+            _finish(profiler=profiler, fixturedef=fixturedef)
+
+        [timings] = profiler.report()
+        assert timings["setups"] == timings["teardowns"] == 2
+        assert timings["tests"] == ["tests/storage/test_dv.py::test_a", "tests/storage/test_dv.py::test_b"]
+
+    def test_failed_setup_timed(self, profiler):
+        """Test that a fixture setup raising an error is timed"""
+        fixturedef = _mock_fixturedef(name="vm")
+
+        with pytest.raises(ValueError):
+            with profiler.profile_setup(fixturedef=fixturedef):
+                raise ValueError
+
+        assert profiler.report()[0]["setups"] == 1
+
+    def test_disabled_profiler(self, profiler):
+        """Test that nothing is recorded when profiling is disabled"""
+        profiler.enabled = False
+        fixturedef = _mock_fixturedef(name="vm")
+
+        with profiler.profile_setup(fixturedef=fixturedef):
+            pass
+        _finish(profiler=profiler, fixturedef=fixturedef)
+
+        assert not profiler.fixtures
+
+    @patch("utilities.fixture_profiler.time.monotonic", side_effect=[0.0, 1.0, 1.0, 6.0, 6.0, 6.5, 6.5, 6.5])
+    def test_write_report(self, mock_monotonic, profiler, tmp_path):
+        """Test that the report is sorted by total time and the folded stacks are written in milliseconds"""
+        fast_fixturedef = _mock_fixturedef(name="namespace", scope="module")
+        slow_fixturedef = _mock_fixturedef(name="data_volume")
+        for fixturedef in (fast_fixturedef, slow_fixturedef):
+            with profiler.profile_setup(fixturedef=fixturedef):
+                pass
+        for fixturedef in (slow_fixturedef, fast_fixturedef):
+            _finish(profiler=profiler, fixturedef=fixturedef)
+
+        profiler.write_report(report_dir=str(tmp_path))
+
+        report = json.loads((tmp_path / FIXTURES_PROFILE_REPORT_FILE_NAME).read_text())
+        assert [timings["name"] for timings in report] == ["data_volume", "namespace"]
+        assert (tmp_path / FIXTURES_PROFILE_FOLDED_FILE_NAME).read_text().splitlines() == [
+            "tests/storage/test_dv.py;class data_volume;setup 5000",
+            "tests/storage/test_dv.py;class data_volume;teardown 500",
+            "tests/storage/test_dv.py;module namespace;setup 1000",
+        ]
@@ -639,6 +639,23 @@ class TestResourceEditorValidateHCOReconcile:
             mock_parent_restore.assert_called_once()
             mock_wait_hco.assert_called_once()
 
+    @patch("utilities.hco.release_exclusive_workers_lock")
+    @patch("utilities.hco.hold_exclusive_workers_lock")
+    @patch("utilities.hco.wait_for_hco_conditions", new=MagicMock())
+    @patch("utilities.hco.Namespace", new=MagicMock())
+    def test_workers_lock_held_until_restore(self, mock_hold_lock, mock_release_lock):
+        """Test that the exclusive workers lock is held once from the first update until the restore"""
+        editor = ResourceEditorValidateHCOReconcile(admin_client=MagicMock(), patches={MagicMock(): {"spec": {}}})
+
+        with patch("utilities.hco.ResourceEditor.update"), patch("utilities.hco.ResourceEditor.restore"):
+            editor.update()
+            editor.update()
+            mock_release_lock.assert_not_called()
+            editor.restore()
+
+        mock_hold_lock.assert_called_once()
+        mock_release_lock.assert_called_once()
+
 
 class TestModuleConstants:
     """Test cases for module constants"""
@@ -0,0 +1,123 @@
+"""Unit tests for image_upload module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from utilities.image_upload import MEGABYTE, UploadTarget, stream_upload, upload_images
+
+UPLOADPROXY_URL = "https://cdi-uploadproxy.example.com/v1alpha1/upload"
+
+
+def _response(status_code=requests.codes.ok):
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+@pytest.fixture()
+def image_path(tmp_path):
+    image_path = tmp_path / "cirros.qcow2"
+    image_path.write_bytes(b"q" * MEGABYTE)
+    return str(image_path)
+
+
+class TestStreamUpload:
+    """Test cases for stream_upload"""
+
+    @patch("utilities.image_upload.requests.post")
+    def test_image_streamed_from_mapping(self, mock_post, image_path):
+        """Test that the image is sent as a file-like mapping, not as bytes read from the file"""
+        sent_bodies = []
+        mock_post.side_effect = lambda **kwargs: sent_bodies.append(kwargs["data"][:]) or _response()
+
+        result = stream_upload(target=UploadTarget(url=UPLOADPROXY_URL, token="token", image_path=image_path))
+
+        body = mock_post.call_args.kwargs["data"]
+        assert not isinstance(body, bytes) and hasattr(body, "read")
+        assert sent_bodies == [b"q" * MEGABYTE]
+        assert mock_post.call_args.kwargs["headers"] == {"Authorization": "Bearer token"}
+        assert result.succeeded
+        assert result.size == MEGABYTE
+
+    @patch("utilities.image_upload.requests.post")
+    def test_empty_image(self, mock_post, tmp_path):
+        """Test that an empty image, which cannot be mapped, is uploaded"""
+        image_path = tmp_path / "empty.img"
+        image_path.write_bytes(b"")
+        mock_post.return_value = _response()
+
+        result = stream_upload(target=UploadTarget(url=UPLOADPROXY_URL, token="token", image_path=str(image_path)))
+
+        assert mock_post.call_args.kwargs["data"] == b""
+        assert result.size == 0
+
+    @patch("utilities.image_upload.requests.post")
+    def test_connection_error_recorded(self, mock_post, image_path):
+        """Test that a connection error is recorded in the result instead of raised"""
+        mock_post.side_effect = requests.ConnectionError("connection refused")
+
+        result = stream_upload(target=UploadTarget(url=UPLOADPROXY_URL, token="token", image_path=image_path))
+
+        assert not result.succeeded
+        assert isinstance(result.error, requests.ConnectionError)
+
+    def test_missing_image_raises(self, tmp_path):
+        """Test that a missing image file raises OSError"""
+        with pytest.raises(OSError):
+            stream_upload(
+                target=UploadTarget(url=UPLOADPROXY_URL, token="token", image_path=str(tmp_path / "missing.img"))
+            )
+
+
+class TestUploadImages:
+    """Test cases for upload_images"""
+
+    @patch("utilities.image_upload.requests.post")
+    def test_results_in_target_order(self, mock_post, image_path):
+        """Test that each target is uploaded and the failed uploads are reported"""
+        mock_post.side_effect = lambda **kwargs: _response(
+            status_code=requests.codes.unauthorized if kwargs["headers"]["Authorization"] == "Bearer bad" else 200
+        )
+        targets = [
+            UploadTarget(url=UPLOADPROXY_URL, token=token, image_path=image_path) for token in ("dv-0", "bad", "dv-2")
+        ]
+
+        report = upload_images(targets=targets)
+
+        assert [result.target for result in report.results] == targets
+        assert [result.target.token for result in report.failed_uploads] == ["bad"]
+        assert report.size == 2 * MEGABYTE
+
+    @patch("utilities.image_upload.requests.post")
+    def test_concurrent_uploads_bounded(self, mock_post, image_path):
+        """Test that no more than max_workers uploads run at the same time"""
+        lock = threading.Lock()
+        running = {"current": 0, "max": 0}
+        uploads_started = threading.Barrier(parties=2, timeout=5)
+
+        def _post(**kwargs):
+            with lock:
+                running["current"] += 1
+                running["max"] = max(running["max"], running["current"])
+            uploads_started.wait()
+            with lock:
+                running["current"] -= 1
+            return _response()
+
+        mock_post.side_effect = _post
+
+        targets = [UploadTarget(url=UPLOADPROXY_URL, token=f"dv-{index}", image_path=image_path) for index in range(6)]
+
+        upload_images(targets=targets, max_workers=2)
+
+        assert running["max"] == 2
+
+    def test_no_targets(self):
+        """Test that an empty target list returns an empty report"""
+        report = upload_images(targets=[])
+
+        assert not report.results
+        assert report.mb_per_sec == 0.0
@@ -0,0 +1,119 @@
+"""Unit tests for informer module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import utilities.informer
+from utilities.informer import (
+    INFORMER_CACHED_KINDS,
+    InformerCachedInstanceMixin,
+    get_cached_instance,
+    informer_cache,
+    start_informer_cache,
+    stop_informer_cache,
+)
+
+
+class _Resource:
+    api_version = "kubevirt.io/v1"
+    kind = "VirtualMachine"
+    name = "vm-a"
+    namespace = "ns"
+
+    @property
+    def instance(self):
+        return "fresh"
+
+
+class _CachedResource(InformerCachedInstanceMixin, _Resource):
+    pass
+
+
+@pytest.fixture()
+def informers():
+    with patch.dict(utilities.informer._INFORMERS, clear=True):
+        yield utilities.informer._INFORMERS
+
+
+@pytest.fixture()
+def mock_get_watch_stream():
+    with patch("utilities.informer.get_watch_stream") as mock_get_watch_stream:
+        yield mock_get_watch_stream
+
+
+class TestInformerCache:
+    """Test cases for start/stop of the informer cache"""
+
+    def test_start_informer_cache_starts_stream_per_kind(self, informers, mock_get_watch_stream):
+        """Test that an informer stream is started for every cached kind"""
+        start_informer_cache(client=MagicMock(), namespace="ns")
+
+        assert len(informers) == len(INFORMER_CACHED_KINDS)
+        assert mock_get_watch_stream.return_value.start_informer.call_count == len(INFORMER_CACHED_KINDS)
+
+    def test_start_informer_cache_is_idempotent(self, informers, mock_get_watch_stream):
+        """Test that starting the cache twice for a namespace does not start new streams"""
+        start_informer_cache(client=MagicMock(), namespace="ns")
+        start_informer_cache(client=MagicMock(), namespace="ns")
+
+        assert mock_get_watch_stream.return_value.start_informer.call_count == len(INFORMER_CACHED_KINDS)
+
+    def test_stop_informer_cache_only_stops_namespace(self, informers, mock_get_watch_stream):
+        """Test that stopping the cache of one namespace keeps the other namespaces"""
+        start_informer_cache(client=MagicMock(), namespace="ns1")
+        start_informer_cache(client=MagicMock(), namespace="ns2")
+
+        stop_informer_cache(namespace="ns1")
+
+        assert {key[2] for key in informers} == {"ns2"}
+
+    def test_informer_cache_context_manager(self, informers, mock_get_watch_stream):
+        """Test that the context manager stops the cache on exit"""
+        with informer_cache(client=MagicMock(), namespace="ns"):
+            assert informers
+
+        assert not informers
+        assert mock_get_watch_stream.return_value.stop_informer.called
+
+
+class TestGetCachedInstance:
+    """Test cases for get_cached_instance"""
+
+    def test_no_informer(self, informers):
+        """Test that None is returned when no informer runs for the namespace"""
+        assert get_cached_instance(resource=_Resource()) is None
+
+    def test_informer_not_synced(self, informers):
+        """Test that None is returned until the informer is synced"""
+        stream = MagicMock(synced=False)
+        informers[(_Resource.api_version, _Resource.kind, _Resource.namespace)] = stream
+
+        assert get_cached_instance(resource=_Resource()) is None
+
+    def test_informer_synced(self, informers):
+        """Test that the informer object is returned when synced"""
+        stream = MagicMock(synced=True)
+        informers[(_Resource.api_version, _Resource.kind, _Resource.namespace)] = stream
+
+        assert get_cached_instance(resource=_Resource()) == stream.get.return_value
+        stream.get.assert_called_once_with(name="vm-a")
+
+
+class TestInformerCachedInstanceMixin:
+    """Test cases for InformerCachedInstanceMixin"""
+
+    @patch("utilities.informer.get_cached_instance", return_value="cached")
+    def test_instance_served_from_cache(self, mock_get_cached_instance):
+        """Test that instance is served from the cache when available"""
+        assert _CachedResource().instance == "cached"
+
+    @patch("utilities.informer.get_cached_instance", return_value=None)
+    def test_instance_cache_miss_reads_cluster(self, mock_get_cached_instance):
+        """Test that a cache miss falls back to a cluster read"""
+        assert _CachedResource().instance == "fresh"
+
+    @patch("utilities.informer.get_cached_instance", return_value="cached")
+    def test_fresh_instance_bypasses_cache(self, mock_get_cached_instance):
+        """Test that fresh_instance always reads from the cluster"""
+        assert _CachedResource().fresh_instance == "fresh"
@@ -0,0 +1,80 @@
+"""Unit tests for must_gather_collector module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.must_gather_collector import MUST_GATHER_LOCATION_FILE_NAME, MustGatherCollector
+
+
+@pytest.fixture()
+def mock_collect():
+    with patch("utilities.must_gather_collector.collect_default_cnv_must_gather_with_vm_gather") as collect:
+        yield collect
+
+
+class TestMustGatherCollector:
+    """Test cases for MustGatherCollector"""
+
+    @patch("utilities.must_gather_collector.write_to_file")
+    @patch("utilities.must_gather_collector.run_command")
+    def test_failures_coalesced(self, mock_run_command, mock_write_to_file, mock_collect):
+        """Test that failures within the window are collected once with the widest since and all namespaces"""
+        collector = MustGatherCollector(coalesce_window=60)
+        admin_client = MagicMock()
+        collector.request(
+            admin_client=admin_client,
+            test_name="test_a",
+            since_time=300,
+            target_dir="/logs/test_a",
+            inspect_resources=["namespace/openshift-storage"],
+        )
+        collector.request(
+            admin_client=admin_client,
+            test_name="test_b",
+            since_time=900,
+            target_dir="/logs/test_b",
+            inspect_resources=["namespace/openshift-nmstate", "namespace/openshift-storage"],
+        )
+
+        collector.wait()
+
+        mock_collect.assert_called_once()
+        assert mock_collect.call_args.kwargs["target_dir"] == "/logs/test_a"
+        assert mock_collect.call_args.kwargs["since_time"] >= 900
+        inspect_command = mock_run_command.call_args.kwargs["command"]
+        assert inspect_command.count("namespace/openshift-storage") == 1
+        assert "namespace/openshift-nmstate" in inspect_command
+        mock_write_to_file.assert_called_once()
+        assert mock_write_to_file.call_args.kwargs["file_name"] == MUST_GATHER_LOCATION_FILE_NAME
+        assert mock_write_to_file.call_args.kwargs["base_directory"] == "/logs/test_b"
+
+    @patch("utilities.must_gather_collector.run_command")
+    def test_collection_runs_in_background(self, mock_run_command, mock_collect):
+        """Test that a failure is collected after the window without waiting for the session end"""
+        collector = MustGatherCollector(coalesce_window=0)
+
+        collector.request(admin_client=MagicMock(), test_name="test_a", since_time=300, target_dir="/logs/test_a")
+        collector._thread.join(timeout=0.5)
+
+        mock_collect.assert_called_once()
+        mock_run_command.assert_not_called()
+        collector.wait()
+        assert collector._thread is None
+
+    def test_collection_failure_logged(self, mock_collect):
+        """Test that a failed collection does not stop the collector"""
+        mock_collect.side_effect = [RuntimeError("must-gather failed"), None]
+        collector = MustGatherCollector(coalesce_window=0)
+
+        for test_name in ("test_a", "test_b"):
+            collector.request(admin_client=MagicMock(), test_name=test_name, since_time=300, target_dir="/logs")
+            collector.wait()
+
+        assert mock_collect.call_count == 2
+
+    def test_wait_without_failures(self, mock_collect):
+        """Test that waiting without any failure returns immediately"""
+        MustGatherCollector().wait()
+
+        mock_collect.assert_not_called()
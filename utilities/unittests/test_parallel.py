@@ -0,0 +1,218 @@
+"""Unit tests for parallel module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+import utilities.parallel
+from utilities.exceptions import SessionResourceSetupError
+from utilities.parallel import (
+    NAMESPACE_NAME_MAX_LENGTH,
+    ParallelWorkerPlugin,
+    SessionResourceLeader,
+    WorkersLock,
+    get_worker_namespace_name,
+    get_worker_path,
+    hold_exclusive_workers_lock,
+    is_xdist_controller,
+    release_exclusive_workers_lock,
+)
+
+
+@pytest.fixture()
+def coordination_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run-1")
+    with patch("utilities.parallel.tempfile.gettempdir", return_value=str(tmp_path)):
+        yield tmp_path / "cnv-tests-workers-run-1"
+
+
+def _worker_leader(worker_id, monkeypatch, name="utility-daemonset"):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", worker_id)
+    return SessionResourceLeader(name=name, timeout=1)
+
+
+class TestWorkerNames:
+    """Test cases for the per-worker names"""
+
+    def test_names_unchanged_outside_workers(self, monkeypatch):
+        """Test that names are kept when not running as an xdist worker"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+
+        assert get_worker_namespace_name(name="network-ns") == "network-ns"
+        assert get_worker_path(path="report.json") == "report.json"
+
+    def test_worker_suffix(self, monkeypatch):
+        """Test that the worker id is appended to namespace names and file paths"""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+
+        assert get_worker_namespace_name(name="network-ns") == "network-ns-gw3"
+        assert get_worker_path(path="/tmp/report.json") == "/tmp/report-gw3.json"
+
+    def test_long_namespace_name_truncated(self, monkeypatch):
+        """Test that the suffixed namespace name fits the namespace name length limit"""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw12")
+
+        name = get_worker_namespace_name(name="a" * 60 + "-bcd")
+
+        assert len(name) <= NAMESPACE_NAME_MAX_LENGTH
+        assert name.endswith("-gw12")
+
+    @pytest.mark.parametrize(
+        "numprocesses, worker_id, expected",
+        [
+            pytest.param(None, None, False, id="serial-run"),
+            pytest.param(4, None, True, id="controller"),
+            pytest.param(4, "gw0", False, id="worker"),
+        ],
+    )
+    def test_is_xdist_controller(self, monkeypatch, numprocesses, worker_id, expected):
+        """Test that only the process which starts the xdist workers is the controller"""
+        if worker_id:
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", worker_id)
+        else:
+            monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        config = MagicMock()
+        config.option.numprocesses = numprocesses
+
+        assert is_xdist_controller(config=config) is expected
+
+
+class TestSessionResourceLeader:
+    """Test cases for SessionResourceLeader"""
+
+    def test_single_process_is_leader(self, monkeypatch):
+        """Test that outside of xdist workers the process leads and never waits"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+
+        with SessionResourceLeader(name="utility-daemonset") as leader:
+            assert leader.is_leader
+            leader.ready()
+            leader.wait_ready()
+            leader.wait_for_followers()
+
+    def test_first_worker_leads_and_followers_reuse(self, coordination_dir, monkeypatch):
+        """Test that the first worker leads, followers wait for its setup and the leader waits for followers"""
+        leader = _worker_leader(worker_id="gw0", monkeypatch=monkeypatch).__enter__()
+        follower = _worker_leader(worker_id="gw1", monkeypatch=monkeypatch).__enter__()
+        assert leader.is_leader
+        assert not follower.is_leader
+
+        leader.ready()
+        follower.wait_ready()
+        follower.__exit__(None, None, None)
+        leader.wait_for_followers()
+        leader.__exit__(None, None, None)
+
+        # Torn down: the next worker leads a new setup
+        assert _worker_leader(worker_id="gw1", monkeypatch=monkeypatch).__enter__().is_leader
+
+    def test_leader_waits_for_followers(self, coordination_dir, monkeypatch):
+        """Test that the leader does not tear down the resource while a follower uses it"""
+        leader = _worker_leader(worker_id="gw0", monkeypatch=monkeypatch).__enter__()
+        _worker_leader(worker_id="gw1", monkeypatch=monkeypatch).__enter__()
+        leader.ready()
+
+        with patch("utilities.parallel.TIMEOUT_5SEC", 0.1):
+            with pytest.raises(TimeoutExpiredError):
+                leader.wait_for_followers()
+
+    def test_leader_setup_failure_raised_in_followers(self, coordination_dir, monkeypatch):
+        """Test that followers fail when the leader exits without setting the resource up"""
+        leader = _worker_leader(worker_id="gw0", monkeypatch=monkeypatch).__enter__()
+        follower = _worker_leader(worker_id="gw1", monkeypatch=monkeypatch).__enter__()
+
+        leader.__exit__(ValueError, ValueError(), None)
+
+        with pytest.raises(SessionResourceSetupError):
+            follower.wait_ready()
+
+    def test_join_waits_while_torn_down(self, coordination_dir, monkeypatch):
+        """Test that a worker cannot join a resource whose teardown started"""
+        leader = _worker_leader(worker_id="gw0", monkeypatch=monkeypatch).__enter__()
+        leader.ready()
+        leader.wait_for_followers()
+
+        assert not _worker_leader(worker_id="gw1", monkeypatch=monkeypatch)._join()
+
+
+class TestWorkersLock:
+    """Test cases for WorkersLock"""
+
+    def test_shared_locks_concurrent(self, tmp_path):
+        """Test that several workers hold the shared lock together"""
+        first_lock, second_lock = WorkersLock(directory=str(tmp_path)), WorkersLock(directory=str(tmp_path))
+
+        first_lock.acquire(exclusive=False)
+        second_lock.acquire(exclusive=False)
+
+        assert first_lock.exclusive is second_lock.exclusive is False
+        first_lock.close()
+        second_lock.close()
+
+    def test_exclusive_lock_blocks_shared(self, tmp_path):
+        """Test that a worker waits for the exclusive lock holder to finish its module"""
+        exclusive_lock, shared_lock = WorkersLock(directory=str(tmp_path)), WorkersLock(directory=str(tmp_path))
+        exclusive_lock.acquire(exclusive=True)
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (shared_lock.acquire(exclusive=False), acquired.set()))
+
+        waiter.start()
+        assert not acquired.wait(timeout=0.5)
+        exclusive_lock.release()
+        assert acquired.wait(timeout=5)
+
+        waiter.join()
+        exclusive_lock.close()
+        shared_lock.close()
+
+
+class TestParallelWorkerPlugin:
+    """Test cases for ParallelWorkerPlugin"""
+
+    @staticmethod
+    def _run_test(plugin, item, nextitem):
+        protocol = plugin.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        next(protocol)
+        with pytest.raises(StopIteration):
+            next(protocol)
+
+    def test_destructive_module_exclusive(self):
+        """Test that modules with destructive tests hold the exclusive lock until their last test"""
+        plugin = ParallelWorkerPlugin()
+        destructive_item = MagicMock(nodeid="tests/a.py::test_1")
+        destructive_item.get_closest_marker.return_value = MagicMock()
+        module_items = [destructive_item, MagicMock(nodeid="tests/a.py::test_2")]
+        next_module_item = MagicMock(nodeid="tests/b.py::test_1")
+        for item in module_items[1:] + [next_module_item]:
+            item.get_closest_marker.return_value = None
+        plugin.pytest_collection_modifyitems(items=[*module_items, next_module_item])
+
+        workers_lock = MagicMock(exclusive=None, holds=0)
+        with patch.object(utilities.parallel, "_WORKERS_LOCK", workers_lock):
+            self._run_test(plugin=plugin, item=module_items[0], nextitem=module_items[1])
+            workers_lock.exclusive = True
+            self._run_test(plugin=plugin, item=module_items[1], nextitem=next_module_item)
+
+        workers_lock.acquire.assert_called_once_with(exclusive=True)
+        workers_lock.release.assert_called_once()
+
+    def test_held_lock_kept_until_released(self):
+        """Test that a cluster-global edit keeps the exclusive lock past the end of the module until it is restored"""
+        plugin = ParallelWorkerPlugin()
+        items = [MagicMock(nodeid="tests/a.py::test_1"), MagicMock(nodeid="tests/b.py::test_1")]
+        for item in items:
+            item.get_closest_marker.return_value = None
+        plugin.pytest_collection_modifyitems(items=items)
+
+        workers_lock = MagicMock(exclusive=None, holds=0)
+        with patch.object(utilities.parallel, "_WORKERS_LOCK", workers_lock):
+            hold_exclusive_workers_lock()
+            self._run_test(plugin=plugin, item=items[0], nextitem=items[1])
+            workers_lock.release.assert_not_called()
+
+            release_exclusive_workers_lock()
+            self._run_test(plugin=plugin, item=items[1], nextitem=None)
+
+        workers_lock.release.assert_called_once()
@@ -22,12 +22,16 @@ from utilities.constants.instance_types import (
     CENTOS_STREAM9_PREFERENCE,
     RHEL9_PREFERENCE,
 )
-from utilities.exceptions import MissingEnvironmentVariableError, UnsupportedCPUArchitectureError
+from utilities.exceptions import (
+    ClusterLockConflictError,
+    MissingEnvironmentVariableError,
+    UnsupportedCPUArchitectureError,
+)
 from utilities.pytest_utils import (
     _validate_storage_class_options,
+    acquire_cluster_lock,
     assert_incremental_classes_fully_collected,
     config_default_storage_class,
-    deploy_run_in_progress_config_map,
     deploy_run_in_progress_namespace,
     exit_pytest_execution,
     filter_hpp_tests,
@@ -43,10 +47,8 @@ from utilities.pytest_utils import (
     mark_nmstate_dependent_tests,
     remove_tests_from_list,
     reorder_early_fixtures,
-    run_in_progress_config_map,
     separator,
     skip_if_pytest_flags_exists,
-    stop_if_run_in_progress,
     update_cpu_arch_related_config,
     update_latest_os_config,
     validate_collected_tests_arch_params,
@@ -880,40 +882,39 @@ class TestMarkNmstateDependentTests:
         item.add_marker.assert_not_called()
 
 
-class TestStopIfRunInProgress:
-    """Test cases for stop_if_run_in_progress function"""
+class TestAcquireClusterLock:
+    """Test cases for acquire_cluster_lock function"""
 
-    @patch("utilities.pytest_utils.run_in_progress_config_map")
+    @patch("utilities.pytest_utils.get_current_running_data", return_value={"user": "test_user"})
+    @patch("utilities.pytest_utils.ClusterLock")
     @patch("utilities.pytest_utils.exit_pytest_execution")
-    def test_stop_if_run_in_progress_exists(self, mock_exit, mock_config_map):
-        """Test stopping when run is in progress"""
-        mock_cm = MagicMock()
-        mock_cm.exists = True
-        mock_cm.instance.data = {"user": "test_user"}
-        mock_cm.namespace = "test-namespace"
-        mock_cm.name = "test-configmap"
-        mock_config_map.return_value = mock_cm
+    def test_acquire_cluster_lock_conflict(self, mock_exit, mock_cluster_lock_class, mock_get_data):
+        """Test stopping when a session holding a conflicting lock is running"""
+        mock_cluster_lock_class.return_value.acquire.side_effect = ClusterLockConflictError("held by test_user")
+        mock_session = MagicMock()
+        mock_session.config.getoption.side_effect = {"cluster_lock_mode": "shared", "cluster_lock_mutates": "hco"}.get
         mock_client = MagicMock()
 
-        stop_if_run_in_progress(client=mock_client)
+        acquire_cluster_lock(client=mock_client, session=mock_session)
 
-        mock_config_map.assert_called_once_with(client=mock_client)
+        assert mock_cluster_lock_class.call_args[1]["mode"] == "shared"
+        assert mock_cluster_lock_class.call_args[1]["mutated_resources"] == ["hco"]
         mock_exit.assert_called_once()
-        assert "test_user" in mock_exit.call_args[1]["log_message"]
+        assert "held by test_user" in mock_exit.call_args[1]["log_message"]
         assert mock_exit.call_args[1]["return_code"] == 100
 
-    @patch("utilities.pytest_utils.run_in_progress_config_map")
+    @patch("utilities.pytest_utils.get_current_running_data")
+    @patch("utilities.pytest_utils.ClusterLock")
     @patch("utilities.pytest_utils.exit_pytest_execution")
-    def test_stop_if_run_in_progress_not_exists(self, mock_exit, mock_config_map):
-        """Test not stopping when no run is in progress"""
-        mock_cm = MagicMock()
-        mock_cm.exists = False
-        mock_config_map.return_value = mock_cm
-        mock_client = MagicMock()
+    def test_acquire_cluster_lock_no_conflict(self, mock_exit, mock_cluster_lock_class, mock_get_data):
+        """Test not stopping when the lock is acquired"""
+        mock_session = MagicMock()
+        mock_session.config.getoption.side_effect = {"cluster_lock_mode": "exclusive"}.get
 
-        stop_if_run_in_progress(client=mock_client)
+        result = acquire_cluster_lock(client=MagicMock(), session=mock_session)
 
-        mock_config_map.assert_called_once_with(client=mock_client)
+        assert result == mock_cluster_lock_class.return_value
+        result.acquire.assert_called_once()
         mock_exit.assert_not_called()
 
 
@@ -952,66 +953,6 @@ class TestDeployRunInProgressNamespace:
         mock_namespace.deploy.assert_not_called()
 
 
-class TestDeployRunInProgressConfigMap:
-    """Test cases for deploy_run_in_progress_config_map function"""
-
-    @patch("utilities.pytest_utils.run_in_progress_config_map")
-    def test_deploy_run_in_progress_config_map(self, mock_config_map):
-        """Test deploying run in progress config map"""
-        mock_cm = MagicMock()
-        mock_config_map.return_value = mock_cm
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-
-        deploy_run_in_progress_config_map(client=mock_client, session=mock_session)
-
-        mock_config_map.assert_called_once_with(client=mock_client, session=mock_session)
-        mock_cm.deploy.assert_called_once_with(wait=True)
-
-
-class TestRunInProgressConfigMap:
-    """Test cases for run_in_progress_config_map function"""
-
-    @patch("utilities.pytest_utils.get_current_running_data")
-    @patch("utilities.pytest_utils.ConfigMap")
-    def test_run_in_progress_config_map_with_session(self, mock_config_map_class, mock_get_data):
-        """Test creating config map with session data"""
-        mock_session = MagicMock()
-        mock_data = {"test": "data"}
-        mock_get_data.return_value = mock_data
-        mock_cm = MagicMock()
-        mock_config_map_class.return_value = mock_cm
-        mock_client = MagicMock()
-
-        result = run_in_progress_config_map(client=mock_client, session=mock_session)
-
-        assert result == mock_cm
-        mock_get_data.assert_called_once_with(session=mock_session)
-        mock_config_map_class.assert_called_once_with(
-            client=mock_client,
-            name="cnv-tests-run-in-progress",
-            namespace="cnv-tests-run-in-progress-ns",
-            data=mock_data,
-        )
-
-    @patch("utilities.pytest_utils.ConfigMap")
-    def test_run_in_progress_config_map_without_session(self, mock_config_map_class):
-        """Test creating config map without session data"""
-        mock_cm = MagicMock()
-        mock_config_map_class.return_value = mock_cm
-        mock_client = MagicMock()
-
-        result = run_in_progress_config_map(client=mock_client, session=None)
-
-        assert result == mock_cm
-        mock_config_map_class.assert_called_once_with(
-            client=mock_client,
-            name="cnv-tests-run-in-progress",
-            namespace="cnv-tests-run-in-progress-ns",
-            data=None,
-        )
-
-
 class TestGetCurrentRunningData:
     """Test cases for get_current_running_data function"""
 
@@ -0,0 +1,52 @@
+"""Unit tests for rate_limiter module"""
+
+from unittest.mock import patch
+
+import pytest
+
+from utilities.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    @patch("utilities.rate_limiter.time.sleep")
+    def test_burst_not_delayed(self, mock_sleep):
+        """Test that up to burst acquisitions return without waiting"""
+        rate_limiter = TokenBucket(qps=1, burst=3)
+
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch("utilities.rate_limiter.time.monotonic", return_value=100.0)
+    @patch("utilities.rate_limiter.time.sleep")
+    def test_acquisitions_over_burst_spaced_by_qps(self, mock_sleep, mock_monotonic):
+        """Test that acquisitions over the burst wait 1/qps apart"""
+        rate_limiter = TokenBucket(qps=2, burst=1)
+
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("utilities.rate_limiter.time.sleep")
+    def test_tokens_refilled_over_time(self, mock_sleep):
+        """Test that tokens are refilled at qps, up to burst"""
+        with patch("utilities.rate_limiter.time.monotonic", return_value=100.0):
+            rate_limiter = TokenBucket(qps=1, burst=2)
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+
+        with patch("utilities.rate_limiter.time.monotonic", return_value=110.0):
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("qps, burst", [(0, 1), (1, 0)])
+    def test_invalid_limits(self, qps, burst):
+        """Test that non-positive limits are rejected"""
+        with pytest.raises(ValueError):
+            TokenBucket(qps=qps, burst=burst)
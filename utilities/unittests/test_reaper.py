@@ -0,0 +1,108 @@
+"""Unit tests for reaper module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.exceptions import ForbiddenError
+from ocp_resources.exceptions import ResourceTeardownError
+
+import utilities.reaper
+from utilities.reaper import TeardownReaper, get_teardown_reaper, wait_for_teardown_reaper
+
+
+def _mock_resource(name, deleted=True):
+    resource = MagicMock()
+    resource.name = name
+    resource.kind = "VirtualMachine"
+    resource.wait_deleted.return_value = deleted
+    return resource
+
+
+@pytest.fixture()
+def reaper():
+    teardown_reaper = TeardownReaper(max_workers=4, timeout=1)
+    yield teardown_reaper
+    teardown_reaper._executor.shutdown(wait=True)
+
+
+class TestTeardownReaper:
+    """Test cases for TeardownReaper"""
+
+    def test_reap_deletes_and_waits(self, reaper):
+        """Test that every resource is cleaned up without blocking and waited for deletion"""
+        resources = [_mock_resource(name=f"vm-{idx}") for idx in range(3)]
+
+        reaper.reap(resources=resources, wait=True)
+
+        for resource in resources:
+            resource.clean_up.assert_called_once_with(wait=False)
+            resource.wait_deleted.assert_called_once_with(timeout=1)
+        assert not reaper._futures
+
+    def test_reap_is_concurrent(self, reaper):
+        """Test that the deletions of different resources overlap"""
+        barrier = threading.Barrier(parties=2, timeout=5)
+        resources = [_mock_resource(name=f"vm-{idx}") for idx in range(2)]
+        for resource in resources:
+            resource.clean_up.side_effect = lambda wait: barrier.wait()
+
+        reaper.reap(resources=resources, wait=True)
+
+    def test_forbidden_resource_skipped(self, reaper):
+        """Test that a resource the client may not delete is skipped"""
+        resource = _mock_resource(name="shared-dv")
+        resource.clean_up.side_effect = ForbiddenError(MagicMock())
+
+        reaper.reap(resources=[resource], wait=True)
+
+        resource.wait_deleted.assert_not_called()
+
+    def test_deletion_timeout_raises(self, reaper):
+        """Test that a resource not deleted in time fails the barrier"""
+        reaper.reap(resources=[_mock_resource(name="vm-stuck", deleted=False)])
+
+        with pytest.raises(ResourceTeardownError):
+            reaper.wait()
+
+    @patch("utilities.reaper.TimeoutSampler", return_value=iter([[MagicMock()], []]))
+    def test_reap_collection(self, mock_sampler, reaper):
+        """Test that a collection is deleted with one request and waited for until empty"""
+        client = MagicMock()
+        resource_class = MagicMock(api_version="kubevirt.io/v1", kind="VirtualMachine")
+
+        collection_deletion = reaper.reap_collection(
+            client=client, resource_class=resource_class, namespace="ns", label_selector="a=b"
+        )
+        reaper.wait(futures=[collection_deletion])
+
+        client.resources.get.return_value.delete.assert_called_once_with(namespace="ns", label_selector="a=b")
+
+    @patch("utilities.reaper.TimeoutSampler", return_value=iter([[]]))
+    def test_reap_collection_without_selector(self, mock_sampler, reaper):
+        """Test that a collection without a label selector is deleted with one namespace-wide request"""
+        client = MagicMock()
+        resource_class = MagicMock(api_version="kubevirt.io/v1", kind="VirtualMachine")
+
+        collection_deletion = reaper.reap_collection(client=client, resource_class=resource_class, namespace="ns")
+        reaper.wait(futures=[collection_deletion])
+
+        client.resources.get.return_value.delete.assert_called_once_with(
+            namespace="ns", field_selector="metadata.namespace=ns"
+        )
+
+
+class TestSessionTeardownReaper:
+    """Test cases for the session teardown reaper"""
+
+    def test_session_reaper_drained_at_barrier(self):
+        """Test that the session barrier waits for pending deletions and resets the reaper"""
+        with patch.object(utilities.reaper, "_TEARDOWN_REAPER", None):
+            session_reaper = get_teardown_reaper()
+            assert get_teardown_reaper() is session_reaper
+
+            with patch.object(TeardownReaper, "close") as mock_close:
+                wait_for_teardown_reaper()
+
+            mock_close.assert_called_once()
+            assert utilities.reaper._TEARDOWN_REAPER is None
@@ -0,0 +1,243 @@
+"""Unit tests for ssh_pool module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.exceptions import NotFoundError
+from paramiko import ChannelException, SSHException
+
+import utilities.ssh_pool
+from utilities.ssh_pool import (
+    PooledSSHExecutor,
+    close_all_ssh_sessions,
+    close_vm_ssh_session,
+    get_pooled_executor,
+)
+
+
+@pytest.fixture()
+def ssh_pool():
+    with patch.dict(utilities.ssh_pool._POOL, clear=True):
+        yield utilities.ssh_pool._POOL
+
+
+@pytest.fixture()
+def mock_vm():
+    vm = MagicMock()
+    vm.name = "vm-a"
+    vm.namespace = "ns"
+    vm.vmi.instance.metadata.uid = "uid-1"
+    vm.vmi.instance.status.nodeName = "node-1"
+    return vm
+
+
+@pytest.fixture()
+def mock_user():
+    ssh_user = MagicMock()
+    ssh_user.name = "fedora"
+    ssh_user.credentials = "password"
+    return ssh_user
+
+
+class TestPooledSSHExecutor:
+    """Test cases for PooledSSHExecutor"""
+
+    def test_session_opened_once(self):
+        """Test that consecutive commands reuse one session"""
+        executor = MagicMock()
+        executor.session.return_value.run_cmd.return_value = (0, "out", "")
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        pooled_executor.run_cmd(cmd=["true"])
+        pooled_executor.run_cmd(cmd=["true"])
+
+        executor.session.assert_called_once()
+        executor.session.return_value.open.assert_called_once()
+        assert executor.session.return_value.run_cmd.call_count == 2
+
+    def test_session_context_manager_keeps_session_open(self):
+        """Test that exiting the session context manager does not close the pooled session"""
+        executor = MagicMock()
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        with pooled_executor.session() as session:
+            session.run_cmd(cmd=["true"])
+
+        executor.session.return_value.close.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "channel_error",
+        [
+            pytest.param(SSHException("SSH session not active"), id="transport-not-active"),
+            pytest.param(ChannelException(2, "Connect failed"), id="channel-refused"),
+        ],
+    )
+    def test_reconnect_when_command_not_sent(self, channel_error):
+        """Test that a command whose channel did not open is retried once on a new session"""
+        executor = MagicMock()
+        executor.session.return_value.run_cmd.side_effect = [channel_error, (0, "out", "")]
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        assert pooled_executor.run_cmd(cmd=["true"]) == (0, "out", "")
+        assert executor.session.call_count == 2
+        executor.session.return_value.close.assert_called_once()
+
+    def test_reconnect_when_session_open_fails(self):
+        """Test that a session which failed to open is opened again"""
+        executor = MagicMock()
+        executor.session.return_value.open.side_effect = [EOFError("closed"), None]
+        executor.session.return_value.run_cmd.return_value = (0, "out", "")
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        assert pooled_executor.run_cmd(cmd=["true"]) == (0, "out", "")
+        executor.session.return_value.run_cmd.assert_called_once()
+
+    def test_sent_command_not_retried(self):
+        """Test that a command which failed after it was sent is not run again"""
+        executor = MagicMock()
+        executor.session.return_value.run_cmd.side_effect = SSHException("broken")
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        with pytest.raises(SSHException, match="broken"):
+            pooled_executor.run_cmd(cmd=["sudo", "reboot"])
+
+        executor.session.return_value.run_cmd.assert_called_once()
+        executor.session.return_value.close.assert_called_once()
+
+    def test_inactive_transport_is_replaced(self):
+        """Test that an inactive transport is not reused"""
+        executor = MagicMock()
+        executor.session.return_value._ssh.get_transport.return_value.is_active.return_value = False
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        pooled_executor.run_cmd(cmd=["true"])
+        pooled_executor.run_cmd(cmd=["true"])
+
+        assert executor.session.call_count == 2
+
+    def test_closed_client_is_replaced(self):
+        """Test that a session whose client was closed, and has no transport, is not reused"""
+        executor = MagicMock()
+        executor.session.return_value._ssh.get_transport.return_value = None
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        pooled_executor.run_cmd(cmd=["true"])
+        pooled_executor.run_cmd(cmd=["true"])
+
+        assert executor.session.call_count == 2
+
+    def test_transport_failure_flagged(self):
+        """Test that a broken transport flags the executor so the VMI is re-read before it is reused"""
+        executor = MagicMock()
+        executor.session.return_value.run_cmd.side_effect = [SSHException("SSH session not active"), (0, "out", "")]
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        pooled_executor.run_cmd(cmd=["true"])
+
+        assert pooled_executor.transport_failed
+
+    def test_unknown_attributes_delegated(self):
+        """Test that other executor attributes are delegated to the wrapped executor"""
+        executor = MagicMock()
+        pooled_executor = PooledSSHExecutor(executor=executor, name="ns/vm-a")
+
+        pooled_executor.is_connective(tcp_timeout=10)
+
+        executor.is_connective.assert_called_once_with(tcp_timeout=10)
+
+
+class TestGetPooledExecutor:
+    """Test cases for get_pooled_executor"""
+
+    def test_same_vmi_reuses_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that the pooled executor is reused while the VMI and credentials are unchanged"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        second = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+
+        assert isinstance(first, PooledSSHExecutor)
+        assert first is second
+
+    def test_pooled_executor_reused_without_reading_vmi(self, ssh_pool, mock_vm, mock_user):
+        """Test that reusing the pooled executor does not read the VMI from the cluster"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        type(mock_vm.vmi).instance = property(MagicMock(side_effect=AssertionError("VMI read")))
+
+        assert get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user) is first
+
+    def test_credentials_change_replaces_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that other credentials replace the pooled executor"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        mock_user.credentials = "other-password"
+
+        assert get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user) is not first
+
+    def test_vmi_restart_replaces_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that a new VMI UID closes and replaces the pooled executor once its transport failed"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        mock_vm.vmi.instance.metadata.uid = "uid-2"
+        first.transport_failed = True
+
+        with patch.object(PooledSSHExecutor, "close") as mock_close:
+            second = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+
+        assert first is not second
+        mock_close.assert_called_once()
+
+    def test_vmi_migration_replaces_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that a node change (migration) replaces the pooled executor"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        mock_vm.vmi.instance.status.nodeName = "node-2"
+        first.transport_failed = True
+
+        assert get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user) is not first
+
+    def test_same_vmi_after_transport_failure_reuses_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that the pooled executor is kept if the VMI is unchanged after a transport failure"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        first.transport_failed = True
+
+        assert get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user) is first
+        assert not first.transport_failed
+
+    def test_informer_cache_restart_replaces_executor(self, ssh_pool, mock_vm, mock_user):
+        """Test that a restart seen by the informer cache replaces the pooled executor before any transport failure"""
+        first = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+        cached_vmi = MagicMock()
+        cached_vmi.metadata.uid = "uid-2"
+        cached_vmi.status.nodeName = "node-1"
+
+        with patch("utilities.ssh_pool.get_cached_instance", return_value=cached_vmi):
+            assert get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user) is not first
+
+    def test_missing_vmi_not_pooled(self, ssh_pool, mock_vm, mock_user):
+        """Test that the executor is returned as-is when the VMI does not exist"""
+        type(mock_vm.vmi).instance = property(MagicMock(side_effect=NotFoundError(MagicMock())))
+        executor = MagicMock()
+
+        assert get_pooled_executor(vm=mock_vm, executor=executor, user=mock_user) is executor
+        assert not ssh_pool
+
+
+class TestCloseSSHSessions:
+    """Test cases for closing pooled sessions"""
+
+    def test_close_vm_ssh_session(self, ssh_pool, mock_vm, mock_user):
+        """Test that closing a VM session removes it from the pool"""
+        pooled_executor = get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+
+        with patch.object(PooledSSHExecutor, "close") as mock_close:
+            close_vm_ssh_session(vm=mock_vm)
+
+        assert not ssh_pool
+        mock_close.assert_called_once()
+        assert isinstance(pooled_executor, PooledSSHExecutor)
+
+    def test_close_all_ssh_sessions(self, ssh_pool, mock_vm, mock_user):
+        """Test that all pooled sessions are closed"""
+        get_pooled_executor(vm=mock_vm, executor=MagicMock(), user=mock_user)
+
+        with patch.object(PooledSSHExecutor, "close") as mock_close:
+            close_all_ssh_sessions()
+
+        assert not ssh_pool
+        mock_close.assert_called_once()
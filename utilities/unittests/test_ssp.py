@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from kubernetes.dynamic.exceptions import NotFoundError
+from ocp_resources.data_import_cron import DataImportCron
 from timeout_sampler import TimeoutExpiredError
 
 # Need to mock additional circular imports for ssp
@@ -160,24 +161,25 @@ class TestMatrixAutoBootDataImportCronPrefixes:
 class TestGetDataImportCrons:
     """Test cases for get_data_import_crons function"""
 
-    @patch("utilities.ssp.DataImportCron")
-    def test_get_data_import_crons_success(self, mock_dic_class):
-        """Test successful retrieval of data import crons"""
+    @patch("utilities.ssp.get_resource_catalog")
+    def test_get_data_import_crons_success(self, mock_get_resource_catalog):
+        """Test data import crons are read from the DataImportCron catalog"""
         mock_admin_client = MagicMock()
         mock_namespace = MagicMock()
         mock_namespace.name = "test-namespace"
 
-        mock_cron1 = MagicMock()
-        mock_cron1.name = "rhel9-auto-update"
-        mock_cron2 = MagicMock()
-        mock_cron2.name = "fedora41-auto-update"
-
-        mock_dic_class.get.return_value = [mock_cron1, mock_cron2]
+        mock_cron_instance1 = MagicMock()
+        mock_cron_instance2 = MagicMock()
+        mock_catalog = mock_get_resource_catalog.return_value
+        mock_catalog.list.return_value = [mock_cron_instance1, mock_cron_instance2]
 
         result = get_data_import_crons(mock_admin_client, mock_namespace)
 
-        assert result == [mock_cron1, mock_cron2]
-        mock_dic_class.get.assert_called_once_with(client=mock_admin_client, namespace=mock_namespace.name)
+        assert result == [mock_catalog.resource.return_value, mock_catalog.resource.return_value]
+        mock_get_resource_catalog.assert_called_once_with(client=mock_admin_client, resource_class=DataImportCron)
+        mock_catalog.list.assert_called_once_with(namespace="test-namespace")
+        mock_catalog.resource.assert_any_call(instance=mock_cron_instance1)
+        mock_catalog.resource.assert_any_call(instance=mock_cron_instance2)
 
 
 class TestGetSspResource:
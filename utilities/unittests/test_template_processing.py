@@ -0,0 +1,95 @@
+"""Unit tests for template_processing module"""
+
+import copy
+
+import pytest
+
+from utilities.template_processing import get_template_parameters_values, process_template_locally
+
+TEMPLATE = {
+    "metadata": {"name": "fedora-server-small", "namespace": "openshift"},
+    "labels": {"app": "${NAME}", "vm.kubevirt.io/template": "fedora-server-small"},
+    "parameters": [
+        {"name": "NAME", "generate": "expression", "from": "fedora-[a-z0-9]{16}"},
+        {"name": "CLOUD_USER_PASSWORD", "generate": "expression", "from": "[a-z0-9]{4}-[a-z0-9]{4}"},
+        {"name": "DATA_SOURCE_NAME", "value": "fedora"},
+        {"name": "CPU_CORES", "value": "1"},
+    ],
+    "objects": [
+        {
+            "kind": "VirtualMachine",
+            "metadata": {"name": "${NAME}", "labels": {"app": "other", "kubevirt.io/os": "fedora"}},
+            "spec": {
+                "cores": "${{CPU_CORES}}",
+                "source": "${DATA_SOURCE_NAME}",
+                "userData": "user: fedora\npassword: ${CLOUD_USER_PASSWORD}\n",
+                "undeclared": "${DATA_SOURCE_NAMESPACE}",
+                "embedded": "cores-${{CPU_CORES}}",
+            },
+        }
+    ],
+}
+
+
+class TestProcessTemplateLocally:
+    """Test cases for process_template_locally"""
+
+    def test_substitution(self):
+        """Test string and non-string substitution, undeclared parameters and template labels"""
+        template = copy.deepcopy(TEMPLATE)
+
+        objects = process_template_locally(
+            template=template, parameters={"NAME": "vm-a", "CLOUD_USER_PASSWORD": "password", "UNUSED": "value"}
+        )
+
+        assert objects == [
+            {
+                "kind": "VirtualMachine",
+                "metadata": {
+                    "name": "vm-a",
+                    "labels": {
+                        "app": "vm-a",
+                        "kubevirt.io/os": "fedora",
+                        "vm.kubevirt.io/template": "fedora-server-small",
+                    },
+                },
+                "spec": {
+                    "cores": 1,
+                    "source": "fedora",
+                    "userData": "user: fedora\npassword: password\n",
+                    "undeclared": "${DATA_SOURCE_NAMESPACE}",
+                    "embedded": "cores-${{CPU_CORES}}",
+                },
+            }
+        ]
+        assert template == TEMPLATE
+
+    def test_non_string_parameter_not_json(self):
+        """Test that a non-string parameter which is not valid JSON is substituted as a string"""
+        objects = process_template_locally(
+            template={"parameters": [{"name": "VALUE", "value": "not-json"}], "objects": [{"value": "${{VALUE}}"}]},
+            parameters={},
+        )
+
+        assert objects == [{"value": "not-json"}]
+
+    def test_generated_parameter_not_processed(self):
+        """Test that a template with a parameter to generate is left to the server"""
+        assert process_template_locally(template=TEMPLATE, parameters={"NAME": "vm-a"}) is None
+
+
+class TestGetTemplateParametersValues:
+    """Test cases for get_template_parameters_values"""
+
+    @pytest.mark.parametrize(
+        "parameter, expected",
+        [
+            pytest.param({"name": "P", "value": "default"}, {"P": "default"}, id="default_value"),
+            pytest.param({"name": "P"}, {"P": ""}, id="optional_without_value"),
+            pytest.param({"name": "P", "value": "x", "generate": "expression"}, {"P": "x"}, id="generate_with_value"),
+            pytest.param({"name": "P", "required": True}, None, id="required_without_value"),
+        ],
+    )
+    def test_parameter_values(self, parameter, expected):
+        """Test the resolution of parameters not passed by the caller"""
+        assert get_template_parameters_values(template={"parameters": [parameter]}, parameters={}) == expected
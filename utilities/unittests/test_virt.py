@@ -2,6 +2,12 @@
 
 import importlib
 import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from timeout_sampler import TimeoutExpiredError
 
 # conftest.py mocks utilities.virt; clear and reload the real module for these tests.
 if "utilities.virt" in sys.modules:
@@ -11,7 +17,15 @@ import utilities.virt
 
 importlib.reload(utilities.virt)
 
-from utilities.virt import VirtualMachineForTests
+from utilities.exceptions import VMsNotRunningError
+from utilities.virt import (
+    VirtualMachineForTests,
+    VMIsStatusSnapshot,
+    get_vmis_status_snapshot,
+    running_vms,
+    vmi_running,
+    wait_for_vmi_running,
+)
 
 
 class TestVirtualMachineForTestsLabel:
@@ -36,3 +50,227 @@ class TestVirtualMachineForTestsLabel:
         assert vm.body["metadata"]["labels"] == {"existing": "true"}
         assert "name" not in vm.body["metadata"]
         assert vm.res["metadata"]["name"] == "test-vm"
+
+
+def _vmi_instance(phase):
+    vmi_instance = MagicMock()
+    vmi_instance.metadata.name = "vm-a"
+    vmi_instance.get.return_value = {"phase": phase}
+    return vmi_instance
+
+
+class TestWaitForVmiRunning:
+    """Test cases for vmi_running and wait_for_vmi_running"""
+
+    @pytest.mark.parametrize(
+        "phase, expected",
+        [
+            pytest.param(VirtualMachineInstance.Status.RUNNING, True, id="running"),
+            pytest.param(VirtualMachineInstance.Status.SCHEDULING, False, id="scheduling"),
+        ],
+    )
+    def test_vmi_running(self, phase, expected):
+        """Test that the condition is met only by a Running VMI"""
+        assert vmi_running(vmi_instance=_vmi_instance(phase=phase)) is expected
+
+    def test_failed_vmi_stops_wait(self):
+        """Test that a Failed VMI stops the wait instead of waiting for the timeout"""
+        with pytest.raises(TimeoutExpiredError, match="Failed"):
+            vmi_running(vmi_instance=_vmi_instance(phase=VirtualMachineInstance.Status.FAILED))
+
+    @patch("utilities.virt.wait_for_resource_condition", side_effect=TimeoutExpiredError("VMI not running"))
+    def test_launcher_pod_logged_on_timeout(self, mock_wait_for_resource_condition):
+        """Test that the virt-launcher pod status and compute log are logged when the VMI is not Running"""
+        vm = MagicMock()
+        virt_pod = vm.vmi.get_virt_launcher_pod.return_value
+
+        with pytest.raises(TimeoutExpiredError):
+            wait_for_vmi_running(vm=vm, timeout=1)
+
+        virt_pod.log.assert_called_once_with(container="compute")
+
+
+def _mock_running_vm(name):
+    vm = MagicMock()
+    vm.name = name
+    vm.instance.spec.template.spec.volumes = []
+    return vm
+
+
+class TestRunningVms:
+    """Test cases for running_vms"""
+
+    @patch("utilities.virt._wait_for_vm_ready")
+    def test_all_vms_started_and_waited(self, mock_wait_for_vm_ready):
+        """Test that every VM is started and waited for, and phase timings are returned per VM"""
+        vms = [_mock_running_vm(name=f"vm-{idx}") for idx in range(3)]
+
+        phase_timings = running_vms(vms=vms, max_workers=2)
+
+        assert set(phase_timings) == {"vm-0", "vm-1", "vm-2"}
+        assert all("start" in vm_phase_timings for vm_phase_timings in phase_timings.values())
+        assert mock_wait_for_vm_ready.call_count == 3
+        for vm in vms:
+            vm.start.assert_called_once()
+
+    def test_vms_waited_concurrently(self):
+        """Test that the readiness waits of different VMs overlap"""
+        vms = [_mock_running_vm(name=f"vm-{idx}") for idx in range(2)]
+        barrier = threading.Barrier(parties=2, timeout=5)
+
+        with patch("utilities.virt._wait_for_vm_ready", side_effect=lambda **kwargs: barrier.wait()):
+            running_vms(vms=vms, max_workers=2)
+
+    @patch("utilities.virt._wait_for_vm_ready")
+    def test_failure_summary(self, mock_wait_for_vm_ready):
+        """Test that a failed VM is reported by name in the raised error"""
+        vms = [_mock_running_vm(name="vm-ok"), _mock_running_vm(name="vm-bad")]
+
+        def _wait_for_vm_ready(vm, **kwargs):
+            if vm.name == "vm-bad":
+                raise TimeoutExpiredError("VMI not running")
+
+        mock_wait_for_vm_ready.side_effect = _wait_for_vm_ready
+
+        with pytest.raises(VMsNotRunningError, match="vm-bad") as exc_info:
+            running_vms(vms=vms)
+
+        assert list(exc_info.value.vm_errors) == ["vm-bad"]
+
+    @patch("utilities.virt._wait_for_vm_ready")
+    def test_wait_until_running_timeout_passed(self, mock_wait_for_vm_ready):
+        """Test that the VMI Running timeout of the caller is used for every VM"""
+        running_vms(vms=[_mock_running_vm(name="vm-windows")], wait_until_running_timeout=1800)
+
+        assert mock_wait_for_vm_ready.call_args.kwargs["wait_until_running_timeout"] == 1800
+
+    @patch("utilities.virt.abort_resource_waits")
+    def test_failure_aborts_and_waits_for_pending_vms(self, mock_abort_resource_waits):
+        """Test that the waits in progress are aborted and finished before the failure is raised"""
+        vms = [_mock_running_vm(name="vm-bad"), _mock_running_vm(name="vm-slow")]
+        slow_wait_started = threading.Event()
+        slow_wait_finished = threading.Event()
+
+        def _wait_for_vm_ready(vm, aborted, **kwargs):
+            if vm.name == "vm-bad":
+                slow_wait_started.wait(timeout=5)
+                raise TimeoutExpiredError("VMI not running")
+            slow_wait_started.set()
+            assert aborted.wait(timeout=5)
+            slow_wait_finished.set()
+            raise InterruptedError("Wait for VM vm-slow abandoned")
+
+        with patch("utilities.virt._wait_for_vm_ready", side_effect=_wait_for_vm_ready):
+            with pytest.raises(VMsNotRunningError) as exc_info:
+                running_vms(vms=vms, max_workers=2)
+
+        assert slow_wait_finished.is_set()
+        assert list(exc_info.value.vm_errors) == ["vm-bad"]
+        assert exc_info.value.pending_vms == ["vm-slow"]
+        assert mock_abort_resource_waits.call_args.kwargs["resource"] is vms[1].vmi
+
+    @patch("utilities.virt.abort_resource_waits")
+    def test_vm_ready_after_failure_not_reported(self, mock_abort_resource_waits):
+        """Test that a VM which became ready while the waits were aborted is neither failed nor abandoned"""
+        vms = [_mock_running_vm(name="vm-bad"), _mock_running_vm(name="vm-ready")]
+        ready_wait_started = threading.Event()
+
+        def _wait_for_vm_ready(vm, aborted, **kwargs):
+            if vm.name == "vm-bad":
+                ready_wait_started.wait(timeout=5)
+                raise TimeoutExpiredError("VMI not running")
+            ready_wait_started.set()
+            assert aborted.wait(timeout=5)
+
+        with patch("utilities.virt._wait_for_vm_ready", side_effect=_wait_for_vm_ready):
+            with pytest.raises(VMsNotRunningError) as exc_info:
+                running_vms(vms=vms, max_workers=2)
+
+        assert list(exc_info.value.vm_errors) == ["vm-bad"]
+        assert not exc_info.value.pending_vms
+
+    @patch("utilities.virt.assert_vm_not_error_status")
+    @patch("utilities.virt.DataVolume")
+    def test_datavolume_wait_aborted(self, mock_data_volume, mock_assert_vm_not_error_status):
+        """Test that an aborted DataVolume wait stops and is reported as abandoned"""
+        aborted = threading.Event()
+
+        def _wait_for_dv_success(timeout, stop_status_func):
+            aborted.set()
+            assert stop_status_func()
+            raise TimeoutExpiredError("Exited on the stop_status_func")
+
+        mock_data_volume.return_value.wait_for_dv_success.side_effect = _wait_for_dv_success
+
+        with pytest.raises(InterruptedError, match="vm-a"):
+            utilities.virt._wait_for_vm_dvs_success(
+                vm=_mock_running_vm(name="vm-a"), dv_names=["dv-a"], dv_wait_timeout=1, aborted=aborted
+            )
+
+    def test_ssh_wait_aborted(self):
+        """Test that an aborted SSH wait stops without running a command"""
+        aborted = threading.Event()
+        aborted.set()
+        vm = _mock_running_vm(name="vm-a")
+
+        with pytest.raises(InterruptedError):
+            utilities.virt.wait_for_ssh_connectivity(vm=vm, timeout=5, aborted=aborted)
+
+        vm.ssh_exec.run_command.assert_not_called()
+
+    @patch("utilities.virt._wait_for_vm_ready")
+    def test_start_failure_skips_waits(self, mock_wait_for_vm_ready):
+        """Test that a VM failing to start fails before waiting for any VM"""
+        vms = [_mock_running_vm(name="vm-a")]
+        vms[0].start.side_effect = ValueError("bad spec")
+
+        with pytest.raises(VMsNotRunningError, match="vm-a"):
+            running_vms(vms=vms)
+
+        mock_wait_for_vm_ready.assert_not_called()
+
+
+def _vmi_page(vmis, continue_token=None):
+    page = MagicMock()
+    page.to_dict.return_value = {
+        "metadata": {"continue": continue_token},
+        "items": [
+            {"metadata": {"name": name}, "status": {"phase": phase, "nodeName": node}} for name, phase, node in vmis
+        ],
+    }
+    return page
+
+
+class TestGetVmisStatusSnapshot:
+    """Test cases for get_vmis_status_snapshot"""
+
+    def test_paginated_list(self):
+        """Test that all the pages are listed, passing the continue token"""
+        client = MagicMock()
+        vmi_api = client.resources.get.return_value
+        vmi_api.get.side_effect = [
+            _vmi_page(vmis=[("vm-a", "Running", "node-1")], continue_token="token-1"),
+            _vmi_page(vmis=[("vm-b", "Scheduling", None)]),
+        ]
+
+        snapshot = get_vmis_status_snapshot(client=client, namespace="ns", page_size=1)
+
+        assert snapshot.phases == {"vm-a": "Running", "vm-b": "Scheduling"}
+        assert snapshot.nodes == {"vm-a": "node-1"}
+        assert vmi_api.get.call_args_list[1].kwargs == {"namespace": "ns", "limit": 1, "_continue": "token-1"}
+
+    def test_snapshot_summaries(self):
+        """Test the running, not running and node distribution summaries"""
+        snapshot = VMIsStatusSnapshot(
+            phases={
+                "vm-a": VirtualMachineInstance.Status.RUNNING,
+                "vm-b": VirtualMachineInstance.Status.RUNNING,
+                "vm-c": "Failed",
+            },
+            nodes={"vm-a": "node-1", "vm-b": "node-1", "vm-c": "node-2"},
+        )
+        vm_names = ["vm-a", "vm-b", "vm-c", "vm-d"]
+
+        assert snapshot.running(vm_names=vm_names) == ["vm-a", "vm-b"]
+        assert snapshot.not_running(vm_names=vm_names) == {"vm-c": "Failed", "vm-d": "NoVMI"}
+        assert snapshot.node_distribution(vm_names=vm_names) == {"node-1": 2, "node-2": 1}
@@ -0,0 +1,147 @@
+"""Unit tests for vm_error_monitor module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceInstance
+
+from utilities.exceptions import VMErrorStateError
+from utilities.vm_error_monitor import VMErrorMonitor, vm_error_monitor
+
+VM_NAME = "vm-a"
+
+
+def _instance(kind, name, labels=None, **fields):
+    return ResourceInstance(
+        client=MagicMock(), instance={"kind": kind, "metadata": {"name": name, "labels": labels or {}}, **fields}
+    )
+
+
+def _vm(printable_status="Starting", run_strategy="Manual"):
+    return _instance(
+        kind="VirtualMachine",
+        name=VM_NAME,
+        spec={"runStrategy": run_strategy},
+        status={"printableStatus": printable_status},
+    )
+
+
+def _launcher_pod(waiting_reason=None):
+    container_status = {"name": "compute", "state": {"running": {}}}
+    if waiting_reason:
+        container_status["state"] = {"waiting": {"reason": waiting_reason, "message": "Back-off pulling image"}}
+    return _instance(
+        kind="Pod",
+        name=f"virt-launcher-{VM_NAME}-x",
+        labels={"kubevirt.io": "virt-launcher", "vm.kubevirt.io/name": VM_NAME},
+        status={"phase": "Pending", "containerStatuses": [container_status]},
+    )
+
+
+@pytest.fixture()
+def error_monitor():
+    with (
+        patch("utilities.vm_error_monitor.get_resource_class_api_version", return_value="v1"),
+        patch("utilities.vm_error_monitor.get_watch_stream") as mock_get_watch_stream,
+    ):
+        error_monitor = VMErrorMonitor(
+            client=MagicMock(),
+            vm_name=VM_NAME,
+            namespace="test-ns",
+            vm_error_statuses=lambda vm_instance: ["ErrorUnschedulable", "CrashLoopBackOff"],
+        )
+        error_monitor.start()
+        yield error_monitor, mock_get_watch_stream.return_value
+
+
+class TestVMErrorMonitor:
+    """Test cases for VMErrorMonitor"""
+
+    def test_no_error(self, error_monitor):
+        """Test that a healthy VM does not fail the monitor"""
+        monitor, stream = error_monitor
+
+        monitor._on_vm("MODIFIED", _vm())
+        monitor._on_pod("ADDED", _launcher_pod())
+        monitor.check()
+
+        stream.abort_waits.assert_not_called()
+
+    def test_error_printable_status_aborts_waits(self, error_monitor):
+        """Test that an error printableStatus aborts the VMI waits with the recent Warning events"""
+        monitor, stream = error_monitor
+        monitor._on_pod("ADDED", _launcher_pod())
+        monitor._on_event(
+            "ADDED",
+            _instance(
+                kind="Event",
+                name="event-a",
+                type="Warning",
+                reason="FailedScheduling",
+                message="0/3 nodes are available",
+                involvedObject={"kind": "Pod", "name": f"virt-launcher-{VM_NAME}-x"},
+            ),
+        )
+
+        monitor._on_vm("MODIFIED", _vm(printable_status="ErrorUnschedulable"))
+
+        with pytest.raises(VMErrorStateError, match="ErrorUnschedulable") as error:
+            monitor.check()
+        assert "FailedScheduling: 0/3 nodes are available" in str(error.value)
+        stream.abort_waits.assert_called_once_with(name=VM_NAME, error=error.value)
+
+    def test_launcher_pod_image_pull_error(self, error_monitor):
+        """Test that a launcher pod which cannot pull its image fails the monitor"""
+        monitor, _ = error_monitor
+
+        monitor._on_pod("MODIFIED", _launcher_pod(waiting_reason="ImagePullBackOff"))
+
+        with pytest.raises(VMErrorStateError, match="ImagePullBackOff"):
+            monitor.check()
+
+    @pytest.mark.parametrize(
+        "run_strategy, failed",
+        [
+            pytest.param("Manual", True, id="manual"),
+            pytest.param("Always", False, id="always_restarted"),
+            pytest.param(None, False, id="vm_not_seen"),
+        ],
+    )
+    def test_failed_vmi(self, error_monitor, run_strategy, failed):
+        """Test that a failed VMI fails the monitor only when it is not restarted"""
+        monitor, _ = error_monitor
+        if run_strategy:
+            monitor._on_vm("MODIFIED", _vm(run_strategy=run_strategy))
+
+        monitor._on_vmi("MODIFIED", _instance(kind="VirtualMachineInstance", name=VM_NAME, status={"phase": "Failed"}))
+
+        assert bool(monitor.error) is failed
+
+    def test_other_vm_ignored(self, error_monitor):
+        """Test that the errors of other VMs in the namespace are ignored"""
+        monitor, _ = error_monitor
+
+        monitor._on_vm(
+            "MODIFIED",
+            _instance(kind="VirtualMachine", name="vm-b", spec={}, status={"printableStatus": "CrashLoopBackOff"}),
+        )
+
+        monitor.check()
+
+    def test_stop_removes_listeners(self, error_monitor):
+        """Test that stopping the monitor removes its listeners from the streams"""
+        monitor, stream = error_monitor
+
+        monitor.stop()
+
+        assert stream.remove_listener.call_count == 4
+
+
+class TestVMErrorMonitorContext:
+    """Test cases for vm_error_monitor"""
+
+    def test_start_failure_does_not_fail(self):
+        """Test that the waits are not failed when the VM namespace cannot be watched"""
+        with patch("utilities.vm_error_monitor.get_resource_class_api_version", side_effect=ValueError("forbidden")):
+            with vm_error_monitor(vm=MagicMock(), vm_error_statuses=lambda vm_instance: []) as error_monitor:
+                error_monitor.check()
@@ -0,0 +1,124 @@
+"""Unit tests for vm_pool module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.vm_pool import VMPool
+
+
+def _vm_factory(vms):
+    def _factory(name):
+        vm = MagicMock()
+        vm.name = name
+        vm.instance.metadata.generation = 1
+        vms.append(vm)
+        return vm
+
+    return _factory
+
+
+@pytest.fixture()
+def mock_vm_operations():
+    with (
+        patch("utilities.vm_pool.running_vm") as mock_running_vm,
+        patch("utilities.vm_pool.restart_vm_wait_for_running_vm") as mock_restart,
+        patch("utilities.vm_pool.close_vm_ssh_session"),
+        patch("utilities.vm_pool.close_vm_console_session"),
+    ):
+        yield {"running_vm": mock_running_vm, "restart": mock_restart}
+
+
+class TestVMPool:
+    """Test cases for VMPool"""
+
+    def test_lease_booted_vm_and_reset_on_return(self, mock_vm_operations):
+        """Test that a leased VM was booted by the pool and is restarted when returned"""
+        vms = []
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with vm_pool.lease() as vm:
+            vm.deploy.assert_called_once()
+            mock_vm_operations["running_vm"].assert_called_once_with(vm=vm)
+        with vm_pool.lease() as vm:
+            assert vm is vms[0]
+        vm_pool.close()
+
+        assert len(vms) == 1
+        mock_vm_operations["restart"].assert_any_call(vm=vms[0])
+        vms[0].clean_up.assert_called_once()
+
+    def test_dirty_vm_replaced(self, mock_vm_operations):
+        """Test that a VM marked dirty is deleted instead of reset"""
+        vms = []
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with vm_pool.lease() as vm:
+            vm_pool.mark_dirty(vm=vm)
+        vm_pool.close()
+
+        mock_vm_operations["restart"].assert_not_called()
+        vms[0].clean_up.assert_called_once()
+
+    def test_vm_with_changed_spec_replaced(self, mock_vm_operations):
+        """Test that a VM whose generation changed during the lease is not reused"""
+        vms = []
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with vm_pool.lease() as vm:
+            vm.instance.metadata.generation = 2
+        vm_pool.close()
+
+        mock_vm_operations["restart"].assert_not_called()
+
+    def test_vm_of_failed_test_replaced(self, mock_vm_operations):
+        """Test that a VM leased by a failing block is not reused"""
+        vms = []
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with pytest.raises(ValueError):
+            with vm_pool.lease():
+                raise ValueError("test failed")
+        vm_pool.close()
+
+        mock_vm_operations["restart"].assert_not_called()
+
+    def test_boot_error_raised_by_lease(self, mock_vm_operations):
+        """Test that a failed background boot is raised by the lease and the VM is deleted"""
+        mock_vm_operations["running_vm"].side_effect = TimeoutExpiredError("VM not running")
+        vms = []
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with pytest.raises(TimeoutExpiredError, match="VM not running"):
+            with vm_pool.lease():
+                pass
+        vm_pool.close()
+
+        vms[0].clean_up.assert_called_once()
+
+    def test_lease_timeout(self, mock_vm_operations):
+        """Test that a lease with no booted VM times out"""
+        vm_pool = VMPool(name="fedora", size=1, vm_factory=_vm_factory(vms=[]), lease_timeout=0)
+
+        with pytest.raises(TimeoutExpiredError):
+            with vm_pool.lease():
+                pass
+
+    def test_empty_pool_boots_vm_per_lease(self, mock_vm_operations):
+        """Test that a pool of size 0 boots a VM for the lease and deletes it when returned"""
+        vms = []
+        vm_pool = VMPool(name="fedora", size=0, vm_factory=_vm_factory(vms=vms))
+        vm_pool.start()
+
+        with vm_pool.lease() as vm:
+            mock_vm_operations["running_vm"].assert_called_once_with(vm=vm)
+
+        vms[0].clean_up.assert_called_once()
+        mock_vm_operations["restart"].assert_not_called()
+        vm_pool.close()
@@ -0,0 +1,323 @@
+"""Unit tests for watcher module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import ApiException
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.watcher import ResourceWatchStream, get_watch_stream, wait_for_resource_condition
+
+
+def _vmi_dict(name, phase, resource_version="1"):
+    return {
+        "apiVersion": "kubevirt.io/v1",
+        "kind": "VirtualMachineInstance",
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "status": {"phase": phase},
+    }
+
+
+def _phase_is(phase):
+    return lambda instance: instance is not None and instance.status.phase == phase
+
+
+@pytest.fixture()
+def watch_stream():
+    client = MagicMock()
+    client.resources.get.return_value.get.return_value.to_dict.return_value = {
+        "metadata": {"resourceVersion": "10"},
+        "items": [_vmi_dict(name="vm-a", phase="Running"), _vmi_dict(name="vm-b", phase="Scheduling")],
+    }
+    stream = ResourceWatchStream(
+        client=client, api_version="kubevirt.io/v1", kind="VirtualMachineInstance", namespace="ns"
+    )
+    with patch.object(ResourceWatchStream, "_start"):
+        yield stream
+
+
+class TestResourceWatchStream:
+    """Test cases for ResourceWatchStream"""
+
+    def test_list_populates_objects(self, watch_stream):
+        """Test that listing stores all objects and the list resourceVersion"""
+        watch_stream._list()
+
+        assert watch_stream.get(name="vm-a").status.phase == "Running"
+        assert watch_stream._resource_version == "10"
+
+    def test_get_before_sync_returns_none(self, watch_stream):
+        """Test that an unsynced stream does not serve objects"""
+        assert watch_stream.get(name="vm-a") is None
+
+    def test_wait_for_satisfied_from_store(self, watch_stream):
+        """Test that a wait already satisfied by the listed state returns immediately"""
+        watch_stream._list()
+
+        result = watch_stream.wait_for(name="vm-a", condition=_phase_is(phase="Running"), timeout=1)
+
+        assert result.metadata.name == "vm-a"
+        assert not watch_stream._pending_waits
+
+    def test_event_completes_pending_wait(self, watch_stream):
+        """Test that a MODIFIED event satisfying the condition completes the pending wait"""
+        watch_stream._list()
+        event_instance = MagicMock()
+        event_instance.metadata.name = "vm-b"
+        event_instance.metadata.resourceVersion = "11"
+        event_instance.status.phase = "Running"
+
+        def _deliver_event():
+            threading.Timer(
+                interval=0.05,
+                function=watch_stream._handle_event,
+                kwargs={"event_type": "MODIFIED", "instance": event_instance},
+            ).start()
+
+        with patch.object(ResourceWatchStream, "_start", side_effect=_deliver_event):
+            result = watch_stream.wait_for(name="vm-b", condition=_phase_is(phase="Running"), timeout=1)
+
+        assert result is event_instance
+        assert watch_stream._resource_version == "11"
+
+    def test_deleted_event_removes_object(self, watch_stream):
+        """Test that a DELETED event removes the object from the store"""
+        watch_stream._list()
+        event_instance = MagicMock()
+        event_instance.metadata.name = "vm-a"
+
+        watch_stream._handle_event(event_type="DELETED", instance=event_instance)
+
+        assert watch_stream.get(name="vm-a") is None
+
+    def test_wait_for_timeout(self, watch_stream):
+        """Test that an unmet condition raises TimeoutExpiredError"""
+        watch_stream._list()
+
+        with pytest.raises(TimeoutExpiredError):
+            watch_stream.wait_for(name="vm-b", condition=_phase_is(phase="Running"), timeout=0.1)
+
+        assert not watch_stream._pending_waits
+
+    def test_condition_error_aborts_wait(self, watch_stream):
+        """Test that an exception raised by the condition is re-raised to the waiter"""
+        watch_stream._list()
+
+        def _failing_condition(instance):
+            raise AssertionError("VM is in error state")
+
+        with pytest.raises(AssertionError, match="VM is in error state"):
+            watch_stream.wait_for(name="vm-a", condition=_failing_condition, timeout=1)
+
+    def test_access_denied_fails_pending_waits(self, watch_stream):
+        """Test that a forbidden list fails the pending waits instead of waiting for timeout"""
+        watch_stream._resource_api.get.side_effect = ApiException(status=403)
+
+        def _run_stream():
+            threading.Thread(target=watch_stream._run, daemon=True).start()
+
+        with patch.object(ResourceWatchStream, "_start", side_effect=_run_stream):
+            with pytest.raises(ApiException):
+                watch_stream.wait_for(name="vm-a", condition=_phase_is(phase="Running"), timeout=1)
+
+    def test_access_denied_stops_stream(self, watch_stream):
+        """Test that a forbidden list stops the stream of an informer and listeners instead of re-listing"""
+        watch_stream._resource_api.get.side_effect = ApiException(status=403)
+        watch_stream.start_informer()
+        watch_stream.add_listener(listener=MagicMock())
+
+        stream_thread = threading.Thread(target=watch_stream._run, daemon=True)
+        stream_thread.start()
+        stream_thread.join(timeout=1)
+
+        assert not stream_thread.is_alive()
+        watch_stream._resource_api.get.assert_called_once()
+        assert not watch_stream._should_run()
+        with pytest.raises(ApiException):
+            watch_stream.wait_for_sync(timeout=1)
+
+
+class TestGetWatchStream:
+    """Test cases for get_watch_stream"""
+
+    def test_stream_shared_per_kind_and_namespace(self):
+        """Test that the same stream is returned for the same client, kind and namespace"""
+        client = MagicMock()
+
+        first = get_watch_stream(client=client, api_version="v1", kind="Pod", namespace="ns1")
+        second = get_watch_stream(client=client, api_version="v1", kind="Pod", namespace="ns1")
+        other_namespace = get_watch_stream(client=client, api_version="v1", kind="Pod", namespace="ns2")
+
+        assert first is second
+        assert first is not other_namespace
+
+
+class TestWaitForResourceCondition:
+    """Test cases for wait_for_resource_condition"""
+
+    @patch("utilities.watcher.get_watch_stream")
+    def test_uses_resource_stream(self, mock_get_watch_stream):
+        """Test that the wait is delegated to the stream of the resource kind and namespace"""
+        resource = MagicMock()
+        resource.name = "vm-a"
+        resource.namespace = "ns"
+        condition = MagicMock()
+
+        wait_for_resource_condition(resource=resource, condition=condition, timeout=5)
+
+        mock_get_watch_stream.assert_called_once_with(
+            client=resource.client,
+            api_version=resource.api_version,
+            kind=resource.kind,
+            namespace="ns",
+        )
+        mock_get_watch_stream.return_value.wait_for.assert_called_once_with(name="vm-a", condition=condition, timeout=5)
+
+
+class TestResourceWatchStreamInformer:
+    """Test cases for ResourceWatchStream informer mode"""
+
+    def test_informer_keeps_stream_running(self, watch_stream):
+        """Test that the stream keeps running without pending waits while informer is enabled"""
+        assert not watch_stream._should_run()
+
+        watch_stream.start_informer()
+
+        assert watch_stream._should_run()
+
+    def test_stop_informer_stops_idle_watcher(self, watch_stream):
+        """Test that stopping the informer stops the watch when no waits are pending"""
+        watch_stream.start_informer()
+        watch_stream._watcher = MagicMock()
+
+        watch_stream.stop_informer()
+
+        assert not watch_stream._should_run()
+        watch_stream._watcher.stop.assert_called_once()
+
+
+class TestResourceWatchStreamListeners:
+    """Test cases for ResourceWatchStream listeners"""
+
+    def test_listener_called_on_list_and_events(self, watch_stream):
+        """Test that listeners get the listed objects once and every watch event"""
+        listener = MagicMock()
+        watch_stream.add_listener(listener=listener)
+
+        watch_stream._list()
+        watch_stream._list()
+        event_instance = MagicMock()
+        event_instance.metadata.name = "vm-b"
+        event_instance.metadata.resourceVersion = "11"
+        watch_stream._handle_event(event_type="MODIFIED", instance=event_instance)
+
+        assert [(call.args[0], call.args[1].metadata.name) for call in listener.call_args_list] == [
+            ("ADDED", "vm-a"),
+            ("ADDED", "vm-b"),
+            ("MODIFIED", "vm-b"),
+        ]
+
+    def test_listener_error_does_not_stop_stream(self, watch_stream):
+        """Test that a failing listener does not prevent the other listeners from being called"""
+        failing_listener = MagicMock(side_effect=ValueError("listener error"))
+        listener = MagicMock()
+        watch_stream.add_listener(listener=failing_listener)
+        watch_stream.add_listener(listener=listener)
+
+        watch_stream._list()
+
+        assert listener.call_count == 2
+
+    def test_remove_listener_stops_idle_watcher(self, watch_stream):
+        """Test that removing the last listener stops the watch"""
+        listener = MagicMock()
+        watch_stream.add_listener(listener=listener)
+        assert watch_stream._should_run()
+        watch_stream._watcher = MagicMock()
+
+        watch_stream.remove_listener(listener=listener)
+
+        assert not watch_stream._should_run()
+        watch_stream._watcher.stop.assert_called_once()
+
+    def test_listener_added_to_synced_stream_gets_current_objects(self, watch_stream):
+        """Test that a listener added to a synced stream gets the objects already seen"""
+        watch_stream._list()
+        listener = MagicMock()
+
+        watch_stream.add_listener(listener=listener)
+
+        assert sorted(call.args[1].metadata.name for call in listener.call_args_list) == ["vm-a", "vm-b"]
+
+
+    def test_listener_gets_objects_deleted_while_interrupted(self, watch_stream):
+        """Test that a re-list passes the objects deleted since the previous list as DELETED"""
+        watch_stream._list()
+        listener = MagicMock()
+        watch_stream.add_listener(listener=listener)
+        listener.reset_mock()
+        watch_stream._resource_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "12"},
+            "items": [_vmi_dict(name="vm-a", phase="Running")],
+        }
+
+        watch_stream._list()
+
+        assert [(call.args[0], call.args[1].metadata.name) for call in listener.call_args_list] == [
+            ("DELETED", "vm-b")
+        ]
+        assert watch_stream.get(name="vm-b") is None
+
+
+class TestResourceWatchStreamSync:
+    """Test cases for ResourceWatchStream.wait_for_sync"""
+
+    def test_wait_for_sync_after_list(self, watch_stream):
+        """Test that waiting for a listed stream returns immediately"""
+        watch_stream._list()
+
+        watch_stream.wait_for_sync(timeout=0)
+
+    def test_wait_for_sync_timeout(self, watch_stream):
+        """Test that waiting for a stream which did not list raises TimeoutExpiredError"""
+        with pytest.raises(TimeoutExpiredError):
+            watch_stream.wait_for_sync(timeout=0)
+
+    def test_all_namespaces_stream_names_objects_by_namespace(self):
+        """Test that a stream with no namespace keeps same-name objects of different namespaces apart"""
+        client = MagicMock()
+        client.resources.get.return_value.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [
+                {**_vmi_dict(name="vm-a", phase="Running"), "metadata": {"name": "vm-a", "namespace": "ns1"}},
+                {**_vmi_dict(name="vm-a", phase="Failed"), "metadata": {"name": "vm-a", "namespace": "ns2"}},
+            ],
+        }
+        stream = ResourceWatchStream(
+            client=client, api_version="kubevirt.io/v1", kind="VirtualMachineInstance", namespace=None
+        )
+
+        stream._list()
+
+        assert stream.get(name="ns1/vm-a").status.phase == "Running"
+        assert stream.get(name="ns2/vm-a").status.phase == "Failed"
+
+
+class TestResourceWatchStreamAbortWaits:
+    """Test cases for ResourceWatchStream.abort_waits"""
+
+    def test_abort_waits(self, watch_stream):
+        """Test that aborting the waits on an object raises the error in the waiter"""
+        watch_stream._list()
+        error = ValueError("VM error")
+
+        with patch.object(
+            ResourceWatchStream,
+            "_start",
+            side_effect=lambda: threading.Timer(
+                interval=0.05, function=watch_stream.abort_waits, kwargs={"name": "vm-b", "error": error}
+            ).start(),
+        ):
+            with pytest.raises(ValueError, match="VM error"):
+                watch_stream.wait_for(name="vm-b", condition=_phase_is(phase="Running"), timeout=1)
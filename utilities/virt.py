@@ -8,10 +8,14 @@ import os
 import re
 import secrets
 import shlex
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, defaultdict
 from collections.abc import Generator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from copy import deepcopy
+from dataclasses import dataclass, field
 from functools import cache
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any
@@ -22,7 +26,8 @@ import yaml
 from benedict import benedict
 from kubernetes.client import ApiException
 from kubernetes.dynamic import DynamicClient
-from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
+from kubernetes.dynamic.resource import ResourceInstance
 from kubernetes.utils.quantity import parse_quantity
 from ocp_resources.daemonset import DaemonSet
 from ocp_resources.datavolume import DataVolume
@@ -44,15 +49,16 @@ from ocp_utilities.exceptions import CommandExecFailed
 from paramiko import ProxyCommandFailure
 from pyhelper_utils.shell import run_command, run_ssh_commands
 from pytest_testconfig import config as py_config
-from rrmngmnt import Host, ssh, user
+from rrmngmnt import Host, user
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 import utilities.cpu
 import utilities.data_utils
 import utilities.infra
 from libs.net.cluster import is_ipv6_single_stack_cluster
-from utilities.cluster import cache_admin_client
-from utilities.console import Console
+from utilities.catalog import get_resource_catalog
+from utilities.cluster import cache_admin_client, get_resource_class_api_version
+from utilities.console import Console, close_vm_console_session, get_console_session_registry
 from utilities.constants import Images
 from utilities.constants.architecture import (
     LINUX_AMD_64,
@@ -105,15 +111,28 @@ from utilities.constants.virt import (
     EVICTIONSTRATEGY,
     OS_PROC_NAME,
     ROOTDISK,
+    RUNNING_VMS_MAX_WORKERS,
     VIRTCTL,
+    VMIS_LIST_PAGE_SIZE,
 )
 from utilities.data_collector import collect_vnc_screenshot_for_vms
-from utilities.exceptions import MigrationStuckSchedulingError, ResourceValueError
+from utilities.exceptions import (
+    MigrationStuckSchedulingError,
+    ResourceValueError,
+    VMErrorStateError,
+    VMsNotRunningError,
+)
+from utilities.failure_snapshot import FAILURE_SNAPSHOT
 from utilities.hco import get_hco_namespace, wait_for_hco_conditions
+from utilities.informer import CachedVirtualMachineInstance, InformerCachedInstanceMixin
 from utilities.network import (
     cloud_init_network_data,
 )
+from utilities.ssh_pool import PooledRemoteExecutorFactory, close_vm_ssh_session
 from utilities.storage import get_default_storage_class
+from utilities.template_processing import process_template_locally
+from utilities.vm_error_monitor import VMErrorMonitor, vm_error_monitor
+from utilities.watcher import abort_resource_waits, wait_for_resource_condition
 
 if TYPE_CHECKING:
     from libs.vm.vm import BaseVirtualMachine
@@ -150,19 +169,142 @@ def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_1
     """
     # Waiting for guest agent connection before checking guest agent interfaces report
     LOGGER.info(f"Wait until guest agent is active on {vmi.name}")
-    vmi.wait_for_condition(
-        condition=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED,
-        status=VirtualMachineInstance.Condition.Status.TRUE,
-        timeout=timeout,
-    )
+    wait_for_resource_condition(resource=vmi, condition=vmi_agent_connected, timeout=timeout)
     LOGGER.info(f"Wait for {vmi.name} network interfaces")
-    sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: vmi.instance)
-    for sample in sampler:
-        interfaces = sample.get("status", {}).get("interfaces", [])
-        active_interfaces = [interface for interface in interfaces if interface.get("interfaceName")]
-        if len(active_interfaces) == len(interfaces):
-            return True
-    return False
+    wait_for_resource_condition(resource=vmi, condition=vmi_interfaces_reported, timeout=timeout)
+    return True
+
+
+def vmi_agent_connected(vmi_instance: ResourceInstance | None) -> bool:
+    """
+    Watch condition: the VMI reports the AgentConnected condition as True.
+    """
+    if vmi_instance is None:
+        return False
+
+    return any(
+        condition.get("type") == VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+        and condition.get("status") == VirtualMachineInstance.Condition.Status.TRUE
+        for condition in vmi_instance.get("status", {}).get("conditions") or []
+    )
+
+
+def vmi_interfaces_reported(vmi_instance: ResourceInstance | None) -> bool:
+    """
+    Watch condition: the guest agent reports an interface name for every VMI interface.
+    """
+    if vmi_instance is None:
+        return False
+
+    interfaces = vmi_instance.get("status", {}).get("interfaces") or []
+    return all(interface.get("interfaceName") for interface in interfaces)
+
+
+def vmi_running(vmi_instance: ResourceInstance | None) -> bool:
+    """
+    Watch condition: the VMI phase is Running.
+
+    Raises:
+        TimeoutExpiredError: If the VMI phase is Failed, which stops the wait.
+    """
+    if vmi_instance is None:
+        return False
+
+    phase = vmi_instance.get("status", {}).get("phase")
+    if phase == VirtualMachineInstance.Status.FAILED:
+        raise TimeoutExpiredError(f"Status of {VirtualMachineInstance.kind} {vmi_instance.metadata.name} is {phase}")
+    return phase == VirtualMachineInstance.Status.RUNNING
+
+
+def wait_for_vmi_running(vm: VirtualMachineForTests, timeout: int) -> None:
+    """
+    Wait for the VMI of the VM to be Running, using the shared VMI watch stream.
+
+    On failure, the virt-launcher pod status and its compute container log are logged.
+
+    Args:
+        vm (VirtualMachineForTests): VM object.
+        timeout (int): how much time to wait for the VMI to reach Running state.
+
+    Raises:
+        TimeoutExpiredError: If the VMI is not Running within timeout or its phase is Failed.
+    """
+    LOGGER.info(f"Wait for {vm.vmi.kind} {vm.name} to be {VirtualMachineInstance.Status.RUNNING}")
+    try:
+        wait_for_resource_condition(resource=vm.vmi, condition=vmi_running, timeout=timeout)
+    except TimeoutExpiredError as sampler_ex:
+        try:
+            virt_pod = vm.vmi.get_virt_launcher_pod(privileged_client=vm.vmi.client)
+            LOGGER.error(f"Status of virt-launcher pod {virt_pod.name}: {virt_pod.status}")
+            LOGGER.debug(f"{virt_pod.name} *****LOGS*****")
+            LOGGER.debug(virt_pod.log(container="compute"))
+        except ResourceNotFoundError as virt_pod_ex:
+            LOGGER.error(virt_pod_ex)
+            raise sampler_ex from virt_pod_ex
+
+        raise
+
+
+@dataclass
+class VMIsStatusSnapshot:
+    """
+    Phase and node of every VMI of a namespace, from a single (paginated) list.
+    """
+
+    phases: dict[str, str] = field(default_factory=dict)
+    nodes: dict[str, str] = field(default_factory=dict)
+
+    def running(self, vm_names: list[str]) -> list[str]:
+        return [name for name in vm_names if self.phases.get(name) == VirtualMachineInstance.Status.RUNNING]
+
+    def not_running(self, vm_names: list[str]) -> dict[str, str]:
+        """
+        Return the VMs without a Running VMI, mapped to their VMI phase ("NoVMI" if the VMI does not exist).
+        """
+        return {
+            name: self.phases.get(name) or "NoVMI"
+            for name in vm_names
+            if self.phases.get(name) != VirtualMachineInstance.Status.RUNNING
+        }
+
+    def node_distribution(self, vm_names: list[str]) -> Counter[str]:
+        return Counter([self.nodes[name] for name in vm_names if self.nodes.get(name)])
+
+
+def get_vmis_status_snapshot(
+    client: DynamicClient, namespace: str, page_size: int = VMIS_LIST_PAGE_SIZE
+) -> VMIsStatusSnapshot:
+    """
+    List the VMIs of a namespace, `page_size` at a time, and record their phase and node.
+
+    One paginated list replaces a GET per VMI (and per node) when checking many VMs.
+
+    Args:
+        client (DynamicClient): client allowed to list VMIs in the namespace.
+        namespace (str): namespace name.
+        page_size (int): maximum number of VMIs per list request.
+
+    Returns:
+        VMIsStatusSnapshot: the VMIs phases and nodes, by VMI name.
+    """
+    vmi_api = client.resources.get(
+        api_version=get_resource_class_api_version(client=client, resource_class=VirtualMachineInstance),
+        kind=VirtualMachineInstance.kind,
+    )
+    snapshot = VMIsStatusSnapshot()
+    continue_token = None
+    while True:
+        page = vmi_api.get(namespace=namespace, limit=page_size, _continue=continue_token).to_dict()
+        for vmi in page.get("items") or []:
+            vmi_name = vmi["metadata"]["name"]
+            vmi_status = vmi.get("status") or {}
+            snapshot.phases[vmi_name] = vmi_status.get("phase", "")
+            if vmi_status.get("nodeName"):
+                snapshot.nodes[vmi_name] = vmi_status["nodeName"]
+
+        continue_token = page.get("metadata", {}).get("continue")
+        if not continue_token:
+            return snapshot
 
 
 def generate_cloud_init_data(data):
@@ -223,7 +365,7 @@ def merge_dicts(source_dict, target_dict):
     return target_dict
 
 
-class VirtualMachineForTests(VirtualMachine):
+class VirtualMachineForTests(InformerCachedInstanceMixin, VirtualMachine):
     def __init__(
         self,
         name,
@@ -465,9 +607,13 @@ class VirtualMachineForTests(VirtualMachine):
 
     def deploy(self, wait=False):
         super().deploy(wait=wait)
+        FAILURE_SNAPSHOT.track(resource=self)
         return self
 
     def clean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        FAILURE_SNAPSHOT.untrack(resource=self)
+        close_vm_ssh_session(vm=self)
+        close_vm_console_session(vm=self)
         if self.exists and self.ready:
             self.stop(wait=True, vmi_delete_timeout=TIMEOUT_8MIN)
         super().clean_up(wait=wait, timeout=timeout)
@@ -1203,7 +1349,8 @@ class VirtualMachineForTests(VirtualMachine):
         else:
             host_user = user.UserWithPKey(name=self.username, private_key=os.environ[CNV_VM_SSH_KEY_PATH])
         host.executor_user = host_user
-        host.executor_factory = ssh.RemoteExecutorFactory(
+        host.executor_factory = PooledRemoteExecutorFactory(
+            vm=self,
             sock=self.virtctl_port_forward_cmd,
         )
         return host
@@ -1219,6 +1366,10 @@ class VirtualMachineForTests(VirtualMachine):
             LOGGER.error(f"Status of {self.kind} {self.name} is {status}")
             raise
 
+    @property
+    def vmi(self) -> CachedVirtualMachineInstance:
+        return CachedVirtualMachineInstance(client=self.client, name=self.name, namespace=self.namespace)
+
     def wait_for_agent_connected(self, timeout: int = TIMEOUT_5MIN):
         self.vmi.wait_for_condition(
             condition=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED,
@@ -1476,14 +1627,18 @@ class VirtualMachineForTestsFromTemplate(VirtualMachineForTests):
             DATA_SOURCE_NAMESPACE: self.data_source.namespace if self.data_source else "mock-data-source-ns",
         }
 
-        template_object = self.template_object or get_template_by_labels(
-            admin_client=self.client, template_labels=self.template_labels
+        template_dict = (
+            self.template_object.instance.to_dict()
+            if self.template_object
+            else get_template_dict_by_labels(
+                admin_client=self.admin_client or cache_admin_client(), template_labels=self.template_labels
+            )
         )
 
         # Set password for non-Windows VMs; for Windows VM, the password is already set in the image
         if OS_FLAVOR_WINDOWS not in self.os_flavor:
             username, _ = username_password_from_cloud_init(
-                vm_volumes=template_object.instance.objects[0].spec.template.spec.volumes
+                vm_volumes=template_dict["objects"][0]["spec"]["template"]["spec"]["volumes"]
             )
 
             self.username = username
@@ -1492,10 +1647,17 @@ class VirtualMachineForTestsFromTemplate(VirtualMachineForTests):
         if self.template_params:
             template_kwargs.update(self.template_params)
 
-        # Processing a Template (server-side substitution, nothing persisted) requires "create" on
-        # processedtemplates in the template's own namespace (e.g. "openshift"), which self.client
-        # (e.g. unprivileged_client) may not have. The VM object itself is still created with self.client.
-        resources_list = template_object.process(client=self.admin_client or cache_admin_client(), **template_kwargs)
+        resources_list = process_template_locally(template=template_dict, parameters=template_kwargs)
+        if resources_list is None:
+            template_name = template_dict["metadata"]["name"]
+            LOGGER.info(f"Template {template_name} parameters must be generated, processing it on the server")
+            # Processing a Template (server-side substitution, nothing persisted) requires "create" on
+            # processedtemplates in the template's own namespace (e.g. "openshift"), which self.client
+            # (e.g. unprivileged_client) may not have. The VM object itself is still created with self.client.
+            processing_client = self.admin_client or cache_admin_client()
+            resources_list = Template(
+                client=processing_client, name=template_name, namespace=template_dict["metadata"]["namespace"]
+            ).process(client=processing_client, **template_kwargs)
         for resource in resources_list:
             if resource["kind"] == VirtualMachine.kind and resource["metadata"]["name"] == self.name:
                 return resource
@@ -1513,6 +1675,8 @@ def vm_console_run_commands(
     Run a list of commands inside VM and (if verify_commands_output) check all commands return 0.
     If return code other than 0 then it will break execution and raise exception.
 
+    Within a `utilities.console.console_sessions` scope, the logged-in console of the VM is reused between calls.
+
     Args:
         vm (obj): VirtualMachine
         commands (list): List of commands
@@ -1526,7 +1690,8 @@ def vm_console_run_commands(
     # Strip CSI (ESC[…) and OSC (ESC]…BEL/ST) terminal escape sequences
     ansi_escape = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]|\x1B\][^\x07\x1B]*(?:\x07|\x1B\\)")
     prompt = r"\$ "
-    with Console(vm=vm, prompt=prompt) as vmc:
+    registry = get_console_session_registry()
+    with registry.session(vm=vm, prompt=prompt) if registry else Console(vm=vm, prompt=prompt) as vmc:
         for command in commands:
             LOGGER.info(f"Execute {command} on {vm.name}")
             try:
@@ -1682,17 +1847,29 @@ class ServiceForVirtualMachineForTests(Service):
 
 
 def wait_for_ssh_connectivity(
-    vm: VirtualMachineForTests, timeout: int = TIMEOUT_2MIN, tcp_timeout: int = TIMEOUT_1MIN
+    vm: VirtualMachineForTests,
+    timeout: int = TIMEOUT_2MIN,
+    tcp_timeout: int = TIMEOUT_1MIN,
+    error_monitor: VMErrorMonitor | None = None,
+    aborted: threading.Event | None = None,
 ) -> None:
     LOGGER.info(f"Wait for {vm.name} SSH connectivity.")
 
+    def _ssh_exit() -> Any:
+        # Returned rather than raised, TimeoutSampler retries on the exceptions of `func`
+        if error_monitor and error_monitor.error:
+            return error_monitor.error
+        if aborted and aborted.is_set():
+            return InterruptedError(f"Wait for {vm.name} SSH connectivity aborted")
+        return vm.ssh_exec.run_command(command=["exit"], tcp_timeout=tcp_timeout)
+
     for sample in TimeoutSampler(
         wait_timeout=timeout,
         sleep=TIMEOUT_5SEC,
-        func=vm.ssh_exec.run_command,
-        command=["exit"],
-        tcp_timeout=tcp_timeout,
+        func=_ssh_exit,
     ):
+        if isinstance(sample, VMErrorStateError | InterruptedError):
+            raise sample
         if sample:
             return
 
@@ -1799,22 +1976,33 @@ def get_windows_os_dict(windows_version: str) -> dict[str, Any]:
 
 def assert_vm_not_error_status(vm: VirtualMachineForTests, timeout: int = TIMEOUT_5SEC) -> None:
     try:
-        for status in TimeoutSampler(
-            wait_timeout=timeout, sleep=TIMEOUT_1SEC, func=lambda: vm.instance.get("status", {})
-        ):
-            if status:
-                printable_status = status.get("printableStatus")
-                error_list = VM_ERROR_STATUSES.copy()
-                if vm.instance.spec.template.spec.domain.devices.gpus:
-                    error_list.remove(VirtualMachine.Status.ERROR_UNSCHEDULABLE)
-                assert printable_status not in error_list, (
-                    f"VM {vm.name} error printable status: {printable_status}\nVM status:\n{status}"
-                )
-                return
+        vm_instance = wait_for_resource_condition(
+            resource=vm,
+            condition=lambda instance: instance is not None and bool(instance.get("status")),
+            timeout=timeout,
+        )
     except TimeoutExpiredError:
         LOGGER.error(f"VM {vm.name} status did not populate within {timeout}")
         raise
 
+    status = vm_instance.status
+    printable_status = status.get("printableStatus")
+    assert printable_status not in get_vm_error_statuses(vm_instance=vm_instance), (
+        f"VM {vm.name} error printable status: {printable_status}\nVM status:\n{status}"
+    )
+
+
+def get_vm_error_statuses(vm_instance: ResourceInstance) -> list[str]:
+    """
+    Return the printableStatus values which are errors for the VM.
+
+    GPU VMs may be unschedulable until a GPU node is available.
+    """
+    error_list = VM_ERROR_STATUSES.copy()
+    if vm_instance.spec.template.spec.domain.devices.gpus:
+        error_list.remove(VirtualMachine.Status.ERROR_UNSCHEDULABLE)
+    return error_list
+
 
 def wait_for_running_vm(
     vm: VirtualMachineForTests,
@@ -1833,21 +2021,79 @@ def wait_for_running_vm(
         check_ssh_connectivity (bool): Enable SSh service in the VM.
         ssh_timeout (int): how much time to wait for SSH connectivity
 
+    The waits are aborted as soon as the VM reaches an error state (see `utilities.vm_error_monitor`).
+
     Raises:
         TimeoutExpiredError: After timeout is reached for any of the steps
+        VMErrorStateError: If the VM reached an error state during the waits
     """
     assert_vm_not_error_status(vm=vm)
+    with vm_error_monitor(vm=vm, vm_error_statuses=get_vm_error_statuses) as error_monitor:
+        try:
+            wait_for_vmi_running(vm=vm, timeout=wait_until_running_timeout)
+
+            if wait_for_interfaces:
+                error_monitor.check()
+                wait_for_vm_interfaces(vmi=vm.vmi)
+
+            if check_ssh_connectivity:
+                error_monitor.check()
+                wait_for_ssh_connectivity(vm=vm, timeout=ssh_timeout, error_monitor=error_monitor)
+        except TimeoutExpiredError:
+            collect_vnc_screenshot_for_vms(vm=vm)
+            raise
+
+
+# To support all use cases of: 'runStrategy', container/VM from template, VM started outside this function
+ALLOWED_VM_START_EXCEPTIONS = [
+    "Always does not support manual start requests",
+    "VM is already running",
+    "Internal error occurred: unable to complete request: stop/start already underway",
+]
+
+
+def _start_vm(vm: VirtualMachineForTests) -> None:
     try:
-        vm.vmi.wait_until_running(timeout=wait_until_running_timeout)
+        vm.start()
+    except ApiException as exception:
+        if any([message in exception.body for message in ALLOWED_VM_START_EXCEPTIONS]):
+            LOGGER.warning(f"VM {vm.name} is already running; will not be started.")
+        else:
+            raise
 
-        if wait_for_interfaces:
-            wait_for_vm_interfaces(vmi=vm.vmi)
 
-        if check_ssh_connectivity:
-            wait_for_ssh_connectivity(vm=vm, timeout=ssh_timeout)
-    except TimeoutExpiredError:
-        collect_vnc_screenshot_for_vms(vm=vm)
-        raise
+def _get_vm_dv_volumes_names(vm: VirtualMachineForTests) -> list[str]:
+    return [
+        volume.dataVolume.name for volume in vm.instance.spec.template.spec.volumes if "dataVolume" in volume.keys()
+    ]
+
+
+def _vm_wait_abandoned_error(vm_name: str) -> InterruptedError:
+    return InterruptedError(f"Wait for VM {vm_name} abandoned, another VM failed")
+
+
+def _wait_for_vm_dvs_success(
+    vm: VirtualMachineForTests,
+    dv_names: list[str],
+    dv_wait_timeout: int,
+    aborted: threading.Event | None = None,
+) -> None:
+    """
+    In case VM is not starting because it's DV is not ready, wait for DV to be succeeded.
+    """
+    assert_vm_not_error_status(vm=vm)
+
+    LOGGER.info(f"VM {vm.name} status before dv check: {vm.printable_status}")
+    LOGGER.info(f"Volume(s) in VM spec: {dv_names} ")
+    for dv_name in dv_names:
+        try:
+            DataVolume(name=dv_name, namespace=vm.namespace, client=vm.client).wait_for_dv_success(
+                timeout=dv_wait_timeout, stop_status_func=aborted.is_set if aborted else None
+            )
+        except TimeoutExpiredError as exception:
+            if aborted and aborted.is_set():
+                raise _vm_wait_abandoned_error(vm_name=vm.name) from exception
+            raise
 
 
 def running_vm(
@@ -1857,6 +2103,7 @@ def running_vm(
     ssh_timeout=TIMEOUT_2MIN,
     wait_for_cloud_init=False,
     dv_wait_timeout=TIMEOUT_30MIN,
+    wait_until_running_timeout=TIMEOUT_4MIN,
 ):
     """
     Wait for the VMI to be in Running state.
@@ -1868,50 +2115,20 @@ def running_vm(
         ssh_timeout (int): how much time to wait for SSH connectivity
         wait_for_cloud_init (bool): Is waiting for cloud-init required.
         dv_wait_timeout (int): dv success timeout.
+        wait_until_running_timeout (int): how much time to wait for VMI to reach Running state
 
     Returns:
         VirtualMachine: VM object.
     """
+    vm_dv_volumes_names_list = _get_vm_dv_volumes_names(vm=vm)
 
-    def _wait_for_dv_success(_vm, _vm_dv_volumes_names_list, _dv_wait_timeout):
-        """
-        In case VM is not starting because it's DV is not ready, wait for DV to be succeeded.
-        """
-        assert_vm_not_error_status(vm=vm)
-
-        LOGGER.info(f"VM {_vm.name} status before dv check: {_vm.printable_status}")
-        LOGGER.info(f"Volume(s) in VM spec: {_vm_dv_volumes_names_list} ")
-        for dv_name in _vm_dv_volumes_names_list:
-            DataVolume(name=dv_name, namespace=_vm.namespace, client=_vm.client).wait_for_dv_success(
-                timeout=_dv_wait_timeout
-            )
-
-    # To support all use cases of: 'runStrategy', container/VM from template, VM started outside this function
-    allowed_vm_start_exceptions_list = [
-        "Always does not support manual start requests",
-        "VM is already running",
-        "Internal error occurred: unable to complete request: stop/start already underway",
-    ]
-    vm_dv_volumes_names_list = [
-        volume.dataVolume.name for volume in vm.instance.spec.template.spec.volumes if "dataVolume" in volume.keys()
-    ]
-
-    try:
-        vm.start()
-    except ApiException as exception:
-        if any([message in exception.body for message in allowed_vm_start_exceptions_list]):
-            LOGGER.warning(f"VM {vm.name} is already running; will not be started.")
-        else:
-            raise
+    _start_vm(vm=vm)
 
     if vm_dv_volumes_names_list:
-        _wait_for_dv_success(
-            _vm=vm,
-            _vm_dv_volumes_names_list=vm_dv_volumes_names_list,
-            _dv_wait_timeout=dv_wait_timeout,
-        )
+        _wait_for_vm_dvs_success(vm=vm, dv_names=vm_dv_volumes_names_list, dv_wait_timeout=dv_wait_timeout)
     wait_for_running_vm(
         vm=vm,
+        wait_until_running_timeout=wait_until_running_timeout,
         wait_for_interfaces=wait_for_interfaces,
         check_ssh_connectivity=check_ssh_connectivity,
         ssh_timeout=ssh_timeout,
@@ -1921,6 +2138,162 @@ def running_vm(
     return vm
 
 
+@contextmanager
+def _timed_phase(phase_timings: dict[str, float], phase: str) -> Generator[None]:
+    start_time = time.monotonic()
+    try:
+        yield
+    finally:
+        phase_timings[phase] = round(time.monotonic() - start_time, 2)
+
+
+def _wait_for_vm_ready(
+    vm: VirtualMachineForTests,
+    phase_timings: dict[str, float],
+    dv_names: list[str],
+    wait_for_interfaces: bool,
+    check_ssh_connectivity: bool,
+    ssh_timeout: int,
+    wait_for_cloud_init: bool,
+    dv_wait_timeout: int,
+    wait_until_running_timeout: int,
+    aborted: threading.Event,
+) -> None:
+    def _check_not_aborted() -> None:
+        if aborted.is_set():
+            raise _vm_wait_abandoned_error(vm_name=vm.name)
+
+    _check_not_aborted()
+    if dv_names:
+        with _timed_phase(phase_timings=phase_timings, phase="datavolumes"):
+            _wait_for_vm_dvs_success(vm=vm, dv_names=dv_names, dv_wait_timeout=dv_wait_timeout, aborted=aborted)
+
+    _check_not_aborted()
+    assert_vm_not_error_status(vm=vm)
+    with vm_error_monitor(vm=vm, vm_error_statuses=get_vm_error_statuses) as error_monitor:
+        try:
+            with _timed_phase(phase_timings=phase_timings, phase="vmi_running"):
+                wait_for_vmi_running(vm=vm, timeout=wait_until_running_timeout)
+
+            if wait_for_interfaces:
+                _check_not_aborted()
+                error_monitor.check()
+                with _timed_phase(phase_timings=phase_timings, phase="interfaces"):
+                    wait_for_vm_interfaces(vmi=vm.vmi)
+
+            if check_ssh_connectivity:
+                _check_not_aborted()
+                error_monitor.check()
+                with _timed_phase(phase_timings=phase_timings, phase="ssh"):
+                    wait_for_ssh_connectivity(vm=vm, timeout=ssh_timeout, error_monitor=error_monitor, aborted=aborted)
+        except TimeoutExpiredError:
+            collect_vnc_screenshot_for_vms(vm=vm)
+            raise
+
+    if wait_for_cloud_init:
+        _check_not_aborted()
+        with _timed_phase(phase_timings=phase_timings, phase="cloud_init"):
+            wait_for_cloud_init_complete(vm=vm)
+
+
+def running_vms(
+    vms: list[VirtualMachineForTests],
+    wait_for_interfaces: bool = True,
+    check_ssh_connectivity: bool = True,
+    ssh_timeout: int = TIMEOUT_2MIN,
+    wait_for_cloud_init: bool = False,
+    dv_wait_timeout: int = TIMEOUT_30MIN,
+    max_workers: int = RUNNING_VMS_MAX_WORKERS,
+    wait_until_running_timeout: int = TIMEOUT_4MIN,
+) -> dict[str, dict[str, float]]:
+    """
+    Start all the VMs, then wait for them to be ready concurrently.
+
+    The readiness phases of `running_vm` (DataVolumes, VMI Running, guest agent interfaces, SSH, cloud-init) are driven
+    for up to `max_workers` VMs at a time, so the bring-up time of N VMs is close to the slowest VM boot instead of
+    the sum of all boots.
+    On the first VM failure the other waits are abandoned: the DataVolume, VMI Running, guest agent interfaces and
+    SSH waits in progress are aborted, and the other phases are not started. The waits in progress are finished
+    before an error summarizing the failed VMs and the abandoned VMs is raised, so the VMs are not torn down while
+    still waited for; a VM which became ready in the meantime is not reported.
+
+    Args:
+        vms (list): VM objects.
+        wait_for_interfaces (bool): Is waiting for VM's interfaces mandatory for declaring VM as running.
+        check_ssh_connectivity (bool): Enable SSh service in the VM.
+        ssh_timeout (int): how much time to wait for SSH connectivity
+        wait_for_cloud_init (bool): Is waiting for cloud-init required.
+        dv_wait_timeout (int): dv success timeout.
+        max_workers (int): Maximum number of VMs waited for concurrently.
+        wait_until_running_timeout (int): how much time to wait for each VMI to reach Running state
+
+    Returns:
+        dict: Duration in seconds of each readiness phase, per VM name.
+
+    Raises:
+        VMsNotRunningError: If any of the VMs failed to start or become ready.
+    """
+    phase_timings: dict[str, dict[str, float]] = {vm.name: {} for vm in vms}
+    vms_dv_names = {vm.name: _get_vm_dv_volumes_names(vm=vm) for vm in vms}
+
+    start_errors = {}
+    for vm in vms:
+        try:
+            with _timed_phase(phase_timings=phase_timings[vm.name], phase="start"):
+                _start_vm(vm=vm)
+        except Exception as exception:
+            start_errors[vm.name] = exception
+    if start_errors:
+        raise VMsNotRunningError(vm_errors=start_errors)
+
+    LOGGER.info(f"Waiting for {len(vms)} VMs to be ready, {max_workers} at a time")
+    aborted = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="running-vms")
+    futures = {
+        executor.submit(
+            _wait_for_vm_ready,
+            vm=vm,
+            phase_timings=phase_timings[vm.name],
+            dv_names=vms_dv_names[vm.name],
+            wait_for_interfaces=wait_for_interfaces,
+            check_ssh_connectivity=check_ssh_connectivity,
+            ssh_timeout=ssh_timeout,
+            wait_for_cloud_init=wait_for_cloud_init,
+            dv_wait_timeout=dv_wait_timeout,
+            wait_until_running_timeout=wait_until_running_timeout,
+            aborted=aborted,
+        ): vm
+        for vm in vms
+    }
+    _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+    executor.shutdown(wait=False, cancel_futures=True)
+    if not_done:
+        aborted.set()
+        # A VMI wait may start after an abort, so the VMI waits are aborted until all the pending VMs are done
+        while not_done:
+            for future in not_done:
+                abort_resource_waits(
+                    resource=futures[future].vmi, error=_vm_wait_abandoned_error(vm_name=futures[future].name)
+                )
+            _, not_done = wait(not_done, timeout=TIMEOUT_1SEC)
+
+    for vm_name, vm_phase_timings in phase_timings.items():
+        LOGGER.info(f"VM {vm_name} phase timings (seconds): {vm_phase_timings}")
+
+    vm_errors: dict[str, BaseException] = {}
+    abandoned_vms: list[str] = []
+    for future, vm in futures.items():
+        exception = None if future.cancelled() else future.exception()
+        if future.cancelled() or isinstance(exception, InterruptedError):
+            abandoned_vms.append(vm.name)
+        elif exception:
+            vm_errors[vm.name] = exception
+    if vm_errors:
+        raise VMsNotRunningError(vm_errors=vm_errors, pending_vms=sorted(abandoned_vms))
+
+    return phase_timings
+
+
 def wait_for_cloud_init_complete(vm, timeout=TIMEOUT_4MIN):
     cloud_init_status = "cloud-init status"
     for sample in TimeoutSampler(
@@ -2335,41 +2708,54 @@ def get_base_templates_list(client: DynamicClient) -> list[Template]:
     Returns:
         list[Template]: List of base templates.
     """
-    common_templates_list = list(
-        Template.get(
-            client=client,
-            singular_name=Template.singular_name,
-            label_selector=f"{Template.Labels.BASE},{Template.Labels.ARCHITECTURE}={py_config['cpu_arch']}",
-        )
-    )
+    templates_catalog = get_resource_catalog(client=client, resource_class=Template)
     return [
-        template
-        for template in common_templates_list
-        if not template.instance.metadata.annotations.get(template.Annotations.DEPRECATED)
+        templates_catalog.resource(instance=template_instance)
+        for template_instance in templates_catalog.list(
+            label_selector=[Template.Labels.BASE, f"{Template.Labels.ARCHITECTURE}={py_config['cpu_arch']}"]
+        )
+        if not (template_instance.metadata.annotations or {}).get(Template.Annotations.DEPRECATED)
     ]
 
 
-def get_template_by_labels(admin_client, template_labels):
+def _get_template_instance_by_labels(admin_client: DynamicClient, template_labels: list[str]) -> ResourceInstance:
     selector_labels = [label for label in template_labels if OS_FLAVOR_FEDORA not in label]
     if cpu_arch := py_config.get("cpu_arch"):
         selector_labels.append(f"{Template.Labels.ARCHITECTURE}={cpu_arch}")
-    template = list(
-        Template.get(
-            client=admin_client,
-            singular_name=Template.singular_name,
-            namespace="openshift",
-            label_selector=",".join(selector_labels),
-        ),
+    templates = get_resource_catalog(client=admin_client, resource_class=Template).list(
+        label_selector=selector_labels, namespace="openshift"
     )
     if any(
         f"{Template.ApiGroup.OS_TEMPLATE_KUBEVIRT_IO}/{OS_FLAVOR_FEDORA}" in template_label
         for template_label in template_labels
     ):
-        template = [fedora_template for fedora_template in template if OS_FLAVOR_FEDORA in fedora_template.name]
-    matched_templates = len(template)
+        templates = [
+            fedora_template for fedora_template in templates if OS_FLAVOR_FEDORA in fedora_template.metadata.name
+        ]
+    matched_templates = len(templates)
     assert matched_templates == 1, f"{matched_templates} templates found which match {template_labels} labels"
 
-    return template[0]
+    return templates[0]
+
+
+def get_template_by_labels(admin_client, template_labels):
+    return get_resource_catalog(client=admin_client, resource_class=Template).resource(
+        instance=_get_template_instance_by_labels(admin_client=admin_client, template_labels=template_labels)
+    )
+
+
+def get_template_dict_by_labels(admin_client: DynamicClient, template_labels: list[str]) -> dict[str, Any]:
+    """
+    Return the template matching the labels, from the session templates catalog.
+
+    Args:
+        admin_client (DynamicClient): Client allowed to list/watch the templates in all namespaces.
+        template_labels (list): Template labels, as passed to `get_template_by_labels`.
+
+    Returns:
+        dict: The template.
+    """
+    return _get_template_instance_by_labels(admin_client=admin_client, template_labels=template_labels).to_dict()
 
 
 def wait_for_updated_kv_value(admin_client, hco_namespace, path, value, timeout=15):
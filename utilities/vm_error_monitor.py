@@ -0,0 +1,216 @@
+"""
+Fast-fail of the waits on a VM that reached an error state.
+
+While a VM is waited for, `VMErrorMonitor` follows the VM, its VMI, its virt-launcher pods and their Events on the
+shared watch streams of `utilities.watcher`. When the VM reaches an error state it does not recover from by itself
+(an error printableStatus, a failed VMI that is not restarted, a launcher pod that cannot pull its image or keeps
+crashing), the pending waits on the VMI and the monitor `check` raise `VMErrorStateError` with the recent Warning
+events of the VM, instead of waiting for their timeouts.
+
+Example:
+    with vm_error_monitor(vm=vm, vm_error_statuses=lambda vm_instance: VM_ERROR_STATUSES) as error_monitor:
+        wait_for_vmi_running(vm=vm, timeout=TIMEOUT_4MIN)
+        error_monitor.check()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from ocp_resources.event import Event
+from ocp_resources.pod import Pod
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+from utilities.cluster import get_resource_class_api_version
+from utilities.exceptions import VMErrorStateError
+from utilities.failure_snapshot import VIRT_LAUNCHER_LABEL_SELECTOR, VM_NAME_LABEL
+from utilities.watcher import ResourceEventListener, ResourceWatchStream, get_watch_stream
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from kubernetes.dynamic.resource import ResourceInstance
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+# Container waiting reasons of a virt-launcher pod which do not resolve without a change of the VM
+LAUNCHER_POD_ERROR_REASONS = (
+    VirtualMachine.Status.CRASH_LOOPBACK_OFF,
+    VirtualMachine.Status.IMAGE_PULL_BACK_OFF,
+    VirtualMachine.Status.ERR_IMAGE_PULL,
+)
+# A failed VMI of a VM with these run strategies is replaced by a new VMI
+RESTARTING_RUN_STRATEGIES = (VirtualMachine.RunStrategy.ALWAYS, VirtualMachine.RunStrategy.RERUNONFAILURE)
+WARNING_EVENTS_HISTORY_SIZE = 10
+VIRT_LAUNCHER_LABEL_KEY, VIRT_LAUNCHER_LABEL_VALUE = VIRT_LAUNCHER_LABEL_SELECTOR.split("=")
+
+VMErrorStatuses = Callable[["ResourceInstance"], list[str]]
+
+
+def _run_strategy(vm_instance: ResourceInstance) -> str | None:
+    spec = vm_instance.get("spec") or {}
+    if run_strategy := spec.get("runStrategy"):
+        return run_strategy
+    # VMs created with the deprecated `running` field
+    return VirtualMachine.RunStrategy.ALWAYS if spec.get("running") else None
+
+
+def _launcher_pod_error(pod_instance: ResourceInstance) -> str | None:
+    # A failed pod is reported by its VMI, which is replaced depending on the VM run strategy
+    status = pod_instance.get("status") or {}
+    for container_status in (status.get("initContainerStatuses") or []) + (status.get("containerStatuses") or []):
+        waiting = (container_status.get("state") or {}).get("waiting") or {}
+        if waiting.get("reason") in LAUNCHER_POD_ERROR_REASONS:
+            return (
+                f"virt-launcher pod {pod_instance.metadata.name} container {container_status.get('name')} is "
+                f"{waiting['reason']}: {waiting.get('message')}"
+            )
+    return None
+
+
+class VMErrorMonitor:
+    """
+    Follow a VM and abort the waits on its VMI once it reaches an error state.
+
+    Args:
+        client (DynamicClient): Client used to watch the VM namespace.
+        vm_name (str): VM name.
+        namespace (str): VM namespace.
+        vm_error_statuses (Callable): Called with the VM instance, returns the printableStatus values which are
+            errors for this VM.
+    """
+
+    def __init__(self, client: DynamicClient, vm_name: str, namespace: str, vm_error_statuses: VMErrorStatuses) -> None:
+        self.client = client
+        self.vm_name = vm_name
+        self.namespace = namespace
+        self.vm_error_statuses = vm_error_statuses
+        self.error: VMErrorStateError | None = None
+        self._run_strategy: str | None = None
+        self._launcher_pods: set[str] = set()
+        self._warning_events: deque[str] = deque(maxlen=WARNING_EVENTS_HISTORY_SIZE)
+        self._lock = threading.Lock()
+        self._streams: dict[str, ResourceWatchStream] = {}
+        self._listeners: list[tuple[ResourceWatchStream, ResourceEventListener]] = []
+
+    def __repr__(self) -> str:
+        return f"VM {self.namespace}/{self.vm_name} error monitor"
+
+    def start(self) -> None:
+        """
+        Start following the VM.
+        """
+        listeners: dict[type[Resource], ResourceEventListener] = {
+            VirtualMachine: self._on_vm,
+            VirtualMachineInstance: self._on_vmi,
+            Pod: self._on_pod,
+            Event: self._on_event,
+        }
+        for resource_class, listener in listeners.items():
+            stream = get_watch_stream(
+                client=self.client,
+                api_version=get_resource_class_api_version(client=self.client, resource_class=resource_class),
+                kind=resource_class.kind,
+                namespace=self.namespace,
+            )
+            self._streams[resource_class.kind] = stream
+            self._listeners.append((stream, listener))
+            stream.add_listener(listener=listener)
+
+    def stop(self) -> None:
+        for stream, listener in self._listeners:
+            stream.remove_listener(listener=listener)
+        self._listeners.clear()
+
+    def check(self) -> None:
+        """
+        Raise the error of the VM, if it reached an error state.
+
+        Raises:
+            VMErrorStateError: If the VM reached an error state.
+        """
+        if self.error:
+            raise self.error
+
+    def _fail(self, error: str) -> None:
+        with self._lock:
+            if self.error:
+                return
+            self.error = VMErrorStateError(vm_name=self.vm_name, error=error, warning_events=list(self._warning_events))
+        LOGGER.error(f"{self}: {error}")
+        self._streams[VirtualMachineInstance.kind].abort_waits(name=self.vm_name, error=self.error)
+
+    def _on_vm(self, event_type: str, vm_instance: ResourceInstance) -> None:
+        if vm_instance.metadata.name != self.vm_name or event_type == "DELETED":
+            return
+
+        self._run_strategy = _run_strategy(vm_instance=vm_instance)
+        printable_status = (vm_instance.get("status") or {}).get("printableStatus")
+        if printable_status in self.vm_error_statuses(vm_instance):
+            self._fail(error=f"printable status {printable_status}")
+
+    def _on_vmi(self, event_type: str, vmi_instance: ResourceInstance) -> None:
+        if vmi_instance.metadata.name != self.vm_name or event_type == "DELETED":
+            return
+
+        status = vmi_instance.get("status") or {}
+        # The run strategy is unknown until the VM is seen
+        restarted = self._run_strategy is None or self._run_strategy in RESTARTING_RUN_STRATEGIES
+        if status.get("phase") == VirtualMachineInstance.Status.FAILED and not restarted:
+            self._fail(error=f"VMI failed with run strategy {self._run_strategy}: {status.get('reason')}")
+
+    def _on_pod(self, event_type: str, pod_instance: ResourceInstance) -> None:
+        labels = pod_instance.metadata.get("labels") or {}
+        if (
+            labels.get(VM_NAME_LABEL) != self.vm_name
+            or labels.get(VIRT_LAUNCHER_LABEL_KEY) != VIRT_LAUNCHER_LABEL_VALUE
+        ):
+            return
+
+        with self._lock:
+            self._launcher_pods.add(pod_instance.metadata.name)
+        if (
+            event_type != "DELETED"
+            and not pod_instance.metadata.get("deletionTimestamp")
+            and (pod_error := _launcher_pod_error(pod_instance=pod_instance))
+        ):
+            self._fail(error=pod_error)
+
+    def _on_event(self, event_type: str, event_instance: ResourceInstance) -> None:
+        if event_type == "DELETED" or event_instance.get("type") != "Warning":
+            return
+
+        involved_object = event_instance.get("involvedObject") or {}
+        with self._lock:
+            if involved_object.get("name") == self.vm_name or involved_object.get("name") in self._launcher_pods:
+                self._warning_events.append(
+                    f"{involved_object.get('kind')}/{involved_object.get('name')} {event_instance.get('reason')}: "
+                    f"{event_instance.get('message')}"
+                )
+
+
+@contextmanager
+def vm_error_monitor(vm: VirtualMachine, vm_error_statuses: VMErrorStatuses) -> Generator[VMErrorMonitor]:
+    """
+    Monitor `vm` for error states until the end of the context.
+
+    If the VM namespace cannot be watched, the monitor never raises and the waits keep their timeouts.
+    """
+    error_monitor = VMErrorMonitor(
+        client=vm.client, vm_name=vm.name, namespace=vm.namespace, vm_error_statuses=vm_error_statuses
+    )
+    try:
+        error_monitor.start()
+    except Exception as exception:
+        LOGGER.warning(f"{error_monitor} not started: {exception}")
+
+    try:
+        yield error_monitor
+    finally:
+        error_monitor.stop()
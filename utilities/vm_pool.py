@@ -0,0 +1,195 @@
+"""
+Pool of pre-booted VMs leased to tests.
+
+Tests that only need "a running VM with SSH" lease one from a `VMPool` instead of booting their own: the pool boots
+its VMs in the background at session start, and boots or resets them again in the background when they are returned,
+so the boot time is off the critical path of the tests.
+
+A returned VM is restarted before its next lease. Pool VMs boot from container disks, so a restart also discards the
+changes made in the guest. A VM is deleted and replaced instead when:
+- the test failed,
+- the test called `mark_dirty`,
+- the VM spec was changed during the lease (its generation changed).
+
+Example:
+    with fedora_vm_pool.lease() as vm:
+        run_ssh_commands(host=vm.ssh_exec, commands=["true"])
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.console import close_vm_console_session
+from utilities.constants.timeouts import TIMEOUT_10MIN
+from utilities.ssh_pool import close_vm_ssh_session
+from utilities.virt import restart_vm_wait_for_running_vm, running_vm
+
+if TYPE_CHECKING:
+    from utilities.virt import VirtualMachineForTests
+
+LOGGER = logging.getLogger(__name__)
+
+VMFactory = Callable[[str], "VirtualMachineForTests"]
+
+
+class VMPool:
+    """
+    VMs of one spec, booted in the background and leased to tests.
+
+    Args:
+        name (str): Pool name, used as the prefix of the VM names.
+        size (int): Number of VMs kept booted. With 0, every lease boots a VM and deletes it when it is returned.
+        vm_factory (Callable): Called with a VM name, returns the VM object to deploy.
+        lease_timeout (int): Maximum time to wait for a booted VM.
+    """
+
+    def __init__(self, name: str, size: int, vm_factory: VMFactory, lease_timeout: int = TIMEOUT_10MIN) -> None:
+        self.name = name
+        self.size = size
+        self.vm_factory = vm_factory
+        self.lease_timeout = lease_timeout
+        # Booted VMs, or the errors of the boots which failed
+        self._ready: queue.Queue[VirtualMachineForTests | Exception] = queue.Queue()
+        self._vms: dict[str, VirtualMachineForTests] = {}
+        self._dirty_vms: set[str] = set()
+        self._vm_index = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max(size, 1), thread_name_prefix=f"vm-pool-{name}")
+
+    def __repr__(self) -> str:
+        return f"VM pool {self.name}"
+
+    def start(self) -> None:
+        """
+        Start booting the pool VMs in the background.
+        """
+        LOGGER.info(f"{self}: booting {self.size} VMs")
+        for _ in range(self.size):
+            self._executor.submit(self._boot)
+
+    def close(self) -> None:
+        """
+        Wait for the background boots and resets, then delete all the pool VMs.
+        """
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for vm in list(self._vms.values()):
+            self._delete(vm=vm)
+
+    def mark_dirty(self, vm: VirtualMachineForTests) -> None:
+        """
+        Delete the leased VM when it is returned, instead of resetting it for the next lease.
+        """
+        with self._lock:
+            self._dirty_vms.add(vm.name)
+
+    @contextmanager
+    def lease(self) -> Generator[VirtualMachineForTests]:
+        """
+        Lease a running VM until the end of the context.
+
+        Raises:
+            TimeoutExpiredError: If no VM is booted within the lease timeout.
+        """
+        vm = self._acquire()
+        leased_generation = vm.instance.metadata.generation
+        test_failed = True
+        try:
+            yield vm
+            test_failed = False
+        finally:
+            self._release(vm=vm, discard=self._is_dirty(vm=vm, leased_generation=leased_generation) or test_failed)
+
+    def _acquire(self) -> VirtualMachineForTests:
+        if not self.size:
+            return self._boot_vm()
+
+        LOGGER.info(f"{self}: waiting for a booted VM")
+        try:
+            vm_or_error = self._ready.get(timeout=self.lease_timeout)
+        except queue.Empty:
+            raise TimeoutExpiredError(f"{self}: no VM booted within {self.lease_timeout}s") from None
+
+        if isinstance(vm_or_error, Exception):
+            self._executor.submit(self._boot)
+            raise vm_or_error
+        LOGGER.info(f"{self}: leasing VM {vm_or_error.name}")
+        return vm_or_error
+
+    def _release(self, vm: VirtualMachineForTests, discard: bool) -> None:
+        if not self.size:
+            self._delete(vm=vm)
+        elif discard:
+            LOGGER.info(f"{self}: replacing VM {vm.name}")
+            self._executor.submit(self._replace, vm)
+        else:
+            LOGGER.info(f"{self}: resetting VM {vm.name}")
+            self._executor.submit(self._reset, vm)
+
+    def _is_dirty(self, vm: VirtualMachineForTests, leased_generation: int) -> bool:
+        with self._lock:
+            if vm.name in self._dirty_vms:
+                self._dirty_vms.discard(vm.name)
+                return True
+        try:
+            return vm.instance.metadata.generation != leased_generation
+        except Exception as exception:
+            LOGGER.warning(f"{self}: VM {vm.name} state not read: {exception}")
+            return True
+
+    def _boot_vm(self) -> VirtualMachineForTests:
+        vm = self.vm_factory(f"{self.name}-{next(self._vm_index)}")
+        with self._lock:
+            self._vms[vm.name] = vm
+        try:
+            vm.deploy()
+            running_vm(vm=vm)
+        except Exception:
+            self._delete(vm=vm)
+            raise
+        return vm
+
+    def _boot(self) -> None:
+        if self._closed:
+            return
+        try:
+            self._ready.put(self._boot_vm())
+        except Exception as exception:
+            # The error is raised by the next lease, which also starts a new boot
+            LOGGER.error(f"{self}: VM boot failed: {exception}")
+            self._ready.put(exception)
+
+    def _reset(self, vm: VirtualMachineForTests) -> None:
+        try:
+            # The SSH and console sessions of the guest do not survive the restart
+            close_vm_ssh_session(vm=vm)
+            close_vm_console_session(vm=vm)
+            restart_vm_wait_for_running_vm(vm=vm)
+        except Exception as exception:
+            LOGGER.warning(f"{self}: VM {vm.name} reset failed, replacing it: {exception}")
+            self._replace(vm=vm)
+            return
+        self._ready.put(vm)
+
+    def _replace(self, vm: VirtualMachineForTests) -> None:
+        self._delete(vm=vm)
+        self._boot()
+
+    def _delete(self, vm: VirtualMachineForTests) -> None:
+        with self._lock:
+            self._vms.pop(vm.name, None)
+        try:
+            vm.clean_up()
+        except Exception as exception:
+            LOGGER.warning(f"{self}: VM {vm.name} not deleted: {exception}")
@@ -0,0 +1,396 @@
+"""
+Shared watch streams for waiting on cluster resources.
+
+A single list+watch stream is opened per client, kind and namespace; every pending wait on a resource of that kind
+in that namespace is evaluated against each event of the stream.
+A condition is therefore detected as soon as the resource changes instead of at the next polling interval,
+and many concurrent waits cost one API stream instead of a GET per wait per interval.
+
+Example:
+    from utilities.watcher import wait_for_resource_condition
+
+    wait_for_resource_condition(
+        resource=vm.vmi,
+        condition=lambda instance: instance is not None and instance.status.phase == "Running",
+        timeout=TIMEOUT_4MIN,
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from kubernetes import watch
+from kubernetes.client import ApiException
+from kubernetes.dynamic.resource import ResourceInstance
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.constants.timeouts import TIMEOUT_1SEC, TIMEOUT_5MIN
+
+if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+    from ocp_resources.resource import Resource
+
+LOGGER = logging.getLogger(__name__)
+
+# Server side timeout of a single watch request; the stream is re-opened from the last seen resourceVersion.
+WATCH_REQUEST_TIMEOUT = TIMEOUT_5MIN
+RESOURCE_VERSION_EXPIRED_STATUS = 410
+ACCESS_DENIED_STATUSES = (401, 403)
+
+ResourceCondition = Callable[[ResourceInstance | None], bool]
+# Called with the event type (ADDED, MODIFIED or DELETED) and the object of every change seen by the stream
+ResourceEventListener = Callable[[str, ResourceInstance], None]
+
+
+@dataclass
+class _PendingWait:
+    name: str
+    condition: ResourceCondition
+    done: threading.Event = field(default_factory=threading.Event)
+    result: ResourceInstance | None = None
+    error: BaseException | None = None
+
+
+class ResourceWatchStream:
+    """
+    List+watch stream of a single kind in a single namespace, shared by all the waits on that kind.
+
+    The stream thread is started by the first pending wait or listener and exits once no waits or listeners are
+    pending, unless the stream is kept running as an informer (see `start_informer`).
+    The last seen state of every object in the namespace is kept so that a new wait is evaluated immediately,
+    without an extra GET.
+    A stream with no namespace follows the kind in all namespaces; its objects are named `<namespace>/<name>`.
+    A stream the client may not list or watch stops: its pending waits and `wait_for_sync` raise the error, and its
+    listeners and informer are dropped until a new wait, listener or informer starts it again.
+    """
+
+    def __init__(self, client: DynamicClient, api_version: str, kind: str, namespace: str | None) -> None:
+        self.client = client
+        self.api_version = api_version
+        self.kind = kind
+        self.namespace = namespace
+        self._resource_api = client.resources.get(api_version=api_version, kind=kind)
+        self._lock = threading.Lock()
+        self._objects: dict[str, ResourceInstance] = {}
+        self._pending_waits: list[_PendingWait] = []
+        self._listeners: list[ResourceEventListener] = []
+        self._resource_version: str | None = None
+        self._synced = False
+        self._sync_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watcher: watch.Watch | None = None
+        self._informer = False
+        # Access error which stopped the stream
+        self._error: ApiException | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.kind} watch stream in namespace {self.namespace}"
+
+    def wait_for(self, name: str, condition: ResourceCondition, timeout: int) -> ResourceInstance | None:
+        """
+        Wait until `condition` is met for the object `name`.
+
+        Args:
+            name (str): Object name.
+            condition (Callable): Called with the object (ResourceInstance) or None if the object does not exist.
+                Returns True when the wait is done; an exception raised by the condition aborts the wait.
+            timeout (int): Maximum time to wait in seconds.
+
+        Returns:
+            ResourceInstance | None: The object state that satisfied the condition.
+
+        Raises:
+            TimeoutExpiredError: If the condition is not met within timeout.
+        """
+        pending_wait = _PendingWait(name=name, condition=condition)
+        with self._lock:
+            self._pending_waits.append(pending_wait)
+            if self._synced:
+                self._evaluate(pending_wait=pending_wait, instance=self._objects.get(name))
+            self._start()
+
+        try:
+            if not pending_wait.done.wait(timeout=timeout):
+                raise TimeoutExpiredError(
+                    f"Timed out after {timeout}s waiting for {self.kind} {self.namespace}/{name} condition; "
+                    f"last seen object: {self.get(name=name)}"
+                )
+        finally:
+            with self._lock:
+                if pending_wait in self._pending_waits:
+                    self._pending_waits.remove(pending_wait)
+                self._stop_if_idle()
+
+        if pending_wait.error:
+            raise pending_wait.error
+        return pending_wait.result
+
+    def get(self, name: str) -> ResourceInstance | None:
+        """
+        Return the last seen state of the object `name` or None if it does not exist or the stream is not synced.
+        """
+        with self._lock:
+            return self._objects.get(name) if self._synced else None
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def wait_for_sync(self, timeout: int) -> None:
+        """
+        Wait until the stream listed the objects and passed them to the listeners.
+
+        Raises:
+            TimeoutExpiredError: If the stream is not synced within timeout.
+            ApiException: If the client is not allowed to list or watch the objects.
+        """
+        if self._error is None and not self._sync_event.wait(timeout=timeout):
+            raise TimeoutExpiredError(f"Timed out after {timeout}s waiting for {self} to list the objects")
+        if self._error is not None:
+            raise self._error
+
+    def _object_name(self, instance: ResourceInstance) -> str:
+        if self.namespace or not instance.metadata.namespace:
+            return instance.metadata.name
+        return f"{instance.metadata.namespace}/{instance.metadata.name}"
+
+    def start_informer(self) -> None:
+        """
+        Keep the stream running (and its objects current) even when no waits are pending.
+        """
+        with self._lock:
+            self._informer = True
+            self._start()
+
+    def stop_informer(self) -> None:
+        """
+        Let the stream exit once no waits are pending.
+        """
+        with self._lock:
+            self._informer = False
+            self._stop_if_idle()
+
+    def add_listener(self, listener: ResourceEventListener) -> None:
+        """
+        Call `listener` on every change of the objects in the namespace until it is removed.
+
+        The objects already seen by a synced stream are passed as ADDED; objects changed while the stream was
+        interrupted are passed as ADDED, MODIFIED or DELETED once it re-lists.
+        Listeners are called from the stream thread and must not block.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            current_objects = list(self._objects.values()) if self._synced else []
+            self._start()
+
+        for instance in current_objects:
+            self._notify(listeners=[listener], event_type="ADDED", instance=instance)
+
+    def remove_listener(self, listener: ResourceEventListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            self._stop_if_idle()
+
+    def _should_run(self) -> bool:
+        return self._informer or bool(self._pending_waits) or bool(self._listeners)
+
+    def _stop_if_idle(self) -> None:
+        if not self._should_run() and self._watcher:
+            self._watcher.stop()
+
+    def _start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.kind}-{self.namespace}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._should_run():
+                    self._synced = False
+                    self._sync_event.clear()
+                    self._objects.clear()
+                    self._thread = None
+                    return
+
+            try:
+                if not self._synced:
+                    self._list()
+                self._watch()
+            except ApiException as exception:
+                if exception.status == RESOURCE_VERSION_EXPIRED_STATUS:
+                    LOGGER.info(f"{self}: resourceVersion {self._resource_version} expired, re-listing")
+                elif exception.status in ACCESS_DENIED_STATUSES:
+                    # Retrying would re-list in a tight loop; the stream exits at the next iteration
+                    self._stop_on_access_error(error=exception)
+                else:
+                    LOGGER.warning(f"{self}: stream interrupted: {exception}")
+                    time.sleep(TIMEOUT_1SEC)
+                self._invalidate()
+            except Exception as exception:
+                LOGGER.warning(f"{self}: stream interrupted: {exception}")
+                time.sleep(TIMEOUT_1SEC)
+                self._invalidate()
+
+    def _invalidate(self) -> None:
+        with self._lock:
+            self._synced = False
+            self._sync_event.clear()
+
+    def _list(self) -> None:
+        listing = self._resource_api.get(namespace=self.namespace).to_dict()
+        instances = [ResourceInstance(client=self._resource_api, instance=item) for item in listing.get("items") or []]
+        objects = {self._object_name(instance=instance): instance for instance in instances}
+        with self._lock:
+            changes = [
+                ("MODIFIED" if name in self._objects else "ADDED", instance)
+                for name, instance in objects.items()
+                if name not in self._objects
+                or self._objects[name].metadata.resourceVersion != instance.metadata.resourceVersion
+            ] + [("DELETED", instance) for name, instance in self._objects.items() if name not in objects]
+            self._objects = objects
+            self._resource_version = listing["metadata"]["resourceVersion"]
+            self._synced = True
+            self._error = None
+            for pending_wait in list(self._pending_waits):
+                self._evaluate(pending_wait=pending_wait, instance=self._objects.get(pending_wait.name))
+            listeners = list(self._listeners)
+
+        for event_type, instance in changes:
+            self._notify(listeners=listeners, event_type=event_type, instance=instance)
+        self._sync_event.set()
+
+    def _watch(self) -> None:
+        self._watcher = watch.Watch()
+        for event in self.client.watch(
+            resource=self._resource_api,
+            namespace=self.namespace,
+            resource_version=self._resource_version,
+            timeout=WATCH_REQUEST_TIMEOUT,
+            watcher=self._watcher,
+            allow_watch_bookmarks=True,
+        ):
+            self._handle_event(event_type=event["type"], instance=event["object"])
+
+    def _handle_event(self, event_type: str, instance: ResourceInstance) -> None:
+        with self._lock:
+            self._resource_version = instance.metadata.resourceVersion
+            if event_type == "BOOKMARK":
+                return
+
+            name = self._object_name(instance=instance)
+            if event_type == "DELETED":
+                self._objects.pop(name, None)
+            else:
+                self._objects[name] = instance
+
+            for pending_wait in [_wait for _wait in self._pending_waits if _wait.name == name]:
+                self._evaluate(pending_wait=pending_wait, instance=self._objects.get(name))
+            listeners = list(self._listeners)
+
+        self._notify(listeners=listeners, event_type=event_type, instance=instance)
+
+    def _notify(self, listeners: list[ResourceEventListener], event_type: str, instance: ResourceInstance) -> None:
+        for listener in listeners:
+            try:
+                listener(event_type, instance)
+            except Exception as exception:
+                LOGGER.warning(f"{self}: listener {listener} failed: {exception}")
+
+    def _evaluate(self, pending_wait: _PendingWait, instance: ResourceInstance | None) -> None:
+        if pending_wait.done.is_set():
+            return
+        try:
+            if pending_wait.condition(instance):
+                pending_wait.result = instance
+                pending_wait.done.set()
+        except Exception as error:
+            pending_wait.error = error
+            pending_wait.done.set()
+
+    def abort_waits(self, name: str, error: BaseException) -> None:
+        """
+        Abort the pending waits on the object `name`; they raise `error`.
+        """
+        with self._lock:
+            for pending_wait in [_wait for _wait in self._pending_waits if _wait.name == name]:
+                if not pending_wait.done.is_set():
+                    pending_wait.error = error
+                    pending_wait.done.set()
+
+    def _stop_on_access_error(self, error: ApiException) -> None:
+        with self._lock:
+            LOGGER.error(
+                f"{self}: cannot list/watch, stopping the stream and dropping {len(self._listeners)} listeners "
+                f"and the informer: {error}"
+            )
+            for pending_wait in self._pending_waits:
+                pending_wait.error = error
+                pending_wait.done.set()
+            self._pending_waits.clear()
+            self._listeners.clear()
+            self._informer = False
+            self._error = error
+        # Wakes up `wait_for_sync`, which raises the error
+        self._sync_event.set()
+
+
+_STREAMS: dict[tuple[int, str, str, str | None], ResourceWatchStream] = {}
+_STREAMS_LOCK = threading.Lock()
+
+
+def get_watch_stream(client: DynamicClient, api_version: str, kind: str, namespace: str | None) -> ResourceWatchStream:
+    """
+    Return the shared watch stream for the client, kind and namespace, creating it on first use.
+    """
+    key = (id(client), api_version, kind, namespace)
+    with _STREAMS_LOCK:
+        if key not in _STREAMS:
+            _STREAMS[key] = ResourceWatchStream(client=client, api_version=api_version, kind=kind, namespace=namespace)
+        return _STREAMS[key]
+
+
+def abort_resource_waits(resource: Resource, error: BaseException) -> None:
+    """
+    Abort the pending waits on `resource` in its shared watch stream; they raise `error`.
+    """
+    get_watch_stream(
+        client=resource.client,
+        api_version=resource.api_version,
+        kind=resource.kind,
+        namespace=resource.namespace,
+    ).abort_waits(name=resource.name, error=error)
+
+
+def wait_for_resource_condition(
+    resource: Resource, condition: ResourceCondition, timeout: int
+) -> ResourceInstance | None:
+    """
+    Wait until `condition` is met for `resource`, using the shared watch stream of its kind and namespace.
+
+    Args:
+        resource (Resource): Resource to wait on; it does not have to exist yet.
+        condition (Callable): Called with the resource instance or None if it does not exist.
+        timeout (int): Maximum time to wait in seconds.
+
+    Returns:
+        ResourceInstance | None: The resource instance which satisfied the condition.
+
+    Raises:
+        TimeoutExpiredError: If the condition is not met within timeout.
+    """
+    return get_watch_stream(
+        client=resource.client,
+        api_version=resource.api_version,
+        kind=resource.kind,
+        namespace=resource.namespace,
+    ).wait_for(name=resource.name, condition=condition, timeout=timeout)